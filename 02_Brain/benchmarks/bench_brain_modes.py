@@ -0,0 +1,220 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+FlashEASuite V2 - Benchmark: Threaded vs Reactor vs Asyncio Mode
+Tick-to-analysis latency and throughput over real ZMQ TCP sockets
+
+A fake Feeder PUB socket connects to the Brain's SUB port and sends
+7-field tick frames. Latency is measured from the Feeder's send to the
+moment the engine analyzes the tick (same process, perf_counter_ns).
+
+Usage (from 02_Brain/):
+    python -m benchmarks.bench_brain_modes [--ticks 20000] [--rate 5000]
+"""
+
+import argparse
+import asyncio
+import contextlib
+import io
+import queue
+import threading
+import time
+
+import msgpack
+import numpy as np
+import zmq
+
+from core.async_brain import AsyncBrain
+from core.execution_listener import create_execution_listener_threaded
+from core.ingestion import create_ingestion_worker_threaded
+from core.mailbox import ConflatingMailbox
+from core.reactor import BrainReactor
+from core.strategy.engine import StrategyEngineThreaded
+from core.tick_store import TickStore
+
+SYMBOLS = ["EURUSD", "GBPUSD", "USDJPY", "XAUUSD"]
+SUB_ADDRESS = "tcp://127.0.0.1:27777"
+PUB_ADDRESS = "tcp://127.0.0.1:27778"
+PULL_ADDRESS = "tcp://127.0.0.1:27779"
+
+
+class _Probe:
+    """Send timestamps per SEQ_ID and the latencies observed at analysis."""
+
+    def __init__(self, ticks: int):
+        self.send_ns = np.zeros(ticks + 1, dtype=np.int64)
+        self.latency_ns = np.zeros(ticks + 1, dtype=np.int64)
+        self.analyzed = 0
+
+    def record(self, seq: int) -> None:
+        self.latency_ns[self.analyzed] = time.perf_counter_ns() - self.send_ns[seq]
+        self.analyzed += 1
+
+
+def _probed(cls):
+    """Subclass an engine so every analyzed tick records its latency."""
+
+    class Probed(cls):
+        probe = None
+
+        def _process_tick(self, tick_data, count=1):
+            super()._process_tick(tick_data, count)
+            self.probe.record(tick_data.seq)
+
+    return Probed
+
+
+def _start_threaded(shutdown_event, probe):
+    tick_store = TickStore()
+    mailbox = ConflatingMailbox()
+    feedback_queue = queue.Queue()
+
+    engine_cls = _probed(StrategyEngineThreaded)
+    engine_cls.probe = probe
+
+    workers = [
+        create_ingestion_worker_threaded(mailbox, shutdown_event, SUB_ADDRESS, tick_store),
+        engine_cls(mailbox, queue.Queue(), feedback_queue, shutdown_event,
+                   PUB_ADDRESS, tick_store),
+        create_execution_listener_threaded(feedback_queue, shutdown_event, PULL_ADDRESS),
+    ]
+    for worker in workers:
+        worker.start()
+    return workers, workers[0].decoder
+
+
+def _start_reactor(shutdown_event, probe):
+    reactor_cls = _probed(BrainReactor)
+    reactor_cls.probe = probe
+
+    reactor = reactor_cls(shutdown_event, SUB_ADDRESS, PUB_ADDRESS, PULL_ADDRESS)
+    reactor.start()
+    return [reactor], reactor.decoder
+
+
+class _AsyncRunner(threading.Thread):
+    """Run an AsyncBrain on its own event loop; shutdown cancels its task."""
+
+    def __init__(self, brain, shutdown_event):
+        super().__init__(name="AsyncBrain")
+        self.brain = brain
+        self.shutdown_event = shutdown_event
+
+    async def _main(self):
+        task = asyncio.create_task(self.brain.run())
+        await asyncio.get_running_loop().run_in_executor(None, self.shutdown_event.wait)
+        task.cancel()
+        await asyncio.gather(task, return_exceptions=True)
+
+    def run(self):
+        asyncio.run(self._main())
+
+
+def _start_asyncio(shutdown_event, probe):
+    brain_cls = _probed(AsyncBrain)
+    brain_cls.probe = probe
+
+    brain = brain_cls(SUB_ADDRESS, PUB_ADDRESS, PULL_ADDRESS)
+    runner = _AsyncRunner(brain, shutdown_event)
+    runner.start()
+    return [runner], brain.decoder
+
+
+STARTERS = {
+    "threaded": _start_threaded,
+    "reactor": _start_reactor,
+    "asyncio": _start_asyncio,
+}
+
+
+def _publish(ticks: int, rate: float, probe: _Probe) -> float:
+    """Send ticks from a fake Feeder; return achieved send duration (s)."""
+    context = zmq.Context()
+    pub = context.socket(zmq.PUB)
+    pub.setsockopt(zmq.SNDHWM, 0)
+    pub.connect(SUB_ADDRESS)
+    time.sleep(1.0)  # Let the subscription propagate (slow joiner)
+
+    frames = [
+        msgpack.packb([1, seq, 1_700_000_000_000 + seq, SYMBOLS[seq % len(SYMBOLS)],
+                       1.1000 + seq * 1e-6, 1.1002 + seq * 1e-6, 6])
+        for seq in range(1, ticks + 1)
+    ]
+    interval_ns = int(1e9 / rate) if rate > 0 else 0
+
+    start = time.perf_counter_ns()
+    for seq, frame in enumerate(frames, 1):
+        if interval_ns:
+            target = start + seq * interval_ns
+            while time.perf_counter_ns() < target:
+                pass
+        probe.send_ns[seq] = time.perf_counter_ns()
+        pub.send(frame)
+    elapsed = (time.perf_counter_ns() - start) / 1e9
+
+    pub.close(linger=1000)
+    context.term()
+    return elapsed
+
+
+def run_mode(mode: str, ticks: int, rate: float) -> dict:
+    """Run one mode and return its measurements."""
+    shutdown_event = threading.Event()
+    probe = _Probe(ticks)
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        workers, decoder = STARTERS[mode](shutdown_event, probe)
+        time.sleep(1.5)  # Engine startup delay
+
+        send_time = _publish(ticks, rate, probe)
+
+        # Wait until everything sent has been received (or give up)
+        deadline = time.monotonic() + 10.0
+        while decoder.decoded < ticks and time.monotonic() < deadline:
+            time.sleep(0.001)
+        recv_time = (time.perf_counter_ns() - probe.send_ns[1]) / 1e9
+        time.sleep(0.2)
+
+        shutdown_event.set()
+        for worker in workers:
+            worker.join(timeout=5.0)
+
+    latency_us = probe.latency_ns[:probe.analyzed] / 1000.0
+    return {
+        'received': decoder.decoded,
+        'lost': decoder.total_lost(),
+        'analyzed': probe.analyzed,
+        'send_rate': ticks / send_time,
+        'recv_rate': decoder.decoded / recv_time,
+        'p50': float(np.percentile(latency_us, 50)) if probe.analyzed else 0.0,
+        'p99': float(np.percentile(latency_us, 99)) if probe.analyzed else 0.0,
+        'max': float(latency_us.max()) if probe.analyzed else 0.0,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[1])
+    parser.add_argument("--ticks", type=int, default=20000,
+                        help="ticks per run (default: 20000)")
+    parser.add_argument("--rate", type=float, default=5000,
+                        help="paced send rate for the latency run, ticks/s (default: 5000)")
+    args = parser.parse_args()
+
+    print("=" * 78)
+    print(f"Threaded vs Reactor vs Asyncio: {args.ticks} ticks, latency run at {args.rate:,.0f} ticks/s")
+    print("=" * 78)
+    print(f"{'Mode':<10}{'Run':<7}{'Sent/s':>9}{'Recv/s':>9}{'Recv':>7}{'Lost':>6}"
+          f"{'Analyzed':>10}{'p50 us':>9}{'p99 us':>9}{'max us':>9}")
+
+    for mode in STARTERS:
+        for label, rate in (("paced", args.rate), ("max", 0)):
+            r = run_mode(mode, args.ticks, rate)
+            print(f"{mode:<10}{label:<7}{r['send_rate']:>9,.0f}{r['recv_rate']:>9,.0f}"
+                  f"{r['received']:>7}{r['lost']:>6}{r['analyzed']:>10}{r['p50']:>9.0f}"
+                  f"{r['p99']:>9.0f}{r['max']:>9.0f}")
+
+    print("\nAnalyzed < Recv means ticks were conflated per symbol (latest wins).")
+
+
+if __name__ == "__main__":
+    main()
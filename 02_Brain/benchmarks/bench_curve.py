@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+FlashEASuite V2 - Benchmark: CurveZMQ Overhead
+Ticks/s and tick-to-analysis latency with plaintext vs CurveZMQ sockets
+
+A fake Feeder PUB socket sends 7-field tick frames to the threaded
+pipeline (ingestion worker + strategy engine) over TCP, once with
+plaintext sockets and once with Curve on both ends (keys from
+config.CURVE_KEYS_DIR). Latency is measured from the Feeder's send to
+the moment the engine analyzes the tick (same process, perf_counter_ns).
+
+Usage (from 02_Brain/):
+    python -m benchmarks.bench_curve [--ticks 20000] [--rate 5000]
+"""
+
+import argparse
+import contextlib
+import io
+import queue
+import threading
+import time
+
+import msgpack
+import numpy as np
+import zmq
+
+import config
+from core.ingestion import create_ingestion_worker_threaded
+from core.mailbox import ConflatingMailbox
+from core.sockets import SocketFactory, apply_curve_client, load_curve_keys
+from core.strategy.engine import StrategyEngineThreaded
+from core.tick_store import TickStore
+
+SYMBOLS = ["EURUSD", "GBPUSD", "USDJPY", "XAUUSD"]
+SUB_ADDRESS = "tcp://127.0.0.1:27787"
+PUB_ADDRESS = "tcp://127.0.0.1:27788"
+
+
+class _ProbedEngine(StrategyEngineThreaded):
+    """Engine that records send -> analysis latency per SEQ_ID."""
+
+    send_ns = None
+    latency_ns = None
+    analyzed = 0
+
+    def _process_tick(self, tick_data, count=1):
+        super()._process_tick(tick_data, count)
+        if tick_data.seq:   # SEQ 0 = connection warm-up
+            self.latency_ns[self.analyzed] = time.perf_counter_ns() - self.send_ns[tick_data.seq]
+            self.analyzed += 1
+
+
+def run(curve, ticks: int, rate: float) -> dict:
+    """Run the pipeline once and return its measurements."""
+    shutdown_event = threading.Event()
+    sockets = SocketFactory(curve=curve)
+    tick_store = TickStore()
+    mailbox = ConflatingMailbox()
+
+    engine = _ProbedEngine(mailbox, queue.Queue(), queue.Queue(), shutdown_event,
+                           PUB_ADDRESS, tick_store, sockets=sockets)
+    engine.send_ns = np.zeros(ticks + 1, dtype=np.int64)
+    engine.latency_ns = np.zeros(ticks + 1, dtype=np.int64)
+
+    frames = [
+        msgpack.packb([1, seq, 1_700_000_000_000 + seq, SYMBOLS[seq % len(SYMBOLS)],
+                       1.1000 + seq * 1e-6, 1.1002 + seq * 1e-6, 6])
+        for seq in range(1, ticks + 1)
+    ]
+    interval_ns = int(1e9 / rate) if rate > 0 else 0
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        ingestion = create_ingestion_worker_threaded(
+            mailbox, shutdown_event, SUB_ADDRESS, tick_store, sockets=sockets)
+        ingestion.start()
+        engine.start()
+        time.sleep(1.5)  # Engine startup delay
+
+        context = zmq.Context()
+        pub = context.socket(zmq.PUB)
+        pub.setsockopt(zmq.SNDHWM, 0)
+        if curve is not None:
+            apply_curve_client(pub, curve)
+        pub.connect(SUB_ADDRESS)
+
+        # Wait for the (Curve) handshake and subscription (slow joiner)
+        warmup = msgpack.packb([1, 0, 1_700_000_000_000, SYMBOLS[0], 1.1, 1.1002, 6])
+        while ingestion.decoder.decoded == 0:
+            pub.send(warmup)
+            time.sleep(0.01)
+        time.sleep(0.2)
+        baseline = ingestion.decoder.decoded
+
+        start = time.perf_counter_ns()
+        for seq, frame in enumerate(frames, 1):
+            if interval_ns:
+                target = start + seq * interval_ns
+                while time.perf_counter_ns() < target:
+                    pass
+            engine.send_ns[seq] = time.perf_counter_ns()
+            pub.send(frame)
+
+        # Wait until everything sent has been received (or give up)
+        deadline = time.monotonic() + 10.0
+        while ingestion.decoder.decoded - baseline < ticks and time.monotonic() < deadline:
+            time.sleep(0.001)
+        recv_time = (time.perf_counter_ns() - start) / 1e9
+        time.sleep(0.2)
+
+        shutdown_event.set()
+        ingestion.join(timeout=5.0)
+        engine.join(timeout=5.0)
+        pub.close(linger=0)
+        context.term()
+        sockets.close()
+
+    received = ingestion.decoder.decoded - baseline
+    latency_us = engine.latency_ns[:engine.analyzed] / 1000.0
+    return {
+        'received': received,
+        'recv_rate': received / recv_time,
+        'p50': float(np.percentile(latency_us, 50)) if engine.analyzed else 0.0,
+        'p99': float(np.percentile(latency_us, 99)) if engine.analyzed else 0.0,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[1])
+    parser.add_argument("--ticks", type=int, default=20000,
+                        help="ticks per run (default: 20000)")
+    parser.add_argument("--rate", type=float, default=5000,
+                        help="paced send rate for the latency run, ticks/s (default: 5000)")
+    args = parser.parse_args()
+
+    curve = load_curve_keys(config.CURVE_KEYS_DIR)
+
+    print("=" * 66)
+    print(f"Plaintext vs CurveZMQ: {args.ticks} ticks, latency run at {args.rate:,.0f} ticks/s")
+    print("=" * 66)
+    print(f"{'Transport':<11}{'Run':<7}{'Recv/s':>10}{'Recv':>8}{'p50 us':>10}{'p99 us':>10}")
+
+    for label, rate in (("paced", args.rate), ("max", 0)):
+        for name, keys in (("plaintext", None), ("curve", curve)):
+            r = run(keys, args.ticks, rate)
+            print(f"{name:<11}{label:<7}{r['recv_rate']:>10,.0f}{r['received']:>8}"
+                  f"{r['p50']:>10.0f}{r['p99']:>10.0f}")
+
+    print("\nLatency covers every analyzed tick (the mailbox conflates per symbol at max rate).")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+FlashEASuite V2 - Benchmark: Strategy Engine Main Loop
+Sustained ticks/s of the legacy polling loop vs the event-driven loop
+
+The legacy loop takes one tick per iteration and always sleeps 10 ms,
+so it cannot exceed ~100 ticks/s. The event-driven loop blocks until
+data arrives and drains pending ticks in batches.
+
+Usage (from 02_Brain/):
+    python -m benchmarks.bench_engine_loop [--seconds 5]
+"""
+
+import argparse
+import contextlib
+import io
+import queue
+import threading
+import time
+
+from core.strategy.engine import StrategyEngineThreaded
+from core.tick_codec import Tick
+
+SYMBOLS = ["EURUSD", "GBPUSD", "USDJPY", "XAUUSD"]
+
+
+class _NullSocket:
+    """Stand-in for the ZMQ PUB socket (discards messages)."""
+
+    def send(self, data, flags=0):
+        pass
+
+    def send_multipart(self, msg_parts, flags=0):
+        pass
+
+    def close(self):
+        pass
+
+
+class _BenchEngine(StrategyEngineThreaded):
+    """Engine with the ZMQ socket replaced by a null socket."""
+
+    def _setup_zmq(self) -> bool:
+        self.pub_socket = _NullSocket()
+        return True
+
+
+class _LegacyEngine(_BenchEngine):
+    """Engine running the previous one-tick-per-iteration loop."""
+
+    def run(self) -> None:
+        self._setup_zmq()
+        last_grid_policy_time = 0
+
+        while not self.shutdown_event.is_set():
+            feedback = None
+            try:
+                feedback = self.feedback_queue.get_nowait()
+            except queue.Empty:
+                pass
+
+            if feedback:
+                self.feedback_processor.process_feedback(feedback)
+
+            tick_data = None
+            try:
+                tick_data = self.ingestion_queue.get(timeout=0.1)
+            except queue.Empty:
+                pass
+
+            if tick_data:
+                self._process_tick(tick_data)
+
+            current_time = time.time()
+            if current_time - last_grid_policy_time >= self.GRID_POLICY_INTERVAL:
+                self.policy_publisher.publish_policy_with_grid_data(
+                    'XAUUSD', self.pub_socket, self.feedback_processor
+                )
+                last_grid_policy_time = current_time
+
+            self._print_dashboard()
+            time.sleep(0.01)
+
+
+def _producer(q: queue.Queue, stop: threading.Event, backlog: int) -> None:
+    """Keep the ingestion queue topped up so the engine is never starved."""
+    seq = 0
+    while not stop.is_set():
+        if q.qsize() >= backlog:
+            time.sleep(0.001)
+            continue
+        seq += 1
+        q.put(Tick(1, seq, seq, SYMBOLS[seq % len(SYMBOLS)], 1.1000, 1.1002, 6))
+
+
+def measure(engine_cls, seconds: float) -> float:
+    """
+    Run an engine against a saturated queue and return sustained ticks/s.
+    """
+    ingestion_queue = queue.Queue()
+    shutdown_event = threading.Event()
+    engine = engine_cls(
+        ingestion_queue=ingestion_queue,
+        signal_queue=queue.Queue(),
+        feedback_queue=queue.Queue(),
+        shutdown_event=shutdown_event,
+    )
+
+    stop_producer = threading.Event()
+    producer = threading.Thread(
+        target=_producer, args=(ingestion_queue, stop_producer, 20000), daemon=True
+    )
+
+    # Silence engine console output while measuring
+    with contextlib.redirect_stdout(io.StringIO()):
+        producer.start()
+        engine.start()
+
+        # Skip the engine's startup delay before measuring
+        while engine.tick_count == 0:
+            time.sleep(0.01)
+
+        start_count = engine.tick_count
+        start_time = time.perf_counter()
+        time.sleep(seconds)
+        ticks = engine.tick_count - start_count
+        elapsed = time.perf_counter() - start_time
+
+        shutdown_event.set()
+        stop_producer.set()
+        engine.join(timeout=3.0)
+        producer.join(timeout=3.0)
+
+    return ticks / elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[1])
+    parser.add_argument("--seconds", type=float, default=5.0,
+                        help="measurement window per loop (default: 5)")
+    args = parser.parse_args()
+
+    print("=" * 60)
+    print("Strategy Engine main loop - sustained throughput")
+    print("=" * 60)
+
+    legacy = measure(_LegacyEngine, args.seconds)
+    print(f"Legacy loop (1 tick + sleep 10ms): {legacy:>12,.0f} ticks/s")
+
+    batched = measure(_BenchEngine, args.seconds)
+    print(f"Event-driven batch-draining loop:  {batched:>12,.0f} ticks/s")
+
+    print(f"Speedup: {batched / legacy:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
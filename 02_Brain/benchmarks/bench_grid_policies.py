@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+FlashEASuite V2 - Benchmark: Grid Policy Publishing
+Publish cost per Grid policy cycle for 1-50 symbols: per-symbol sends vs one burst
+
+Each symbol has its own tick flow analytics (fed with synthetic ticks)
+and the CSM is populated, as in a running engine. Per cycle:
+
+    per-symbol  publish_policy_with_grid_data() for each symbol
+                (feedback stats, CSM and a ZMQ send per symbol)
+    burst       publish_grid_policies() for all symbols
+                (state read once, packed in one pass, sent back to back)
+
+Policies go out on a real PUB socket with a subscriber draining it.
+
+Usage (from 02_Brain/):
+    python -m benchmarks.bench_grid_policies [--cycles 300] [--symbols 1 4 10 25 50]
+"""
+
+import argparse
+import itertools
+import threading
+import time
+
+import zmq
+
+from core.strategy.analysis import MarketAnalyzer
+from core.strategy.feedback import FeedbackProcessor
+from core.strategy.policy import PolicyPublisher
+from core.tick_codec import Tick
+from core.tick_store import TickStore
+
+CURRENCIES = ['USD', 'EUR', 'JPY', 'GBP', 'AUD', 'CAD', 'CHF', 'NZD']
+ADDRESS = "inproc://bench-grid-policies"
+
+
+def make_analyzer(symbols) -> MarketAnalyzer:
+    """MarketAnalyzer with tick history and analytics for every symbol."""
+    tick_store = TickStore()
+    analyzer = MarketAnalyzer(True, tick_store)
+    for i in range(200):
+        for n, symbol in enumerate(symbols):
+            bid = 1.1 + n * 0.01 + i * 1e-5
+            tick_store.append(symbol, 1_700_000_000_000 + i * 100, bid, bid + 0.0002)
+            analyzer.analyze_market(Tick(1, i, 1_700_000_000_000 + i * 100, symbol,
+                                         bid, bid + 0.0002, 6, 0),
+                                    tick_store.get(symbol), False)
+    analyzer.get_csm().calculate_strengths()
+    return analyzer
+
+
+def run(pub, symbols, cycles: int, burst: bool) -> float:
+    """Return mean microseconds per cycle."""
+    publisher = PolicyPublisher(snapshot_interval=0)    # Full policies every cycle
+    feedback = FeedbackProcessor()
+    analyzer = make_analyzer(symbols)
+
+    start = time.perf_counter()
+    for _ in range(cycles):
+        if burst:
+            publisher.publish_grid_policies(symbols, pub, feedback, analyzer)
+        else:
+            for symbol in symbols:
+                publisher.publish_policy_with_grid_data(symbol, pub, feedback, analyzer)
+    return (time.perf_counter() - start) / cycles * 1e6
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[1])
+    parser.add_argument("--cycles", type=int, default=300)
+    parser.add_argument("--symbols", type=int, nargs="+", default=[1, 4, 10, 25, 50])
+    args = parser.parse_args()
+
+    all_symbols = [a + b for a, b in itertools.permutations(CURRENCIES, 2)]
+
+    context = zmq.Context()
+    pub = context.socket(zmq.PUB)
+    pub.setsockopt(zmq.SNDHWM, 0)
+    pub.bind(ADDRESS)
+    sub = context.socket(zmq.SUB)
+    sub.setsockopt(zmq.SUBSCRIBE, b"")
+    sub.connect(ADDRESS)
+
+    stop = threading.Event()
+
+    def drain():
+        while not stop.is_set():
+            if sub.poll(50):
+                while True:
+                    try:
+                        sub.recv(zmq.NOBLOCK)
+                    except zmq.Again:
+                        break
+
+    drainer = threading.Thread(target=drain)
+    drainer.start()
+
+    print(f"{'symbols':>8}{'per-symbol us':>15}{'us/symbol':>11}{'burst us':>11}{'us/symbol':>11}")
+    for count in args.symbols:
+        symbols = all_symbols[:count]
+        single = run(pub, symbols, args.cycles, burst=False)
+        burst = run(pub, symbols, args.cycles, burst=True)
+        print(f"{count:>8}{single:>15.1f}{single / count:>11.1f}{burst:>11.1f}{burst / count:>11.1f}")
+
+    stop.set()
+    drainer.join()
+    sub.close(linger=0)
+    pub.close(linger=0)
+    context.term()
+
+
+if __name__ == "__main__":
+    main()
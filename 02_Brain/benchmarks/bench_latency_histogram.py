@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+FlashEASuite V2 - Benchmark: Latency Histogram
+Recording cost, memory growth and percentile accuracy of core/latency.py
+
+1. Cost: ns per LatencyHistogram.record() and per LatencyRecorder.record()
+   (the call every pipeline stage makes per tick).
+2. Memory: tracemalloc over a million records; retained memory must stay
+   at zero (counts live in one preallocated array).
+3. Accuracy: histogram p50/p99/p99.9 vs exact NumPy percentiles on a
+   log-normal latency sample (relative error bound ~1.6%).
+
+Usage (from 02_Brain/):
+    python -m benchmarks.bench_latency_histogram [--records 1000000]
+"""
+
+import argparse
+import time
+import tracemalloc
+
+import numpy as np
+
+from core.latency import DECODE, LatencyHistogram, LatencyRecorder, percentiles
+
+
+def bench_cost(records: int) -> None:
+    values = np.random.default_rng(1).lognormal(11.0, 1.0, records).astype(np.int64).tolist()
+
+    histogram = LatencyHistogram()
+    record = histogram.record
+    start = time.perf_counter_ns()
+    for value in values:
+        record(value)
+    per_value = (time.perf_counter_ns() - start) / records
+
+    recorder = LatencyRecorder()
+    stage_record = recorder.record
+    recv_ns = time.perf_counter_ns()
+    start = time.perf_counter_ns()
+    for _ in range(records):
+        stage_record(DECODE, recv_ns)
+    per_stage = (time.perf_counter_ns() - start) / records
+
+    print(f"  LatencyHistogram.record():  {per_value:7.1f} ns")
+    print(f"  LatencyRecorder.record():   {per_stage:7.1f} ns (includes perf_counter_ns)")
+
+
+def bench_memory(records: int) -> None:
+    recorder = LatencyRecorder()
+    record = recorder.record
+    recv_ns = time.perf_counter_ns()
+    for _ in range(10_000):   # Warm up
+        record(DECODE, recv_ns)
+
+    tracemalloc.start()
+    before, _ = tracemalloc.get_traced_memory()
+    for _ in range(records):
+        record(DECODE, recv_ns)
+    after, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    print(f"  Retained after {records:,} records: {after - before} bytes "
+          f"(peak transient {peak - before} bytes)")
+
+
+def bench_accuracy(records: int) -> None:
+    values = np.random.default_rng(2).lognormal(11.0, 1.0, records).astype(np.int64)
+    histogram = LatencyHistogram()
+    for value in values.tolist():
+        histogram.record(value)
+
+    estimates = percentiles(histogram.snapshot(), histogram.bucket_values())
+    exact = np.percentile(values, [50, 99, 99.9], method="inverted_cdf")
+
+    print(f"  {'quantile':<10}{'exact µs':>12}{'histogram µs':>14}{'error':>9}")
+    for name, true, estimate in zip(("p50", "p99", "p99.9"), exact, estimates):
+        error = abs(estimate - true) / true * 100
+        print(f"  {name:<10}{true / 1000:>12.2f}{estimate / 1000:>14.2f}{error:>8.2f}%")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[1])
+    parser.add_argument("--records", type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    print("Recording cost")
+    bench_cost(args.records)
+    print("Memory")
+    bench_memory(args.records)
+    print("Percentile accuracy")
+    bench_accuracy(args.records)
+
+
+if __name__ == "__main__":
+    main()
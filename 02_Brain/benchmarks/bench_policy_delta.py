@@ -0,0 +1,165 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+FlashEASuite V2 - Benchmark: Delta Policy Publishing
+Full Grid policy every cycle vs delta + keepalive: publish cost, bytes and Trader unpack CPU
+
+A PolicyPublisher publishes Grid policy cycles for N symbols over TCP to
+a Trader stand-in subscribed to every policy (``POL.``). Between cycles
+every symbol gets ``--interval`` seconds of simulated live feed (a random
+walk at about ``--tick-rate`` ticks/s, with spread noise and rare spread
+spikes) through the engine's MarketAnalyzer and TickStore, and the CSM is
+recalculated, so the policies carry real analyzer output:
+
+    full       snapshot_interval=0: every symbol's full policy every cycle
+    delta      defaults: full policy only when a decision field moved
+               (confidence, risk, cooldown, CSM trend bias, spread gate)
+               or a snapshot is due, a sequence-numbered keepalive for
+               the others
+
+Cycles run faster than the simulated feed, so the 30s snapshots (wall
+clock) mostly fall outside the run. Feeding is not part of the publish
+time.
+
+Usage (from 02_Brain/):
+    python -m benchmarks.bench_policy_delta [--symbols 50] [--cycles 60] [--rate 10] [--interval 5] [--tick-rate 4] [--history 1800]
+"""
+
+import argparse
+import contextlib
+import io
+import itertools
+import time
+
+import numpy as np
+import zmq
+
+from benchmarks.bench_grid_policies import CURRENCIES
+from benchmarks.bench_policy_topics import TraderStandIn
+from core.strategy.analysis import MarketAnalyzer
+from core.strategy.feedback import FeedbackProcessor
+from core.strategy.policy import POLICY_TOPIC_PREFIX, PolicyPublisher
+from core.tick_codec import Tick
+from core.tick_store import TickStore
+
+ADDRESS = "tcp://127.0.0.1:27779"
+START_MS = 1_700_000_000_000
+
+
+class LiveFeed:
+    """Simulated Feeder ticks for every symbol, written the way the engine does."""
+
+    def __init__(self, symbols, tick_rate: float, seed: int = 7):
+        self.symbols = symbols
+        self.tick_rate = tick_rate
+        self.rng = np.random.default_rng(seed)
+        self.tick_store = TickStore()
+        self.analyzer = MarketAnalyzer(True, self.tick_store)
+        self.bids = {symbol: 1.1 + n * 0.01 for n, symbol in enumerate(symbols)}
+        self.seq = 0
+        self.now_ms = START_MS
+
+    def advance(self, seconds: float) -> None:
+        """Feed ``seconds`` of ticks for every symbol, then recalculate the CSM."""
+        rng = self.rng
+        end_ms = self.now_ms + int(seconds * 1000)
+        for symbol in self.symbols:
+            count = rng.poisson(self.tick_rate * seconds)
+            times = np.sort(rng.integers(self.now_ms, end_ms, count)).tolist()
+            steps = np.exp(rng.normal(0.0, 2e-5, count)).tolist()
+            spreads = 1.5e-4 * (1 + rng.exponential(0.3, count))
+            spikes = rng.random(count) < 0.005
+            spreads[spikes] *= 8
+            bid = self.bids[symbol]
+            ring = self.tick_store.get(symbol)
+            for time_msc, step, spread in zip(times, steps, spreads.tolist()):
+                bid *= step
+                self.seq += 1
+                self.tick_store.append(symbol, time_msc, bid, bid + spread, 6, self.seq)
+                if ring is None:
+                    ring = self.tick_store.get(symbol)
+                self.analyzer.analyze_market(
+                    Tick(1, self.seq, time_msc, symbol, bid, bid + spread, 6, 0), ring, False)
+            self.bids[symbol] = bid
+        self.now_ms = end_ms
+        self.analyzer.get_csm().calculate_strengths()
+
+
+def run(context: zmq.Context, pub: zmq.Socket, publisher: PolicyPublisher, symbols, args) -> dict:
+    """Publish ``cycles`` cycles of live analytics; return publish and Trader measurements."""
+    trader = TraderStandIn(context, ADDRESS, [POLICY_TOPIC_PREFIX])
+    trader.start()
+
+    feedback = FeedbackProcessor()
+    feed = LiveFeed(symbols, args.tick_rate)
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        feed.advance(args.history)      # The CSM's 30-minute trend window, filled
+
+        # Wait until the subscription has reached the PUB (slow joiner)
+        while trader.messages == 0:
+            publisher.publish_grid_policies(symbols, pub, feedback, feed.analyzer)
+            time.sleep(0.05)
+        time.sleep(0.2)
+        trader.reset()
+
+        publish_time = 0.0
+        full = 0
+        start = time.perf_counter()
+        for n in range(args.cycles):
+            feed.advance(args.interval)
+
+            t0 = time.perf_counter()
+            full += publisher.publish_grid_policies(symbols, pub, feedback, feed.analyzer)
+            publish_time += time.perf_counter() - t0
+
+            delay = start + (n + 1) / args.rate - time.perf_counter()
+            if delay > 0:
+                time.sleep(delay)
+        time.sleep(0.5)
+
+    trader.stop.set()
+    trader.join()
+    return {
+        'publish_us': publish_time / args.cycles * 1e6,
+        'full': full,
+        'messages': trader.messages,
+        'kb': trader.bytes / 1024,
+        'cpu_ms': trader.cpu * 1000,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[1])
+    parser.add_argument("--symbols", type=int, default=50)
+    parser.add_argument("--cycles", type=int, default=60)
+    parser.add_argument("--rate", type=float, default=10, help="Grid policy cycles per second (wall clock)")
+    parser.add_argument("--interval", type=float, default=5.0,
+                        help="simulated feed seconds per cycle (GRID_POLICY_INTERVAL)")
+    parser.add_argument("--tick-rate", type=float, default=4.0, help="mean ticks/s per symbol")
+    parser.add_argument("--history", type=float, default=1800.0,
+                        help="simulated feed seconds before the first cycle")
+    args = parser.parse_args()
+
+    symbols = [a + b for a, b in itertools.permutations(CURRENCIES, 2)][:args.symbols]
+
+    context = zmq.Context()
+    pub = context.socket(zmq.PUB)
+    pub.setsockopt(zmq.SNDHWM, 0)
+    pub.bind(ADDRESS)
+
+    print(f"{args.cycles} Grid cycles x {len(symbols)} symbols, {args.interval:g}s of live feed "
+          f"({args.tick_rate:g} ticks/s per symbol) between cycles")
+    print(f"{'mode':<8}{'publish us':>12}{'full':>8}{'messages':>10}{'KB':>9}{'Trader CPU ms':>15}")
+    for name, publisher in (("full", PolicyPublisher(snapshot_interval=0)),
+                            ("delta", PolicyPublisher())):
+        r = run(context, pub, publisher, symbols, args)
+        print(f"{name:<8}{r['publish_us']:>12.0f}{r['full']:>8}{r['messages']:>10}"
+              f"{r['kb']:>9.1f}{r['cpu_ms']:>15.1f}")
+
+    pub.close(linger=0)
+    context.term()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+FlashEASuite V2 - Benchmark: Policy Encoding
+Bytes per policy and microseconds per pack/unpack: verbose maps vs compact arrays
+
+One Grid policy (with CSM, analytics and debug info of a populated
+MarketAnalyzer), one signal policy and one keepalive are encoded as:
+
+    verbose packb    map with long keys, msgpack.packb per message (original)
+    verbose Packer   same map, one reused msgpack.Packer
+    compact Packer   versioned fixed-position array, one reused Packer
+
+"unpack" is the Trader side: msgpack.unpackb of the payload.
+
+Usage (from 02_Brain/):
+    python -m benchmarks.bench_policy_encoding [--number 100000]
+"""
+
+import argparse
+import contextlib
+import io
+import time
+import timeit
+
+import msgpack
+
+from benchmarks.bench_grid_policies import make_analyzer
+from core.strategy.feedback import FeedbackProcessor
+from core.strategy.policy import (
+    POLICY_FORMAT_COMPACT,
+    POLICY_FORMAT_VERBOSE,
+    PolicyPublisher,
+    decode_policy
+)
+
+SYMBOL = "EURUSD"
+
+
+class _CaptureSocket:
+    """PUB socket stand-in that keeps the payload frames."""
+
+    def __init__(self):
+        self.payloads = []
+
+    def send(self, data, flags=0):
+        if not flags:
+            self.payloads.append(data)
+
+    def send_multipart(self, msg_parts, flags=0):
+        self.payloads.append(msg_parts[-1])
+
+
+def capture(encoding: str) -> dict:
+    """Publish a Grid policy, a keepalive and a signal policy; return their payloads."""
+    publisher = PolicyPublisher(encoding=encoding)
+    sock = _CaptureSocket()
+    analyzer = make_analyzer([SYMBOL, "USDJPY"])
+    feedback = FeedbackProcessor()
+    with contextlib.redirect_stdout(io.StringIO()):
+        publisher.publish_grid_policies([SYMBOL], sock, feedback, analyzer)
+        publisher.publish_grid_policies([SYMBOL], sock, feedback, analyzer)
+        publisher.publish_policy('BUY', SYMBOL, sock, feedback)
+    grid, keepalive, signal = sock.payloads
+    return {'grid': grid, 'keepalive': keepalive, 'signal': signal}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[1])
+    parser.add_argument("--number", type=int, default=100_000)
+    args = parser.parse_args()
+
+    payloads = {
+        POLICY_FORMAT_VERBOSE: capture(POLICY_FORMAT_VERBOSE),
+        POLICY_FORMAT_COMPACT: capture(POLICY_FORMAT_COMPACT),
+    }
+    for kind in ('grid', 'keepalive', 'signal'):
+        assert decode_policy(payloads[POLICY_FORMAT_COMPACT][kind])['symbol'] == SYMBOL
+
+    packer = msgpack.Packer()
+    print(f"{'message':<11}{'encoding':<16}{'bytes':>7}{'pack us':>10}{'unpack us':>11}")
+    for kind in ('grid', 'keepalive', 'signal'):
+        runs = (
+            ("verbose packb", POLICY_FORMAT_VERBOSE, msgpack.packb),
+            ("verbose Packer", POLICY_FORMAT_VERBOSE, packer.pack),
+            ("compact Packer", POLICY_FORMAT_COMPACT, packer.pack),
+        )
+        for name, encoding, pack in runs:
+            payload = payloads[encoding][kind]
+            message = msgpack.unpackb(payload)
+            pack_us = timeit.timeit(lambda: pack(message), number=args.number,
+                                    timer=time.perf_counter) / args.number * 1e6
+            unpack_us = timeit.timeit(lambda: msgpack.unpackb(payload), number=args.number,
+                                      timer=time.perf_counter) / args.number * 1e6
+            print(f"{kind:<11}{name:<16}{len(payload):>7}{pack_us:>10.2f}{unpack_us:>11.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+FlashEASuite V2 - Benchmark: Topic-Filtered Policy Subscriptions
+Receive load of a Trader subscribed to every policy vs to its own symbol's topic
+
+A Brain-side PolicyPublisher publishes Grid policy cycles for N symbols
+over TCP. Two Trader stand-ins (TraderStandIn, one thread each) receive
+and unpack what they are sent, like ProgramC_Trader.mq5 does:
+
+    all        SUBSCRIBE "POL."         (every symbol, the old behaviour)
+    one        SUBSCRIBE "POL.XAUUSD"   (its chart symbol only)
+
+With a topic subscription the PUB socket drops the other symbols'
+messages before they reach the network, so the Trader's message count,
+bytes and CPU time shrink by about the number of symbols.
+
+Usage (from 02_Brain/):
+    python -m benchmarks.bench_policy_topics [--symbols 50] [--rate 20] [--seconds 5]
+"""
+
+import argparse
+import contextlib
+import io
+import itertools
+import threading
+import time
+from typing import Sequence
+
+import msgpack
+import zmq
+
+from benchmarks.bench_grid_policies import CURRENCIES, make_analyzer
+from core.strategy.feedback import FeedbackProcessor
+from core.strategy.policy import POLICY_TOPIC_PREFIX, PolicyPublisher, policy_topic
+
+ADDRESS = "tcp://127.0.0.1:27778"
+
+
+class TraderStandIn(threading.Thread):
+    """Python stand-in for the MQL5 Trader's policy subscriber."""
+
+    def __init__(self, context: zmq.Context, address: str, topics: Sequence[bytes]):
+        super().__init__(daemon=True)
+        self.sock = context.socket(zmq.SUB)
+        for topic in topics:
+            self.sock.setsockopt(zmq.SUBSCRIBE, topic)
+        self.sock.connect(address)
+
+        self.stop = threading.Event()
+        self.messages = 0
+        self.bytes = 0
+        self.cpu = 0.0
+
+    def reset(self) -> None:
+        self.messages = self.bytes = 0
+        self.cpu = 0.0
+
+    def run(self) -> None:
+        while not self.stop.is_set():
+            if not self.sock.poll(50):
+                continue
+            start = time.thread_time()
+            while True:
+                try:
+                    topic, payload = self.sock.recv_multipart(zmq.NOBLOCK)
+                except zmq.Again:
+                    break
+                msgpack.unpackb(payload)
+                self.messages += 1
+                self.bytes += len(topic) + len(payload)
+            self.cpu += time.thread_time() - start
+        self.sock.close(linger=0)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[1])
+    parser.add_argument("--symbols", type=int, default=50)
+    parser.add_argument("--rate", type=float, default=20, help="Grid policy cycles per second")
+    parser.add_argument("--seconds", type=float, default=5.0)
+    args = parser.parse_args()
+
+    symbols = ["XAUUSD"] + [a + b for a, b in itertools.permutations(CURRENCIES, 2)]
+    symbols = symbols[:args.symbols]
+
+    context = zmq.Context()
+    pub = context.socket(zmq.PUB)
+    pub.setsockopt(zmq.SNDHWM, 0)
+    pub.bind(ADDRESS)
+
+    traders = {
+        'all': TraderStandIn(context, ADDRESS, [POLICY_TOPIC_PREFIX]),
+        'one': TraderStandIn(context, ADDRESS, [policy_topic("XAUUSD")]),
+    }
+    for trader in traders.values():
+        trader.start()
+
+    publisher = PolicyPublisher(snapshot_interval=0)    # Full policies every cycle
+    feedback = FeedbackProcessor()
+    analyzer = make_analyzer(symbols)
+
+    def cycle():
+        publisher.publish_grid_policies(symbols, pub, feedback, analyzer)
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        # Wait until both subscriptions have reached the PUB (slow joiner)
+        while any(trader.messages == 0 for trader in traders.values()):
+            cycle()
+            time.sleep(0.05)
+        time.sleep(0.2)
+        for trader in traders.values():
+            trader.reset()
+
+        cycles = int(args.rate * args.seconds)
+        start = time.perf_counter()
+        for n in range(cycles):
+            cycle()
+            delay = start + (n + 1) / args.rate - time.perf_counter()
+            if delay > 0:
+                time.sleep(delay)
+        time.sleep(0.5)
+
+    for trader in traders.values():
+        trader.stop.set()
+        trader.join()
+    pub.close(linger=0)
+    context.term()
+
+    print(f"{cycles} Grid cycles x {len(symbols)} symbols ({args.rate:g} cycles/s)")
+    print(f"{'trader':<8}{'subscription':<14}{'messages':>10}{'KB':>10}{'CPU ms':>9}{'per cycle':>11}")
+    for name, trader in traders.items():
+        subscription = "POL." if name == 'all' else "POL.XAUUSD"
+        print(f"{name:<8}{subscription:<14}{trader.messages:>10}{trader.bytes / 1024:>10.1f}"
+              f"{trader.cpu * 1000:>9.1f}{trader.messages / cycles:>11.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,192 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+FlashEASuite V2 - Benchmark: Threaded vs Process Ingestion
+CPU use and GIL headroom of ingestion + strategy at 10k+ ticks/s
+
+A fake Feeder in a separate process sends paced ticks to the Brain's
+SUB socket. CPU time of the ingestion worker and the strategy engine
+is sampled from /proc over the measurement window (Linux only).
+
+Threaded mode: both workers share one GIL, so headroom is what is left
+of one core after both. Process mode: ingestion has its own GIL, so
+headroom is what is left after the busier of the two.
+
+Usage (from 02_Brain/):
+    python -m benchmarks.bench_process_mode [--rates 10000 20000 40000] [--seconds 5]
+"""
+
+import argparse
+import contextlib
+import io
+import multiprocessing
+import os
+import queue
+import sys
+import threading
+import time
+
+import msgpack
+import zmq
+
+from core.ingestion import create_ingestion_worker_process, create_ingestion_worker_threaded
+from core.mailbox import ConflatingMailbox
+from core.shm_ring import SharedRingMailbox, SharedTickRing
+from core.strategy.engine import StrategyEngineThreaded
+from core.tick_store import TickStore
+
+SYMBOLS = ["EURUSD", "GBPUSD", "USDJPY", "XAUUSD"]
+SUB_ADDRESS = "tcp://127.0.0.1:27777"
+WARMUP = 1.0
+
+
+class _NullSocket:
+    """Stand-in for the ZMQ PUB socket (discards messages)."""
+
+    def send(self, data, flags=0):
+        pass
+
+    def send_multipart(self, msg_parts, flags=0):
+        pass
+
+    def close(self):
+        pass
+
+
+class _BenchEngine(StrategyEngineThreaded):
+    """Engine with the ZMQ socket replaced by a null socket."""
+
+    def _setup_zmq(self) -> bool:
+        self.pub_socket = _NullSocket()
+        return True
+
+
+def _feeder(rate: float, seconds: float, ready) -> None:
+    """Fake Feeder process: send paced ticks for ``seconds``."""
+    context = zmq.Context()
+    pub = context.socket(zmq.PUB)
+    pub.setsockopt(zmq.SNDHWM, 0)
+    pub.connect(SUB_ADDRESS)
+    time.sleep(1.0)  # Let the subscription propagate (slow joiner)
+    ready.set()
+
+    ticks = int(rate * seconds)
+    interval_ns = int(1e9 / rate)
+    start = time.perf_counter_ns()
+    for seq in range(1, ticks + 1):
+        target = start + seq * interval_ns
+        while time.perf_counter_ns() < target:
+            pass
+        pub.send(msgpack.packb([1, seq, 1_700_000_000_000 + seq, SYMBOLS[seq % len(SYMBOLS)],
+                                1.1000 + seq * 1e-6, 1.1002 + seq * 1e-6, 6]))
+
+    pub.close(linger=1000)
+    context.term()
+
+
+def _cpu_seconds(stat_path: str) -> float:
+    """utime + stime from a /proc/.../stat file."""
+    with open(stat_path) as f:
+        fields = f.read().rsplit(")", 1)[1].split()
+    return (int(fields[11]) + int(fields[12])) / os.sysconf("SC_CLK_TCK")
+
+
+def run_mode(mode: str, rate: float, seconds: float) -> dict:
+    """Run one mode at one rate and return its measurements."""
+    tick_store = TickStore()
+    ring = None
+
+    if mode == "process":
+        shutdown_event = multiprocessing.Event()
+        ring = SharedTickRing()
+        ingestion_queue = SharedRingMailbox(ring, tick_store)
+        ingestion = create_ingestion_worker_process(ring, shutdown_event, SUB_ADDRESS)
+    else:
+        shutdown_event = threading.Event()
+        ingestion_queue = ConflatingMailbox()
+        ingestion = create_ingestion_worker_threaded(ingestion_queue, shutdown_event,
+                                                     SUB_ADDRESS, tick_store)
+
+    engine = _BenchEngine(ingestion_queue, queue.Queue(), queue.Queue(), shutdown_event,
+                          tick_store=tick_store)
+    ready = multiprocessing.Event()
+    feeder = multiprocessing.Process(target=_feeder, args=(rate, seconds + WARMUP, ready))
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        ingestion.start()
+        engine.start()
+        time.sleep(1.5)  # Socket bind + engine startup delay
+        feeder.start()
+        ready.wait()
+        time.sleep(WARMUP)
+
+        if mode == "process":
+            ingest_stat = f"/proc/{ingestion.pid}/stat"
+        else:
+            ingest_stat = f"/proc/self/task/{ingestion.native_id}/stat"
+        engine_stat = f"/proc/self/task/{engine.native_id}/stat"
+
+        ingest_cpu = _cpu_seconds(ingest_stat)
+        engine_cpu = _cpu_seconds(engine_stat)
+        ticks = engine.tick_count
+        start = time.perf_counter()
+
+        time.sleep(seconds)
+
+        elapsed = time.perf_counter() - start
+        ingest_cpu = _cpu_seconds(ingest_stat) - ingest_cpu
+        engine_cpu = _cpu_seconds(engine_stat) - engine_cpu
+        ticks = engine.tick_count - ticks
+
+        feeder.join()
+        time.sleep(0.5)
+        stats = ingestion.get_sequence_stats()
+        shutdown_event.set()
+        engine.join(timeout=5.0)
+        ingestion.join(timeout=5.0)
+
+    if ring is not None:
+        ring.close()
+
+    ingest_pct = ingest_cpu / elapsed * 100
+    engine_pct = engine_cpu / elapsed * 100
+    busiest = ingest_pct + engine_pct if mode == "threaded" else max(ingest_pct, engine_pct)
+    return {
+        'tick_rate': ticks / elapsed,
+        'lost': sum(f['lost'] for f in stats['feeders'].values()),
+        'ingest_pct': ingest_pct,
+        'engine_pct': engine_pct,
+        'headroom': 100.0 - busiest,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[1])
+    parser.add_argument("--rates", type=float, nargs="+", default=[10000, 20000, 40000],
+                        help="Feeder rates to test, ticks/s (default: 10000 20000 40000)")
+    parser.add_argument("--seconds", type=float, default=5.0,
+                        help="measurement window per run (default: 5)")
+    args = parser.parse_args()
+
+    if not sys.platform.startswith("linux"):
+        print("This benchmark reads CPU times from /proc and needs Linux.")
+        return
+
+    print("=" * 72)
+    print(f"Threaded vs Process ingestion: {args.seconds:.0f}s per run")
+    print("=" * 72)
+    print(f"{'Mode':<10}{'Rate':>9}{'Ticks/s':>10}{'Lost':>8}"
+          f"{'Ingest %':>10}{'Engine %':>10}{'Headroom %':>12}")
+
+    for rate in args.rates:
+        for mode in ("threaded", "process"):
+            r = run_mode(mode, rate, args.seconds)
+            print(f"{mode:<10}{rate:>9,.0f}{r['tick_rate']:>10,.0f}{r['lost']:>8}"
+                  f"{r['ingest_pct']:>10.0f}{r['engine_pct']:>10.0f}{r['headroom']:>12.0f}")
+
+    print("\nHeadroom = one core minus the GIL-bound work (threaded: ingest + engine,")
+    print("process: the busier of the two). Ticks/s counts ticks the engine consumed.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+FlashEASuite V2 - Benchmark: Spread Quantiles
+p50/p90/p99 spread over a 15-minute window: exact (sorted history) vs rolling P² sketch
+
+Spreads arrive at ``--rate`` ticks/s with occasional news spikes
+(``--spikes`` of the ticks are 5-15x wider). ``--minutes`` of ticks are
+added first, then each of ``--measure`` ticks is added and p50/p90/p99
+are asked for (as a spread filter would on every tick):
+
+    exact      a deque of every spread in the window, np.quantile()
+               over it (what a terminal's spread buffer has to do,
+               at any window length)
+    p2         core/quantile_sketch.py RollingQuantiles: two P²
+               sketches, a new one every half window
+
+Cost per tick, retained memory and the estimates at the end are
+printed; the mean spread is printed as well, to show how far spikes
+pull it compared with the median.
+
+Usage (from 02_Brain/):
+    python -m benchmarks.bench_spread_quantiles [--rate 50] [--minutes 30] [--measure 500] [--spikes 0.005]
+"""
+
+import argparse
+import time
+import tracemalloc
+from collections import deque
+
+import numpy as np
+
+from core.quantile_sketch import RollingQuantiles
+
+PROBS = (0.5, 0.9, 0.99)
+WINDOW = 900.0
+
+
+class ExactQuantiles:
+    """Every spread of the window, sorted on each query."""
+
+    def __init__(self, window: float = WINDOW):
+        self.window = window
+        self.history = deque()
+
+    def add(self, value: float, now: float) -> None:
+        history = self.history
+        history.append((now, value))
+        while now - history[0][0] > self.window:
+            history.popleft()
+
+    def quantiles(self) -> dict:
+        values = np.quantile([value for _, value in self.history], PROBS)
+        return dict(zip(PROBS, values.tolist()))
+
+
+def run(sketch, times, spreads, fill: int) -> dict:
+    """Add ``fill`` spreads, then time add + query for the rest; return cost, memory and estimates."""
+    add, quantiles = sketch.add, sketch.quantiles
+    tracemalloc.start()
+    for now, spread in zip(times[:fill], spreads[:fill]):
+        add(spread, now)
+    retained = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    start = time.perf_counter()
+    for now, spread in zip(times[fill:], spreads[fill:]):
+        add(spread, now)
+        quantiles()
+    elapsed = time.perf_counter() - start
+
+    return {
+        'us_per_tick': elapsed / (len(spreads) - fill) * 1e6,
+        'kb': retained / 1024,
+        'quantiles': quantiles(),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[1])
+    parser.add_argument("--rate", type=float, default=50, help="ticks per second")
+    parser.add_argument("--minutes", type=float, default=30, help="minutes of ticks added first")
+    parser.add_argument("--measure", type=int, default=500, help="ticks timed (add + query)")
+    parser.add_argument("--spikes", type=float, default=0.005, help="fraction of spike ticks")
+    args = parser.parse_args()
+
+    fill = int(args.rate * args.minutes * 60)
+    n = fill + args.measure
+    rng = np.random.default_rng(5)
+    times = (np.arange(1, n + 1) / args.rate).tolist()
+    spreads = 1e-4 * (1 + rng.exponential(0.3, n))
+    spikes = rng.random(n) < args.spikes
+    spreads[spikes] *= rng.uniform(5, 15, spikes.sum())
+    spreads = spreads.tolist()
+
+    print(f"{args.rate:g} ticks/s for {args.minutes:g} min ({fill:,} ticks) + {args.measure:,} timed, "
+          f"{args.spikes:.1%} spikes, 15-minute window")
+    print(f"{'method':<8}{'us/tick':>10}{'memory KB':>12}{'p50':>12}{'p90':>12}{'p99':>12}")
+    for name, sketch in (("exact", ExactQuantiles()), ("p2", RollingQuantiles(WINDOW, PROBS))):
+        r = run(sketch, times, spreads, fill)
+        q = r['quantiles']
+        print(f"{name:<8}{r['us_per_tick']:>10.2f}{r['kb']:>12.0f}"
+              f"{q[0.5]:>12.7f}{q[0.9]:>12.7f}{q[0.99]:>12.7f}")
+
+    window = spreads[-int(args.rate * WINDOW):]
+    print(f"mean spread over the window {np.mean(window):.7f} "
+          f"(median {np.median(window):.7f})")
+
+
+if __name__ == "__main__":
+    main()
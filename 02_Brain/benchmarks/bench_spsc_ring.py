@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+FlashEASuite V2 - Benchmark: SPSC Ring vs Queues
+Ops/s and handoff tail latency of core/spsc_ring.py vs queue.Queue and BoundedQueue
+
+1. Throughput: one producer thread puts N items as fast as it can, one
+   consumer thread takes them (get() per item, and pop_batch() for the
+   ring, which is how the strategy engine drains it).
+2. Latency: the producer is paced (sleeping between items, like a real
+   tick stream) and stamps every item with perf_counter_ns; the consumer
+   blocks while idle, so this includes the wakeup path. Reports
+   p50/p99/p99.9 of put -> taken by the consumer.
+
+Usage (from 02_Brain/):
+    python -m benchmarks.bench_spsc_ring [--items 500000] [--rate 10000] [--latency-items 20000]
+"""
+
+import argparse
+import queue
+import threading
+import time
+
+import numpy as np
+
+from core.queues import BoundedQueue
+from core.spsc_ring import WAKEUP_EVENTFD, SpscRing
+
+CAPACITY = 65536
+
+
+def _handoffs():
+    return [
+        ("queue.Queue", lambda: queue.Queue(maxsize=CAPACITY), False),
+        ("BoundedQueue", lambda: BoundedQueue(CAPACITY, 'block'), False),
+        ("SpscRing get", lambda: SpscRing(CAPACITY), False),
+        ("SpscRing batch", lambda: SpscRing(CAPACITY), True),
+        ("SpscRing eventfd", lambda: SpscRing(CAPACITY, wakeup=WAKEUP_EVENTFD), True),
+    ]
+
+
+def _consumer(handoff, count: int, batch: bool, on_item) -> threading.Thread:
+    def consume():
+        taken = 0
+        if batch:
+            while taken < count:
+                handoff.wait(0.1)
+                for item in handoff.pop_batch(1000):
+                    on_item(item)
+                    taken += 1
+        else:
+            get = handoff.get
+            while taken < count:
+                try:
+                    item = get(timeout=0.1)
+                except queue.Empty:
+                    continue
+                on_item(item)
+                taken += 1
+
+    thread = threading.Thread(target=consume)
+    thread.start()
+    return thread
+
+
+def bench_throughput(items: int) -> None:
+    print(f"{'handoff':<18}{'ops/s':>12}{'ns/op':>9}")
+    for name, make, batch in _handoffs():
+        handoff = make()
+        consumer = _consumer(handoff, items, batch, lambda item: None)
+        put = handoff.put
+        start = time.perf_counter()
+        for i in range(items):
+            put(i)
+        consumer.join()
+        rate = items / (time.perf_counter() - start)
+        print(f"{name:<18}{rate:>12,.0f}{1e9 / rate:>9.0f}")
+
+
+def bench_latency(items: int, rate: int) -> None:
+    print(f"{'handoff':<18}{'p50 us':>9}{'p99 us':>9}{'p99.9 us':>10}{'max us':>9}")
+    interval = 1.0 / rate
+    for name, make, batch in _handoffs():
+        handoff = make()
+        latency = np.zeros(items, dtype=np.int64)
+        taken = [0]
+
+        def on_item(stamp):
+            latency[taken[0]] = time.perf_counter_ns() - stamp
+            taken[0] += 1
+
+        consumer = _consumer(handoff, items, batch, on_item)
+        put = handoff.put
+        start = time.perf_counter()
+        for i in range(items):
+            delay = start + i * interval - time.perf_counter()
+            if delay > 0:
+                time.sleep(delay)
+            put(time.perf_counter_ns())
+        consumer.join()
+
+        p50, p99, p999 = np.percentile(latency, [50, 99, 99.9]) / 1000.0
+        print(f"{name:<18}{p50:>9.1f}{p99:>9.1f}{p999:>10.1f}{latency.max() / 1000.0:>9.1f}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[1])
+    parser.add_argument("--items", type=int, default=500_000)
+    parser.add_argument("--rate", type=int, default=10_000, help="paced rate for the latency run")
+    parser.add_argument("--latency-items", type=int, default=20_000)
+    args = parser.parse_args()
+
+    print("Throughput (unpaced)")
+    bench_throughput(args.items)
+    print(f"\nHandoff latency at {args.rate:,} items/s (consumer idles between items)")
+    bench_latency(args.latency_items, args.rate)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+FlashEASuite V2 - Benchmark: Stage Handoff Transports
+Ticks/s from a producer thread to a consumer thread: queues vs ZMQ links
+
+Both threads run the handoff the way ingestion and the strategy engine
+do: the producer puts each tick it has decoded, the consumer gets it
+back as a Tick. Every tick is delivered (no conflation), so the numbers
+compare the transports themselves.
+
+    queue.Queue       stdlib queue (what the stages used originally)
+    BoundedQueue      core/queues.py, 'block' policy
+    link inproc://    core/links.py StageLink, same context: put(Tick),
+                      packed again and rebuilt from the packed frame
+    frames inproc://  StageLink with a decoder: put_frame() forwards the
+                      Feeder frame uncopied, the consumer decodes it once
+                      (what ingestion does with STAGE_TRANSPORT = "zmq")
+    frames ipc://     the same over a Unix socket (POSIX only)
+    frames tcp://     the same over loopback TCP
+
+Usage (from 02_Brain/):
+    python -m benchmarks.bench_stage_links [--ticks 200000]
+"""
+
+import argparse
+import os
+import queue
+import tempfile
+import threading
+import time
+
+import msgpack
+
+from core.links import StageLink
+from core.queues import BoundedQueue
+from core.sockets import SocketFactory
+from core.tick_codec import Tick, unpack_tick
+
+SYMBOLS = ["EURUSD", "GBPUSD", "USDJPY", "XAUUSD"]
+
+
+def run(handoff, ticks: int) -> float:
+    """Move ``ticks`` ticks through a handoff; return ticks/s."""
+    items = [Tick(1, seq, 1_700_000_000_000 + seq, SYMBOLS[seq % 4],
+                  1.1 + seq * 1e-6, 1.1002 + seq * 1e-6, 6, 0)
+             for seq in range(ticks)]
+    frames = getattr(handoff, 'decoder', None) is not None
+    sent = [msgpack.packb(item[:-1]) for item in items] if frames else items
+    received = []
+
+    def consume():
+        get = handoff.get
+        for _ in range(ticks):
+            received.append(get(timeout=5.0))
+
+    consumer = threading.Thread(target=consume)
+    consumer.start()
+    time.sleep(0.1)
+
+    start = time.perf_counter()
+    put = handoff.put_frame if frames else handoff.put
+    for item in sent:
+        put(item)
+    consumer.join()
+    elapsed = time.perf_counter() - start
+
+    assert received[-1] == items[-1], "handoff corrupted the last tick"
+    return ticks / elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[1])
+    parser.add_argument("--ticks", type=int, default=200_000)
+    args = parser.parse_args()
+
+    sockets = SocketFactory()
+    ipc_path = os.path.join(tempfile.gettempdir(), f"flashea-bench-{os.getpid()}")
+    handoffs = [
+        ("queue.Queue", lambda: queue.Queue(maxsize=50_000)),
+        ("BoundedQueue", lambda: BoundedQueue(50_000, 'block', name='Ingestion')),
+        ("link inproc://", lambda: StageLink("inproc://bench", item_type=Tick, sockets=sockets)),
+        ("frames inproc://", lambda: StageLink("inproc://bench-frames", sockets=sockets,
+                                               decoder=unpack_tick)),
+        ("frames tcp://", lambda: StageLink("tcp://127.0.0.1:27790", sockets=sockets,
+                                            decoder=unpack_tick)),
+    ]
+    if os.name == "posix":
+        handoffs.insert(4, ("frames ipc://", lambda: StageLink(f"ipc://{ipc_path}", sockets=sockets,
+                                                               decoder=unpack_tick)))
+
+    print(f"{'transport':<18}{'ticks/s':>12}{'us/tick':>10}")
+    for name, make in handoffs:
+        handoff = make()
+        rate = run(handoff, args.ticks)
+        if isinstance(handoff, StageLink):
+            handoff.close()
+        print(f"{name:<18}{rate:>12,.0f}{1e6 / rate:>10.2f}")
+
+    sockets.close()
+
+
+if __name__ == "__main__":
+    main()
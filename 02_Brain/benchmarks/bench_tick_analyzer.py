@@ -0,0 +1,174 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+FlashEASuite V2 - Benchmark: Tick Flow Analyzer
+on_tick() cost and memory over a 15-minute window (deques vs buckets), and on_ticks() batch mode
+
+Ticks arrive at ``--rate`` ticks/s with their own timestamps (as from the
+Feeder's time_msc). The 15-minute window is filled first, then on_tick()
+is timed at steady state for:
+
+    legacy     one deque entry per tick, sum() over the spread history
+               on every tick (the analyzer before running sums)
+    buckets    modules/tick_analyzer.py: one ring of 100ms prefix-sum
+               buckets for every tick window (1s to 1h), 1s spread
+               buckets with a compensated running sum
+
+Both see the same ticks, so the last tick ratio and mean spread are
+printed side by side as a sanity check, followed by the tick rates of
+all the bucket analyzer's windows (read from the same ring).
+
+Then ``--hours`` of ticks are run through a fresh analyzer twice: once
+with on_tick() per tick and once with one vectorized on_ticks() call.
+The largest difference between the two outputs is printed.
+
+Usage (from 02_Brain/):
+    python -m benchmarks.bench_tick_analyzer [--rate 50] [--minutes 15] [--measure 2000] [--hours 24]
+"""
+
+import argparse
+import time
+import tracemalloc
+from collections import deque
+
+import numpy as np
+
+from modules.tick_analyzer import TickFlowAnalyzer
+
+START = 1_700_000_000.0
+
+
+class LegacyTickFlowAnalyzer:
+    """TickFlowAnalyzer before bucketing (same logic, tick timestamps)."""
+
+    def __init__(self, window_short_sec=1.0, window_long_sec=900.0):
+        self.window_short = window_short_sec
+        self.window_long = window_long_sec
+        self.ticks_short = deque()
+        self.ticks_long = deque()
+        self.short_count = 0
+        self.long_count = 0
+        self.spread_history = deque()
+        self.current_tick_ratio = 0.0
+        self.current_spread_avg = 0.0
+        self.current_spread_ratio = 0.0
+
+    def prefill(self, times, bids, asks):
+        """Load a window of ticks without on_tick() (whose fill is O(n^2))."""
+        for now, bid, ask in zip(times, bids, asks):
+            self.ticks_short.append((now, 1))
+            self.ticks_long.append((now, 1))
+            self.spread_history.append((now, ask - bid))
+        self.long_count = len(self.ticks_long)
+        self.short_count = len(self.ticks_short)
+
+    def on_tick(self, bid, ask, count=1, now=None):
+        current_spread = ask - bid
+        self.ticks_short.append((now, count))
+        self.ticks_long.append((now, count))
+        self.short_count += count
+        self.long_count += count
+        self.spread_history.append((now, current_spread))
+
+        while self.ticks_short and now - self.ticks_short[0][0] > self.window_short:
+            self.short_count -= self.ticks_short.popleft()[1]
+        while self.ticks_long and now - self.ticks_long[0][0] > self.window_long:
+            self.long_count -= self.ticks_long.popleft()[1]
+        while self.spread_history and now - self.spread_history[0][0] > self.window_long:
+            self.spread_history.popleft()
+
+        elapsed = max(min(now - self.ticks_long[0][0], self.window_long), 1.0)
+        long_avg_per_sec = self.long_count / elapsed
+        self.current_tick_ratio = self.short_count / long_avg_per_sec if long_avg_per_sec > 0 else 0.0
+        total_spread = sum(item[1] for item in self.spread_history)
+        self.current_spread_avg = total_spread / len(self.spread_history)
+        self.current_spread_ratio = (current_spread / self.current_spread_avg
+                                     if self.current_spread_avg > 0 else 1.0)
+
+
+def run(analyzer_class, bids, spreads, rate: float, fill: int) -> dict:
+    """Feed ``fill`` ticks, then time the rest; return cost and memory."""
+    times = [START + (i + 1) / rate for i in range(len(bids))]
+
+    tracemalloc.start()
+    analyzer = analyzer_class()
+    on_tick = analyzer.on_tick
+    if hasattr(analyzer, 'prefill'):
+        analyzer.prefill(times[:fill], bids[:fill], [bid + spread for bid, spread in
+                                                     zip(bids[:fill], spreads[:fill])])
+    else:
+        for i in range(fill):
+            on_tick(bids[i], bids[i] + spreads[i], 1, times[i])
+    retained = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    start = time.perf_counter()
+    for i in range(fill, len(bids)):
+        on_tick(bids[i], bids[i] + spreads[i], 1, times[i])
+    elapsed = time.perf_counter() - start
+
+    return {
+        'us_per_tick': elapsed / (len(bids) - fill) * 1e6,
+        'kb': retained / 1024,
+        'tick_ratio': analyzer.current_tick_ratio,
+        'spread_avg': analyzer.current_spread_avg,
+        'analyzer': analyzer,
+    }
+
+
+def run_batch(rate: float, hours: float) -> None:
+    """Process ``hours`` of ticks streaming and in one batch; print time and difference."""
+    n = int(rate * hours * 3600)
+    rng = np.random.default_rng(11)
+    times = START + np.cumsum(rng.exponential(1.0 / rate, n))
+    bids = 1.1 + np.cumsum(rng.normal(0, 1e-5, n))
+    asks = bids + 1e-4 * (1 + rng.exponential(0.3, n))
+
+    streaming = TickFlowAnalyzer()
+    on_tick = streaming.on_tick
+    stream = np.empty((n, 2))
+    start = time.perf_counter()
+    for i, (now, bid, ask) in enumerate(zip(times.tolist(), bids.tolist(), asks.tolist())):
+        r = on_tick(bid, ask, 1, now)
+        stream[i] = r["tick_ratio"], r["avg_spread"]
+    stream_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    batch = TickFlowAnalyzer().on_ticks(times, bids, asks)
+    batch_time = time.perf_counter() - start
+
+    ratio_diff = np.max(np.abs(batch["tick_ratio"] - stream[:, 0]))
+    spread_diff = np.max(np.abs(batch["avg_spread"] - stream[:, 1]) / stream[:, 1])
+    print(f"\n{hours:g}h of ticks ({n:,}): on_tick() loop {stream_time:.2f}s, "
+          f"on_ticks() {batch_time * 1000:.0f}ms ({stream_time / batch_time:.0f}x)")
+    print(f"max |tick ratio diff| {ratio_diff:.1e}, max relative avg spread diff {spread_diff:.1e}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[1])
+    parser.add_argument("--rate", type=float, default=50, help="ticks per second")
+    parser.add_argument("--minutes", type=float, default=15, help="window filled before timing")
+    parser.add_argument("--measure", type=int, default=2000, help="steady-state ticks timed")
+    parser.add_argument("--hours", type=float, default=24, help="ticks for the batch comparison")
+    args = parser.parse_args()
+
+    fill = int(args.rate * args.minutes * 60)
+    rng = np.random.default_rng(7)
+    bids = (1.1 + np.cumsum(rng.normal(0, 1e-5, fill + args.measure))).tolist()
+    spreads = (1e-4 * (1 + rng.exponential(0.3, fill + args.measure))).tolist()
+
+    print(f"{args.rate:g} ticks/s, {args.minutes:g}-minute window ({fill:,} ticks), "
+          f"{args.measure:,} ticks timed")
+    print(f"{'analyzer':<10}{'us/tick':>10}{'memory KB':>12}{'tick ratio':>12}{'avg spread':>14}")
+    for name, analyzer_class in (("legacy", LegacyTickFlowAnalyzer), ("buckets", TickFlowAnalyzer)):
+        r = run(analyzer_class, bids, spreads, args.rate, fill)
+        print(f"{name:<10}{r['us_per_tick']:>10.2f}{r['kb']:>12.0f}"
+              f"{r['tick_ratio']:>12.3f}{r['spread_avg']:>14.8f}")
+    rates = r['analyzer'].get_tick_rates()
+    print("tick rates: " + ", ".join(f"{window:g}s {rate:.1f}/s" for window, rate in rates.items()))
+
+    run_batch(args.rate, args.hours)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+FlashEASuite V2 - Benchmark: Tick Store Memory
+Resident tick-history memory of per-tick dicts/tuples vs NumPy rings
+
+Compares the memory needed to retain the same number of ticks per
+symbol as (a) dict ticks plus CSM-style (time, price) tuple deques and
+(b) the columnar TickStore rings, plus the per-tick write cost.
+
+Usage (from 02_Brain/):
+    python -m benchmarks.bench_tick_store [--symbols 28] [--ticks 16384]
+"""
+
+import argparse
+import time
+import tracemalloc
+from collections import deque
+
+from core.tick_store import TickStore
+
+
+def legacy_history(symbols, ticks):
+    """Per-tick dicts plus (time, price) tuples, one deque each per symbol."""
+    dict_history = {}
+    tuple_history = {}
+    for symbol in symbols:
+        dicts = deque(maxlen=ticks)
+        tuples = deque(maxlen=ticks)
+        for i in range(ticks):
+            bid = 1.1 + i * 1e-5
+            dicts.append({
+                'msg_type': 1,
+                'timestamp': 1_700_000_000_000 + i,
+                'symbol': symbol,
+                'bid': bid,
+                'ask': bid + 2e-5,
+            })
+            tuples.append(((1_700_000_000_000 + i) / 1000.0, bid))
+        dict_history[symbol] = dicts
+        tuple_history[symbol] = tuples
+    return dict_history, tuple_history
+
+
+def ring_history(symbols, ticks):
+    """Same ticks written once into the columnar TickStore."""
+    store = TickStore(capacity=ticks)
+    for symbol in symbols:
+        for i in range(ticks):
+            bid = 1.1 + i * 1e-5
+            store.append(symbol, 1_700_000_000_000 + i, bid, bid + 2e-5, 6, i)
+    return store
+
+
+def measure(builder, symbols, ticks):
+    """Return (bytes retained, ns per tick) for a history builder."""
+    tracemalloc.start()
+    start = time.perf_counter_ns()
+    history = builder(symbols, ticks)
+    elapsed = time.perf_counter_ns() - start
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del history
+    return current, elapsed / (len(symbols) * ticks)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[1])
+    parser.add_argument("--symbols", type=int, default=28,
+                        help="number of symbols (default: 28)")
+    parser.add_argument("--ticks", type=int, default=16384,
+                        help="ticks retained per symbol (default: 16384)")
+    args = parser.parse_args()
+
+    symbols = [f"SYM{i:03d}" for i in range(args.symbols)]
+
+    print("=" * 60)
+    print(f"Tick history: {args.symbols} symbols x {args.ticks} ticks")
+    print("=" * 60)
+
+    legacy_bytes, legacy_ns = measure(legacy_history, symbols, args.ticks)
+    print(f"dict + tuple deques: {legacy_bytes / 1e6:>8.1f} MB "
+          f"({legacy_ns:,.0f} ns/tick tracemalloc'd)")
+
+    ring_bytes, ring_ns = measure(ring_history, symbols, args.ticks)
+    print(f"NumPy tick rings:    {ring_bytes / 1e6:>8.1f} MB "
+          f"({ring_ns:,.0f} ns/tick tracemalloc'd)")
+
+    print(f"Memory reduction: {legacy_bytes / ring_bytes:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
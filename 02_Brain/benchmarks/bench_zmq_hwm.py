@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+FlashEASuite V2 - Benchmark: SUB Socket HWM Under Burst Load
+Tick loss at the ingestion SUB socket with ZMQ defaults vs config.py options
+
+A fake Feeder (PUB, default SNDHWM 1000, non-blocking sends like the MQL5
+Feeder) streams ticks at a real ingestion worker while the worker is
+stalled for a while, the way a GIL-heavy strategy pass, a GC pause or a
+slow log write stalls it in production. Everything the Feeder sends
+during the stall has to fit into the socket buffers (Feeder SNDHWM +
+kernel buffers + Brain RCVHWM); the rest is dropped by ZMQ and never
+reaches the decoder.
+
+    defaults    SUB socket with ZMQ defaults (RCVHWM 1000, OS buffers)
+    configured  SUB socket with ZMQ_SUB_HWM / ZMQ_SUB_RCVBUF from config.py
+
+Usage (from 02_Brain/):
+    python -m benchmarks.bench_zmq_hwm [--stalls 1000 2000] [--rate 50000] [--repeat 2]
+"""
+
+import argparse
+import contextlib
+import io
+import threading
+import time
+
+import msgpack
+import zmq
+
+import config
+from core.ingestion import create_ingestion_worker_threaded
+from core.mailbox import ConflatingMailbox
+from core.sockets import TICK_SUB, SocketFactory, SocketOptions
+from core.tick_store import TickStore
+
+SYMBOLS = ["EURUSD", "GBPUSD", "USDJPY", "XAUUSD"]
+SUB_ADDRESS = "tcp://127.0.0.1:27797"
+
+PROFILES = {
+    'defaults': SocketOptions(rcvtimeo=100),
+    'configured': SocketOptions(rcvtimeo=100, rcvhwm=config.ZMQ_SUB_HWM,
+                                rcvbuf=config.ZMQ_SUB_RCVBUF),
+}
+
+
+class _StallableMailbox(ConflatingMailbox):
+    """Mailbox whose put() waits while the gate is closed (stalls ingestion)."""
+
+    def __init__(self):
+        super().__init__(name='Ingestion')
+        self.gate = threading.Event()
+        self.gate.set()
+
+    def put(self, tick, block=True, timeout=None):
+        self.gate.wait()
+        super().put(tick, block, timeout)
+
+
+def run_stall(options: SocketOptions, stall_ms: int, rate: int) -> dict:
+    """Stream ticks through a fresh ingestion worker across one stall."""
+    shutdown_event = threading.Event()
+    sockets = SocketFactory(options={TICK_SUB: options})
+    mailbox = _StallableMailbox()
+
+    # Stall plus the same time again to drain
+    total = rate * stall_ms * 2 // 1000
+    frames = [msgpack.packb([1, i + 1, 1_700_000_000_000 + i, SYMBOLS[i % 4],
+                             1.1 + i * 1e-6, 1.1002 + i * 1e-6, 6])
+              for i in range(total)]
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        worker = create_ingestion_worker_threaded(
+            mailbox, shutdown_event, SUB_ADDRESS, tick_store=TickStore(), sockets=sockets)
+        worker.start()
+
+        context = zmq.Context()
+        pub = context.socket(zmq.PUB)          # Feeder defaults: SNDHWM 1000
+        pub.connect(SUB_ADDRESS)
+
+        # Wait until the subscription has reached the PUB (slow joiner)
+        warmup = msgpack.packb([1, 0, 0, SYMBOLS[0], 1.1, 1.1002, 6])
+        while worker.message_count == 0:
+            pub.send(warmup)
+            time.sleep(0.01)
+        time.sleep(0.2)
+        baseline = worker.message_count
+
+        # Stall the worker on its next tick, resume it after stall_ms
+        mailbox.gate.clear()
+        threading.Timer(stall_ms / 1000.0, mailbox.gate.set).start()
+
+        # Send in 1 ms slices at the requested rate
+        per_slice = max(1, rate // 1000)
+        start = time.perf_counter()
+        for i in range(0, total, per_slice):
+            for frame in frames[i:i + per_slice]:
+                pub.send(frame, zmq.NOBLOCK)    # PUB drops when the pipe is full
+            delay = start + (i + per_slice) / rate - time.perf_counter()
+            if delay > 0:
+                time.sleep(delay)
+
+        # Wait for the worker to drain
+        last = -1
+        while worker.message_count != last:
+            last = worker.message_count
+            time.sleep(0.3)
+
+        shutdown_event.set()
+        worker.join(timeout=3.0)
+        pub.close(linger=0)
+        context.term()
+        sockets.close()
+
+    received = worker.message_count - baseline
+    return {'sent': total, 'received': received, 'lost': total - received}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[1])
+    parser.add_argument("--stalls", type=int, nargs="+", default=[1000, 2000],
+                        help="Ingestion stall lengths (ms)")
+    parser.add_argument("--rate", type=int, default=50_000, help="Feeder send rate (ticks/s)")
+    parser.add_argument("--repeat", type=int, default=2)
+    args = parser.parse_args()
+
+    print(f"config: ZMQ_SUB_HWM={config.ZMQ_SUB_HWM}, ZMQ_SUB_RCVBUF={config.ZMQ_SUB_RCVBUF}, "
+          f"Feeder rate {args.rate:,} ticks/s")
+    print(f"{'profile':<12}{'stall ms':>9}{'sent':>9}{'received':>10}{'lost':>8}{'loss %':>9}")
+    for stall_ms in args.stalls:
+        for name, options in PROFILES.items():
+            results = [run_stall(options, stall_ms, args.rate) for _ in range(args.repeat)]
+            sent = results[0]['sent']
+            received = sum(r['received'] for r in results) / len(results)
+            lost = sum(r['lost'] for r in results) / len(results)
+            print(f"{name:<12}{stall_ms:>9}{sent:>9}{received:>10.0f}{lost:>8.0f}"
+                  f"{lost / sent * 100:>8.2f}%")
+
+
+if __name__ == "__main__":
+    main()
@@ -18,17 +18,33 @@ ZMQ_EXECUTION_PORT = 7778       # Publish to MQL5 Execution Client
 ZMQ_FEEDER_ADDRESS = "tcp://*:7777"
 ZMQ_EXECUTION_ADDRESS = "tcp://*:7778"
 
-# ZMQ Performance Settings
+# ZMQ Performance Settings (applied by core/sockets.py, see main.socket_options)
+ZMQ_IO_THREADS = 1             # I/O threads of the shared context (~1 per Gbit/s)
 ZMQ_SUB_HWM = 10000            # High Water Mark for SUB socket (prevent buffer overflow)
 ZMQ_PUB_HWM = 10000            # High Water Mark for PUB socket
 ZMQ_LINGER_MS = 1000           # Time to wait for pending messages on close (ms)
-ZMQ_RCVTIMEO_MS = 100          # Receive timeout (ms) - for non-blocking operations
+ZMQ_RCVTIMEO_MS = 100          # Receive timeout (ms) - bounds the workers' shutdown check
 ZMQ_SNDTIMEO_MS = 100          # Send timeout (ms)
+ZMQ_SUB_RCVBUF = 4 * 1024 * 1024   # Kernel receive buffer for ticks (bytes, None = OS default)
+ZMQ_PUB_SNDBUF = None          # Kernel send buffer for policies (bytes, None = OS default)
+ZMQ_SUB_CONFLATE = False       # Keep only the newest tick on the SUB socket
+                               # (drops other symbols' ticks: single-symbol feeds only)
+
+# TCP keepalive (detects dead Feeder/Trader links through NAT/firewalls)
+ZMQ_TCP_KEEPALIVE = True
+ZMQ_TCP_KEEPALIVE_IDLE_S = 60  # Idle seconds before the first probe
+ZMQ_TCP_KEEPALIVE_INTVL_S = 10 # Seconds between probes
 
 # Reconnection Settings
 ZMQ_RECONNECT_IVL_MS = 100     # Reconnection interval (ms)
 ZMQ_RECONNECT_IVL_MAX_MS = 5000  # Max reconnection interval (ms)
 
+# CurveZMQ: encryption + client authentication on all three Brain sockets.
+# The Feeder and Trader must load the same keys (Include/Security.mqh).
+# Costs throughput and latency: see benchmarks/bench_curve.py
+CURVE_ENABLED = False
+CURVE_KEYS_DIR = "../00_Common/Keys"   # Relative to 02_Brain/
+
 # ============================================================================
 # MULTIPROCESSING SETTINGS
 # ============================================================================
@@ -36,11 +52,62 @@ ZMQ_RECONNECT_IVL_MAX_MS = 5000  # Max reconnection interval (ms)
 # Queue Sizes (to prevent memory issues)
 INGESTION_QUEUE_SIZE = 50000    # Max items in ingestion queue
 SIGNAL_QUEUE_SIZE = 10000       # Max items in signal queue
+FEEDBACK_QUEUE_SIZE = 1000      # Max items in feedback (trade result) queue
+
+# Ingestion handoff: "mailbox" = latest tick per symbol (core/mailbox.py),
+# "queue" = every tick through a BoundedQueue with INGESTION_QUEUE_POLICY,
+# "spsc" = every tick through a lock-free SPSC ring (core/spsc_ring.py)
+INGESTION_QUEUE_MODE = "mailbox"
+SPSC_WAKEUP = "event"           # Idle engine wakeup: "event" or "eventfd" (Linux)
+
+# Stage handoff transport (threaded mode): "queue" = the queues/mailbox
+# above (fastest in one process), "zmq" = ZMQ PUSH/PULL links (core/links.py)
+# at these addresses, for stages split across processes (ipc://) or hosts (tcp://)
+STAGE_TRANSPORT = "queue"
+INGESTION_LINK_ADDRESS = "inproc://brain.ingestion"
+FEEDBACK_LINK_ADDRESS = "inproc://brain.feedback"
+STAGE_LINK_HWM = 25000          # Per end: a link holds up to 2x this many items
+
+# Backpressure policy when a queue is full (core/queues.py):
+# "block", "drop_oldest", "drop_newest", "conflate" (latest per symbol,
+# INGESTION_QUEUE_POLICY only: signals and trade results have no symbol key)
+INGESTION_QUEUE_POLICY = "drop_oldest"  # Stale ticks are worth less than fresh ones
+SIGNAL_QUEUE_POLICY = "drop_oldest"
+FEEDBACK_QUEUE_POLICY = "block"         # Never drop trade results
+
+# Runtime mode (override with: python main.py --mode reactor)
+# "threaded" = ingestion / strategy / execution listener threads + queues
+# "reactor"  = one thread polling SUB + PULL with zmq.Poller (core/reactor.py)
+# "asyncio"  = coroutines on zmq.asyncio sockets, one event loop (core/async_brain.py)
+# "process"  = ingestion in its own process, ticks via shared memory (core/shm_ring.py)
+BRAIN_MODE = "threaded"
 
 # Worker Configuration
 INGESTION_WORKER_COUNT = 1      # Single ingestion worker (ZMQ serialization)
 STRATEGY_WORKER_COUNT = 1       # Single strategy worker for now
 
+# Process mode: ingestion process -> strategy process tick ring (SPSC)
+SHM_RING_CAPACITY = 65536       # Tick records in shared memory (power of two, 64 bytes each)
+
+# ============================================================================
+# TICK STORAGE
+# ============================================================================
+
+# Per-symbol columnar ring buffers (core/tick_store.py)
+TICK_RING_CAPACITY = 16384      # Ticks retained per symbol (~36 bytes/tick, x2 mirrored)
+
+# ============================================================================
+# TICK JOURNAL
+# ============================================================================
+
+# Raw Feeder frames recorded to disk (core/journal.py), replayable later
+JOURNAL_ENABLED = False
+JOURNAL_DIR = "journal"             # Relative to 02_Brain/
+JOURNAL_PREFIX = "ticks"            # Segments: ticks-YYYYMMDD-NNNN.journal
+JOURNAL_MAX_SEGMENT_MB = 256        # Rotate by size (also rotates every UTC day)
+JOURNAL_BLOCK_FRAMES = 1024         # Frames per index entry (first SEQ_ID/time)
+JOURNAL_FLUSH_INTERVAL = 1.0        # Max seconds of frames held in the write buffer
+
 # ============================================================================
 # RISK MANAGEMENT CONSTANTS
 # ============================================================================
@@ -76,20 +143,30 @@ HIGH_CONFIDENCE_THRESHOLD = 0.85  # Threshold for high-confidence trades
 # ============================================================================
 
 LOG_LEVEL = "INFO"              # DEBUG, INFO, WARNING, ERROR, CRITICAL
-LOG_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
-LOG_FILE = "logs/flashea_brain.log"
+LOG_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"   # Console
+LOG_FILE = "logs/flashea_brain.log"   # JSON lines (None = console only)
+LOG_FILE_MAX_MB = 64            # Rotate the log file at this size
+LOG_FILE_BACKUP_COUNT = 5       # Rotated log files to keep
+LOG_RATE_LIMIT_SECONDS = 10.0   # Repeated hot-path messages: at most one per key per N seconds
 
 # Performance Monitoring
 ENABLE_PERFORMANCE_LOGGING = True
 PERFORMANCE_LOG_INTERVAL = 60   # Log performance metrics every N seconds
+LATENCY_TRACKING = True         # Per-stage tick latency histograms (Feeder -> policy)
 
 # ============================================================================
 # SYSTEM CONSTANTS
 # ============================================================================
 
-# Symbols (can be expanded)
+# Symbols (can be expanded): each gets a Grid policy every cycle, as does
+# any other symbol the Feeder streams while it is active
 SUPPORTED_SYMBOLS = ["EURUSD", "GBPUSD", "USDJPY", "XAUUSD"]
 
+# Policy payload encoding (00_Common/ProtocolSpecs.md, section 3):
+# "compact" = versioned fixed-position msgpack arrays (~3x smaller)
+# "verbose" = msgpack maps with long keys, for Traders that predate it
+POLICY_ENCODING = "compact"
+
 # Shutdown
 GRACEFUL_SHUTDOWN_TIMEOUT = 5.0  # Seconds to wait for graceful shutdown
 
@@ -0,0 +1,344 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+FlashEASuite V2 - Async Brain (asyncio Mode)
+Ingestion, strategy and feedback as coroutines on zmq.asyncio sockets
+
+Each Feeder SUB socket and each Trader PULL socket gets its own
+coroutine, so adding feeds or traders adds tasks, not threads. Periodic
+jobs (Grid policy, dashboard, tick loss report) run on the strategy's
+timer wheel, driven by one loop.call_later that is re-armed for the next
+deadline, and shutdown is task cancellation. The latency report (when
+enabled) is one more periodic job.
+"""
+
+import asyncio
+import time
+from typing import Any, Dict, List, Optional, Sequence, Union
+
+import zmq
+import zmq.asyncio
+
+from .execution_listener import parse_trade_result, log_trade_result
+from .journal import TickJournal
+from .latency import DECODE, LatencyRecorder
+from .log import get_logger
+from .sockets import POLICY_PUB, RESULT_PULL, TICK_SUB, SocketFactory, get_socket_factory
+from .strategy.engine import StrategyCore
+from .tick_codec import TickDecoder
+from .tick_store import TickStore
+
+logger = get_logger("async")
+
+
+class AsyncBrain(StrategyCore):
+    """
+    The whole Brain pipeline on one asyncio event loop.
+
+    Ticks already queued on a SUB socket when its coroutine wakes are
+    drained in one batch and conflated per symbol (like the reactor), so
+    each symbol is analyzed at most once per wake-up.
+    """
+
+    TICK_BATCH_SIZE = 1000          # Max ticks drained per wake-up
+    MONITOR_INTERVAL = 5.0          # Tick loss report every 5 seconds
+
+    def __init__(
+        self,
+        zmq_sub_addresses: Union[str, Sequence[str]] = "tcp://127.0.0.1:7777",
+        zmq_pub_address: str = "tcp://127.0.0.1:7778",
+        zmq_pull_addresses: Union[str, Sequence[str]] = "tcp://127.0.0.1:7779",
+        tick_store: Optional[TickStore] = None,
+        journal: Optional[TickJournal] = None,
+        latency: Optional[LatencyRecorder] = None,
+        latency_report_interval: float = 60.0,
+        sockets: Optional[SocketFactory] = None,
+        grid_symbols: Optional[Sequence[str]] = None,
+        policy_encoding: str = 'compact'
+    ):
+        """
+        Initialize Async Brain.
+
+        Args:
+            zmq_sub_addresses: Feeder tick address(es) (bind)
+            zmq_pub_address: ZMQ address to publish policies (bind)
+            zmq_pull_addresses: Trade result address(es) (bind)
+            tick_store: Per-symbol tick rings (created if None)
+            journal: Raw frame journal (None = don't record)
+            latency: Stage latency histograms (None = don't stamp ticks)
+            latency_report_interval: Seconds between latency reports
+            sockets: Socket factory (default: the shared one)
+            grid_symbols: Symbols that always get a Grid policy
+            policy_encoding: Policy payload encoding ('compact' or 'verbose')
+        """
+        super().__init__(tick_store if tick_store is not None else TickStore(), latency,
+                         grid_symbols, policy_encoding)
+
+        if isinstance(zmq_sub_addresses, str):
+            zmq_sub_addresses = [zmq_sub_addresses]
+        if isinstance(zmq_pull_addresses, str):
+            zmq_pull_addresses = [zmq_pull_addresses]
+
+        self.zmq_sub_addresses = list(zmq_sub_addresses)
+        self.zmq_pub_address = zmq_pub_address
+        self.zmq_pull_addresses = list(zmq_pull_addresses)
+
+        # ZMQ: asyncio view of the shared context (PUB is a plain socket:
+        # sends never wait)
+        self.sockets = sockets or get_socket_factory()
+        self.context = None
+        self.sub_sockets: List[zmq.asyncio.Socket] = []
+        self.pull_sockets: List[zmq.asyncio.Socket] = []
+
+        self.decoder = TickDecoder()
+        self.journal = journal
+        self.latency_report_interval = latency_report_interval
+
+        # Pending call_later for the next timer wheel deadline
+        self._timer_handle: Optional[asyncio.TimerHandle] = None
+        self._last_seq_stats = {}
+
+        # Statistics
+        self.message_count = 0
+        self.feedback_count = 0
+        self.error_count = 0
+
+    def _setup_zmq(self) -> bool:
+        """Setup PUB, SUB and PULL sockets on the shared context."""
+        try:
+            self.context = zmq.asyncio.Context.shadow(self.sockets.context)
+
+            self.pub_socket = self.sockets.socket(POLICY_PUB, self.zmq_pub_address)
+
+            # Coroutines await recv(): no receive timeout
+            for address in self.zmq_sub_addresses:
+                self.sub_sockets.append(self.sockets.socket(
+                    TICK_SUB, address, context=self.context, rcvtimeo=None))
+
+            for address in self.zmq_pull_addresses:
+                self.pull_sockets.append(self.sockets.socket(
+                    RESULT_PULL, address, context=self.context, rcvtimeo=None))
+
+            print(f"📤 ASYNC: Publishing policies on {self.zmq_pub_address}")
+            print(f"📥 ASYNC: Ticks on {', '.join(self.zmq_sub_addresses)}, "
+                  f"trade results on {', '.join(self.zmq_pull_addresses)}")
+            return True
+
+        except Exception as e:
+            print(f"❌ ASYNC: Failed to setup ZMQ: {e}")
+            return False
+
+    def get_sequence_stats(self) -> Dict[str, Any]:
+        """
+        Get SEQ_ID loss counters (gaps, duplicates, reorders per Feeder).
+
+        Returns:
+            Decoder statistics dictionary
+        """
+        return self.decoder.get_stats()
+
+    # --- Coroutines ---
+
+    async def _ingest(self, sock: zmq.asyncio.Socket, feeder: str) -> None:
+        """
+        Receive ticks from one Feeder socket until cancelled.
+
+        Args:
+            sock: SUB socket
+            feeder: Feeder name for SEQ_ID tracking (its address)
+        """
+        decode = self.decoder.decode
+        store = self.tick_store
+        journal = self.journal
+        latency = self.latency
+        stamp_wall = journal is not None or latency is not None
+
+        while True:
+            raw_data = await sock.recv()
+            latest = {}
+            counts = {}
+            received = 0
+
+            while True:
+                received += 1
+                recv_ns = time.perf_counter_ns() if latency is not None else 0
+                wall_ns = time.time_ns() if stamp_wall else 0
+                try:
+                    tick = decode(raw_data, feeder, recv_ns)
+                except ValueError as e:
+                    logger.warning("⚠️ ASYNC: Parse error: %s", e,
+                                   extra={'rate_key': 'async.parse_error'})
+                    self.error_count += 1
+                    if journal is not None:
+                        journal.append(raw_data, wall_ns)
+                else:
+                    if journal is not None:
+                        journal.append(raw_data, wall_ns, tick.seq, tick.time_msc)
+                    if latency is not None:
+                        latency.record(DECODE, recv_ns)
+                        latency.record_wire(tick.time_msc, wall_ns // 1_000_000)
+                    store.append(tick.symbol, tick.time_msc, tick.bid, tick.ask,
+                                 tick.flags, tick.seq)
+                    latest[tick.symbol] = tick
+                    counts[tick.symbol] = counts.get(tick.symbol, 0) + 1
+
+                if received >= self.TICK_BATCH_SIZE:
+                    break
+                try:
+                    raw_data = await sock.recv(zmq.NOBLOCK)
+                except zmq.Again:
+                    break
+
+            self.message_count += received
+
+            for symbol, tick in latest.items():
+                self._process_tick(tick, counts[symbol])
+
+    async def _listen_feedback(self, sock: zmq.asyncio.Socket) -> None:
+        """
+        Receive trade results from one Trader socket until cancelled.
+
+        Args:
+            sock: PULL socket
+        """
+        while True:
+            raw_data = await sock.recv()
+            result = parse_trade_result(raw_data)
+            if result:
+                self.feedback_count += 1
+                log_trade_result(result, self.feedback_count)
+                self.feedback_processor.process_feedback(result)
+                # Feedback may have scheduled an earlier job (cooldown expiry)
+                self._arm_timers()
+
+    # --- Periodic jobs ---
+
+    def _schedule_jobs(self) -> None:
+        """Register the strategy jobs plus the tick loss and latency reports."""
+        super()._schedule_jobs()
+        self.timers.schedule_periodic('sequence_loss', self.MONITOR_INTERVAL,
+                                      self._report_sequence_loss)
+        if self.latency is not None:
+            self.timers.schedule_periodic('latency', self.latency_report_interval,
+                                          self.latency.print_report)
+
+    def _arm_timers(self) -> None:
+        """(Re)schedule the wheel driver for the next deadline."""
+        if self._timer_handle is not None:
+            self._timer_handle.cancel()
+        delay = self.timers.time_until_next(self.MONITOR_INTERVAL)
+        self._timer_handle = asyncio.get_running_loop().call_later(delay, self._fire_timers)
+
+    def _fire_timers(self) -> None:
+        self.timers.run_due()
+        self._arm_timers()
+
+    def _report_sequence_loss(self) -> None:
+        """Print per-Feeder tick loss counters when they change."""
+        for feeder, stats in self.decoder.get_stats()['feeders'].items():
+            counters = (stats['lost'], stats['duplicates'],
+                        stats['reorders'], stats['resets'])
+            if counters == self._last_seq_stats.get(feeder, (0, 0, 0, 0)):
+                continue
+
+            self._last_seq_stats[feeder] = counters
+            print(f"⚠️ Tick loss [{feeder}]: Lost={stats['lost']} "
+                  f"({stats['loss_rate'] * 100:.3f}%) in {stats['gaps']} gaps, "
+                  f"Duplicates={stats['duplicates']}, "
+                  f"Reordered={stats['reorders']}, Resets={stats['resets']}")
+
+    # --- Lifecycle ---
+
+    async def run(self) -> None:
+        """
+        Run the Brain until this coroutine is cancelled.
+
+        Raises:
+            RuntimeError: If the sockets could not be set up
+        """
+        print("🔄 ASYNC BRAIN: Started (asyncio mode)")
+
+        if not self._setup_zmq():
+            self._close()
+            raise RuntimeError("Failed to initialize Async Brain sockets")
+
+        tasks = [
+            asyncio.create_task(self._ingest(sock, address), name=f"ingest:{address}")
+            for sock, address in zip(self.sub_sockets, self.zmq_sub_addresses)
+        ]
+        tasks += [
+            asyncio.create_task(self._listen_feedback(sock), name=f"feedback:{address}")
+            for sock, address in zip(self.pull_sockets, self.zmq_pull_addresses)
+        ]
+
+        self._schedule_jobs()
+        self._arm_timers()
+
+        try:
+            # Returns only if a task fails; cancellation ends the Brain
+            await asyncio.gather(*tasks)
+
+        finally:
+            if self._timer_handle is not None:
+                self._timer_handle.cancel()
+                self._timer_handle = None
+
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+            print(f"\n🛑 ASYNC BRAIN: Shutting down "
+                  f"(Received: {self.message_count}, Ticks: {self.tick_count}, "
+                  f"Policies: {self.policy_count}, Lost: {self.decoder.total_lost()})")
+            self._close()
+            print("✅ ASYNC BRAIN: Stopped")
+
+    def _close(self) -> None:
+        """Close all sockets (the shared context is terminated by the owner)."""
+        for sock in self.sub_sockets + self.pull_sockets + [self.pub_socket]:
+            if sock:
+                sock.close()
+
+
+def create_async_brain(
+    zmq_sub_addresses: Union[str, Sequence[str]] = "tcp://127.0.0.1:7777",
+    zmq_pub_address: str = "tcp://127.0.0.1:7778",
+    zmq_pull_addresses: Union[str, Sequence[str]] = "tcp://127.0.0.1:7779",
+    tick_store: Optional[TickStore] = None,
+    journal: Optional[TickJournal] = None,
+    latency: Optional[LatencyRecorder] = None,
+    latency_report_interval: float = 60.0,
+    sockets: Optional[SocketFactory] = None,
+    grid_symbols: Optional[Sequence[str]] = None,
+    policy_encoding: str = 'compact'
+) -> AsyncBrain:
+    """
+    Factory function to create the asyncio Brain.
+
+    Args:
+        zmq_sub_addresses: Feeder tick address(es)
+        zmq_pub_address: Policy publish address
+        zmq_pull_addresses: Trade result address(es)
+        tick_store: Per-symbol tick rings
+        journal: Raw frame journal (optional)
+        latency: Stage latency histograms (optional)
+        latency_report_interval: Seconds between latency reports
+        sockets: Socket factory (default: the shared one)
+        grid_symbols: Symbols that always get a Grid policy
+        policy_encoding: Policy payload encoding ('compact' or 'verbose')
+
+    Returns:
+        AsyncBrain instance (run with ``await brain.run()``)
+    """
+    return AsyncBrain(
+        zmq_sub_addresses=zmq_sub_addresses,
+        zmq_pub_address=zmq_pub_address,
+        zmq_pull_addresses=zmq_pull_addresses,
+        tick_store=tick_store,
+        journal=journal,
+        latency=latency,
+        latency_report_interval=latency_report_interval,
+        sockets=sockets,
+        grid_symbols=grid_symbols,
+        policy_encoding=policy_encoding
+    )
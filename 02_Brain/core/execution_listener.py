@@ -15,6 +15,117 @@ import time
 from typing import Dict, Any, Optional
 from datetime import datetime
 
+from .log import get_logger
+from .sockets import RESULT_PULL, SocketFactory, get_socket_factory
+
+logger = get_logger("execution")
+
+
+def parse_trade_result(raw_data: bytes) -> Optional[Dict[str, Any]]:
+    """
+    Parse MessagePack trade result.
+
+    Format (12 fields):
+    [0] msg_type: 100 (TRADE_RESULT)
+    [1] timestamp: milliseconds
+    [2] ticket: position ticket
+    [3] symbol: "XAUUSD"
+    [4] type: 0=BUY, 1=SELL
+    [5] volume: lot size
+    [6] open_price: entry price
+    [7] sl: stop loss
+    [8] tp: take profit
+    [9] profit: P&L
+    [10] magic: magic number
+    [11] comment: order comment
+
+    Args:
+        raw_data: Raw binary data
+
+    Returns:
+        Parsed result dictionary or None if invalid
+    """
+    try:
+        data = msgpack.unpackb(raw_data, raw=False)
+
+        # Validate format
+        if not isinstance(data, list) or len(data) < 12:
+            logger.warning("⚠️ Invalid data format: Expected 12 fields, got %d", len(data),
+                           extra={'rate_key': 'execution.invalid'})
+            return None
+
+        # Extract fields
+        result = {
+            'msg_type': int(data[0]),
+            'timestamp': int(data[1]),
+            'ticket': int(data[2]),
+            'symbol': str(data[3]),
+            'type': int(data[4]),
+            'volume': float(data[5]),
+            'open_price': float(data[6]),
+            'sl': float(data[7]),
+            'tp': float(data[8]),
+            'profit': float(data[9]),
+            'magic': int(data[10]),
+            'comment': str(data[11]),
+        }
+
+        # Add computed fields
+        result['is_win'] = result['profit'] > 0
+        result['is_loss'] = result['profit'] < 0
+        result['datetime'] = datetime.fromtimestamp(result['timestamp'] / 1000.0)
+
+        return result
+
+    except Exception as e:
+        logger.warning("⚠️ EXECUTION LISTENER: Parse error: %s", e,
+                       extra={'rate_key': 'execution.parse_error'})
+        return None
+
+
+def log_trade_result(result: Dict[str, Any], message_number: int) -> None:
+    """
+    Log trade result as one structured record.
+
+    Args:
+        result: Parsed trade result
+        message_number: Running message count (for display)
+    """
+    # Determine result type
+    if result['is_win']:
+        emoji = "💚"
+        result_type = "WIN"
+    elif result['is_loss']:
+        emoji = "💔"
+        result_type = "LOSS"
+    else:
+        emoji = "⚪"
+        result_type = "BREAKEVEN"
+
+    side = 'BUY' if result['type'] == 0 else 'SELL'
+    logger.info(
+        "📥 [Message #%d] Trade Result: #%d %s %s %.2f @ %.2f (SL %.2f, TP %.2f) "
+        "Profit %.2f %s %s | Magic %d | %s",
+        message_number, result['ticket'], side, result['symbol'], result['volume'],
+        result['open_price'], result['sl'], result['tp'], result['profit'], emoji,
+        result_type, result['magic'], result['comment'],
+        extra={'fields': {
+            'event': 'trade_result',
+            'message': message_number,
+            'trade_time': result['datetime'].isoformat(timespec='milliseconds'),
+            'ticket': result['ticket'],
+            'symbol': result['symbol'],
+            'side': side,
+            'volume': result['volume'],
+            'open_price': result['open_price'],
+            'sl': result['sl'],
+            'tp': result['tp'],
+            'profit': result['profit'],
+            'result': result_type,
+            'magic': result['magic'],
+            'comment': result['comment'],
+        }})
+
 
 class ExecutionListenerThreaded(threading.Thread):
     """
@@ -24,11 +135,14 @@ class ExecutionListenerThreaded(threading.Thread):
     and forwards to Strategy Engine via thread-safe queue (Feedback Loop).
     """
     
+    QUEUE_PUT_TIMEOUT = 1.0  # Max wait for space in a full feedback queue
+    
     def __init__(
         self,
         feedback_queue: queue.Queue,
         shutdown_event: threading.Event,
-        zmq_pull_address: str = "tcp://127.0.0.1:7779"
+        zmq_pull_address: str = "tcp://127.0.0.1:7779",
+        sockets: Optional[SocketFactory] = None
     ):
         """
         Initialize Execution Listener.
@@ -37,6 +151,7 @@ class ExecutionListenerThreaded(threading.Thread):
             feedback_queue: Thread-safe queue to forward feedback
             shutdown_event: Event to signal shutdown
             zmq_pull_address: ZMQ address to pull from
+            sockets: Socket factory (default: the shared one)
         """
         super().__init__(name="ExecutionListener")
         self.feedback_queue = feedback_queue
@@ -44,7 +159,7 @@ class ExecutionListenerThreaded(threading.Thread):
         self.zmq_pull_address = zmq_pull_address
         
         # ZMQ socket (will be created in run())
-        self.context = None
+        self.sockets = sockets or get_socket_factory()
         self.pull_socket = None
         
         # Statistics
@@ -59,10 +174,8 @@ class ExecutionListenerThreaded(threading.Thread):
             True if successful, False otherwise
         """
         try:
-            self.context = zmq.Context()
-            self.pull_socket = self.context.socket(zmq.PULL)
-            self.pull_socket.bind(self.zmq_pull_address)
-            self.pull_socket.setsockopt(zmq.RCVTIMEO, 1000)  # 1 second timeout
+            # Bind with role options (RCVTIMEO bounds the shutdown check)
+            self.pull_socket = self.sockets.socket(RESULT_PULL, self.zmq_pull_address)
             
             print(f"📥 EXECUTION LISTENER: Ready to receive trade results on {self.zmq_pull_address}")
             return True
@@ -72,97 +185,12 @@ class ExecutionListenerThreaded(threading.Thread):
             return False
     
     def _parse_trade_result(self, raw_data: bytes) -> Optional[Dict[str, Any]]:
-        """
-        Parse MessagePack trade result.
-        
-        Format (12 fields):
-        [0] msg_type: 100 (TRADE_RESULT)
-        [1] timestamp: milliseconds
-        [2] ticket: position ticket
-        [3] symbol: "XAUUSD"
-        [4] type: 0=BUY, 1=SELL
-        [5] volume: lot size
-        [6] open_price: entry price
-        [7] sl: stop loss
-        [8] tp: take profit
-        [9] profit: P&L
-        [10] magic: magic number
-        [11] comment: order comment
-        
-        Args:
-            raw_data: Raw binary data
-            
-        Returns:
-            Parsed result dictionary or None if invalid
-        """
-        try:
-            data = msgpack.unpackb(raw_data, raw=False)
-            
-            # Validate format
-            if not isinstance(data, list) or len(data) < 12:
-                print(f"⚠️ Invalid data format: Expected 12 fields, got {len(data)}")
-                return None
-            
-            # Extract fields
-            result = {
-                'msg_type': int(data[0]),
-                'timestamp': int(data[1]),
-                'ticket': int(data[2]),
-                'symbol': str(data[3]),
-                'type': int(data[4]),
-                'volume': float(data[5]),
-                'open_price': float(data[6]),
-                'sl': float(data[7]),
-                'tp': float(data[8]),
-                'profit': float(data[9]),
-                'magic': int(data[10]),
-                'comment': str(data[11]),
-            }
-            
-            # Add computed fields
-            result['is_win'] = result['profit'] > 0
-            result['is_loss'] = result['profit'] < 0
-            result['datetime'] = datetime.fromtimestamp(result['timestamp'] / 1000.0)
-            
-            return result
-            
-        except Exception as e:
-            print(f"⚠️ EXECUTION LISTENER: Parse error: {e}")
-            return None
+        """Parse MessagePack trade result (see parse_trade_result)."""
+        return parse_trade_result(raw_data)
     
     def _log_trade_result(self, result: Dict[str, Any]) -> None:
-        """
-        Log trade result to console.
-        
-        Args:
-            result: Parsed trade result
-        """
-        # Determine result type
-        if result['is_win']:
-            emoji = "💚"
-            result_type = "WIN"
-        elif result['is_loss']:
-            emoji = "💔"
-            result_type = "LOSS"
-        else:
-            emoji = "⚪"
-            result_type = "BREAKEVEN"
-        
-        print("=" * 60)
-        print(f"📥 [Message #{self.message_count}] Trade Result Received!")
-        print("=" * 60)
-        print(f"   🕐 Time:       {result['datetime'].strftime('%Y-%m-%d %H:%M:%S.%f')[:-3]}")
-        print(f"   🎫 Ticket:     {result['ticket']}")
-        print(f"   📊 Symbol:     {result['symbol']}")
-        print(f"   📈 Type:       {'BUY' if result['type'] == 0 else 'SELL'}")
-        print(f"   📦 Volume:     {result['volume']:.2f}")
-        print(f"   💰 Entry:      {result['open_price']:.2f}")
-        print(f"   🛑 SL:         {result['sl']:.2f}")
-        print(f"   🎯 TP:         {result['tp']:.2f}")
-        print(f"   💵 Profit:     {result['profit']:.2f} {emoji} {result_type}")
-        print(f"   🔮 Magic:      {result['magic']}")
-        print(f"   💬 Comment:    {result['comment']}")
-        print("=" * 60)
+        """Log trade result (see log_trade_result)."""
+        log_trade_result(result, self.message_count)
     
     def run(self) -> None:
         """Main worker loop."""
@@ -185,23 +213,25 @@ class ExecutionListenerThreaded(threading.Thread):
                     if result:
                         self.message_count += 1
                         
-                        # Log to console
+                        # Log (queued, written by the log listener thread)
                         self._log_trade_result(result)
                         
-                        # Forward to feedback queue (non-blocking)
-                        self.feedback_queue.put(result, block=False)
+                        # Forward to feedback queue (waits briefly if full)
+                        self.feedback_queue.put(result, timeout=self.QUEUE_PUT_TIMEOUT)
                     
                 except zmq.Again:
                     # Timeout - no data
                     continue
                 
                 except queue.Full:
-                    # Queue full (shouldn't happen with unlimited queue)
-                    print("⚠️ EXECUTION LISTENER: Feedback queue full, dropping message")
+                    # Engine stalled for QUEUE_PUT_TIMEOUT with a full queue
+                    logger.warning("⚠️ EXECUTION LISTENER: Feedback queue full, dropping message",
+                                   extra={'rate_key': 'execution.queue_full'})
                     self.error_count += 1
                 
                 except Exception as e:
-                    print(f"⚠️ EXECUTION LISTENER: Error processing message: {e}")
+                    logger.warning("⚠️ EXECUTION LISTENER: Error processing message: %s", e,
+                                   extra={'rate_key': 'execution.error'})
                     self.error_count += 1
         
         finally:
@@ -211,8 +241,6 @@ class ExecutionListenerThreaded(threading.Thread):
             
             if self.pull_socket:
                 self.pull_socket.close()
-            if self.context:
-                self.context.term()
             
             print("✅ EXECUTION LISTENER: Worker stopped")
 
@@ -220,7 +248,8 @@ class ExecutionListenerThreaded(threading.Thread):
 def create_execution_listener_threaded(
     feedback_queue: queue.Queue,
     shutdown_event: threading.Event,
-    zmq_pull_address: str = "tcp://127.0.0.1:7779"
+    zmq_pull_address: str = "tcp://127.0.0.1:7779",
+    sockets: Optional[SocketFactory] = None
 ) -> threading.Thread:
     """
     Factory function to create Execution Listener thread.
@@ -229,6 +258,7 @@ def create_execution_listener_threaded(
         feedback_queue: Thread-safe queue
         shutdown_event: Shutdown event
         zmq_pull_address: ZMQ address
+        sockets: Socket factory (default: the shared one)
         
     Returns:
         ExecutionListenerThreaded instance (not started)
@@ -236,5 +266,6 @@ def create_execution_listener_threaded(
     return ExecutionListenerThreaded(
         feedback_queue=feedback_queue,
         shutdown_event=shutdown_event,
-        zmq_pull_address=zmq_pull_address
+        zmq_pull_address=zmq_pull_address,
+        sockets=sockets
     )
@@ -1,33 +1,56 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 """
-FlashEASuite V2 - Ingestion Worker (Threading Version)
+FlashEASuite V2 - Ingestion Worker (Threading and Process Versions)
 Receives tick data from MT5 Feeder via ZMQ
 
-Threading-safe version for Windows compatibility.
+Threading-safe version for Windows compatibility, plus a process
+version that decodes in its own interpreter (own GIL) and hands ticks
+to the strategy process through a shared-memory ring.
 """
 
 import zmq
-import msgpack
+import multiprocessing
+import signal
 import threading
 import queue
 import time
-from typing import Dict, Any
+from typing import Dict, Any, Optional
+
+from .journal import TickJournal
+from .latency import DECODE, ENQUEUE, LatencyRecorder
+from .log import get_logger, setup_logging, shutdown_logging
+from .shm_ring import SYMBOL_BYTES, SharedTickRing
+from .sockets import TICK_SUB, CurveKeys, SocketFactory, SocketOptions, get_socket_factory
+from .tick_codec import Tick, TickDecoder
+from .tick_store import TickStore
+
+logger = get_logger("ingestion")
 
 
 class IngestionWorkerThreaded(threading.Thread):
     """
     Ingestion Worker using Threading (Windows-safe).
     
-    Receives tick data from MT5 Feeder (Program A) via ZMQ SUB socket
-    and forwards to Strategy Engine via thread-safe queue.
+    Receives tick data from MT5 Feeder (Program A) via ZMQ SUB socket,
+    writes each tick once into the shared TickStore and forwards it to
+    Strategy Engine via thread-safe queue. If a TickJournal is given,
+    every raw frame is also handed to it with its receive time. A stage
+    link with a decoder gets the raw frame itself (put_frame), so the
+    tick is not packed again on the way to the engine.
     """
     
+    QUEUE_PUT_TIMEOUT = 1.0  # Max wait for space ('block' policy queues only)
+    
     def __init__(
         self,
         ingestion_queue: queue.Queue,
         shutdown_event: threading.Event,
-        zmq_sub_address: str = "tcp://127.0.0.1:7777"
+        zmq_sub_address: str = "tcp://127.0.0.1:7777",
+        tick_store: Optional[TickStore] = None,
+        journal: Optional[TickJournal] = None,
+        latency: Optional[LatencyRecorder] = None,
+        sockets: Optional[SocketFactory] = None
     ):
         """
         Initialize Ingestion Worker.
@@ -36,14 +59,28 @@ class IngestionWorkerThreaded(threading.Thread):
             ingestion_queue: Thread-safe queue to forward data
             shutdown_event: Event to signal shutdown
             zmq_sub_address: ZMQ address to subscribe to
+            tick_store: Shared per-symbol tick rings (written here only)
+            journal: Raw frame journal (None = don't record)
+            latency: Stage latency histograms (None = don't stamp ticks)
+            sockets: Socket factory (default: the shared one)
         """
         super().__init__(name="IngestionWorker")
         self.ingestion_queue = ingestion_queue
         self.shutdown_event = shutdown_event
         self.zmq_sub_address = zmq_sub_address
+        self.tick_store = tick_store
+        self.journal = journal
+        self.latency = latency
+        
+        # Links that decode on the consumer side take the Feeder frame as is
+        self._put_frame = (ingestion_queue.put_frame
+                           if getattr(ingestion_queue, 'decoder', None) is not None else None)
+        
+        # Tick decoder (SEQ_ID loss tracking keyed by this SUB endpoint)
+        self.decoder = TickDecoder()
         
         # ZMQ socket (will be created in run())
-        self.context = None
+        self.sockets = sockets or get_socket_factory()
         self.sub_socket = None
         
         # Statistics
@@ -58,11 +95,8 @@ class IngestionWorkerThreaded(threading.Thread):
             True if successful, False otherwise
         """
         try:
-            self.context = zmq.Context()
-            self.sub_socket = self.context.socket(zmq.SUB)
-            self.sub_socket.bind(self.zmq_sub_address)  # ✅ Changed to bind()
-            self.sub_socket.setsockopt_string(zmq.SUBSCRIBE, "")  # Subscribe all
-            self.sub_socket.setsockopt(zmq.RCVTIMEO, 1000)  # 1 second timeout
+            # Bind, subscribe all, role options (HWM, RCVTIMEO, buffers)
+            self.sub_socket = self.sockets.socket(TICK_SUB, self.zmq_sub_address)
             
             print(f"📥 INGESTION: Bound to {self.zmq_sub_address}")
             return True
@@ -71,38 +105,43 @@ class IngestionWorkerThreaded(threading.Thread):
             print(f"❌ INGESTION: Failed to setup ZMQ: {e}")
             return False
     
-    def _parse_tick_data(self, raw_data: bytes) -> Dict[str, Any]:
+    def _parse_tick_data(self, raw_data: bytes, recv_ns: int = 0) -> Tick:
         """
         Parse MessagePack tick data.
         
+        Format (7 fields):
+        [0] msg_type: 1 (TICK)
+        [1] seq: Feeder SEQ_ID
+        [2] time_msc: server time (milliseconds)
+        [3] symbol: "XAUUSD"
+        [4] bid: bid price
+        [5] ask: ask price
+        [6] flags: MT5 tick flags
+        
         Args:
             raw_data: Raw binary data
+            recv_ns: perf_counter_ns at receive (0 = not stamped)
             
         Returns:
-            Parsed tick dictionary
+            Parsed Tick
         """
         try:
-            data = msgpack.unpackb(raw_data, raw=False)
-            
-            # Validate format
-            if not isinstance(data, list) or len(data) < 5:
-                raise ValueError("Invalid data format")
-            
-            # Extract fields
-            tick = {
-                'msg_type': data[0],      # 1 = TICK_DATA
-                'timestamp': data[1],      # milliseconds
-                'symbol': data[2],         # "XAUUSD"
-                'bid': data[3],           # bid price
-                'ask': data[4],           # ask price
-            }
+            return self.decoder.decode(raw_data, self.zmq_sub_address, recv_ns)
             
-            return tick
-            
-        except Exception as e:
-            print(f"⚠️ INGESTION: Parse error: {e}")
+        except ValueError as e:
+            logger.warning("⚠️ INGESTION: Parse error: %s", e,
+                           extra={'rate_key': 'ingestion.parse_error'})
             raise
     
+    def get_sequence_stats(self) -> Dict[str, Any]:
+        """
+        Get SEQ_ID loss counters (gaps, duplicates, reorders per Feeder).
+        
+        Returns:
+            Decoder statistics dictionary
+        """
+        return self.decoder.get_stats()
+    
     def run(self) -> None:
         """Main worker loop."""
         print("🔄 INGESTION: Worker started")
@@ -112,47 +151,87 @@ class IngestionWorkerThreaded(threading.Thread):
             print("❌ INGESTION: Failed to initialize, exiting")
             return
         
+        journal = self.journal
+        latency = self.latency
+        stamp_wall = journal is not None or latency is not None
+        
         try:
             while not self.shutdown_event.is_set():
                 try:
                     # Receive data (with timeout)
                     raw_data = self.sub_socket.recv()
+                    recv_ns = time.perf_counter_ns() if latency is not None else 0
+                    wall_ns = time.time_ns() if stamp_wall else 0
+                    
+                    # Parse (journal the raw frame either way)
+                    try:
+                        tick = self._parse_tick_data(raw_data, recv_ns)
+                    except ValueError:
+                        if journal is not None:
+                            journal.append(raw_data, wall_ns)
+                        raise
+                    
+                    if journal is not None:
+                        journal.append(raw_data, wall_ns, tick.seq, tick.time_msc)
+                    if latency is not None:
+                        latency.record(DECODE, recv_ns)
+                        latency.record_wire(tick.time_msc, wall_ns // 1_000_000)
                     
-                    # Parse
-                    tick = self._parse_tick_data(raw_data)
+                    # Store once in the symbol's ring (read by analyzers)
+                    if self.tick_store is not None:
+                        self.tick_store.append(
+                            tick.symbol,
+                            tick.time_msc,
+                            tick.bid,
+                            tick.ask,
+                            tick.flags,
+                            tick.seq
+                        )
                     
-                    # Forward to queue (non-blocking)
-                    self.ingestion_queue.put(tick, block=False)
+                    # Forward to queue (drop/conflate policies never block)
+                    if self._put_frame is not None:
+                        self._put_frame(raw_data, recv_ns, timeout=self.QUEUE_PUT_TIMEOUT)
+                    else:
+                        self.ingestion_queue.put(tick, timeout=self.QUEUE_PUT_TIMEOUT)
+                    if latency is not None:
+                        latency.record(ENQUEUE, recv_ns)
                     
                     self.message_count += 1
                     
-                    # Log every 100 messages
+                    # Progress every 100 messages (rate-limited by the logger)
                     if self.message_count % 100 == 0:
-                        print(f"📊 INGESTION: Processed {self.message_count} ticks "
-                              f"(Queue size: {self.ingestion_queue.qsize()})")
+                        queue_size = self.ingestion_queue.qsize()
+                        lost = self.decoder.total_lost()
+                        logger.info(
+                            "📊 INGESTION: Processed %d ticks (Queue size: %d, Lost: %d)",
+                            self.message_count, queue_size, lost,
+                            extra={'rate_key': 'ingestion.progress',
+                                   'fields': {'ticks': self.message_count,
+                                              'queue_size': queue_size, 'lost': lost}})
                     
                 except zmq.Again:
                     # Timeout - no data
                     continue
                 
                 except queue.Full:
-                    # Queue full (shouldn't happen with unlimited queue)
-                    print("⚠️ INGESTION: Queue full, dropping message")
+                    # Queue full ('block' policy and the engine stalled)
+                    logger.warning("⚠️ INGESTION: Queue full, dropping message",
+                                   extra={'rate_key': 'ingestion.queue_full'})
                     self.error_count += 1
                 
                 except Exception as e:
-                    print(f"⚠️ INGESTION: Error processing message: {e}")
+                    logger.warning("⚠️ INGESTION: Error processing message: %s", e,
+                                   extra={'rate_key': 'ingestion.error'})
                     self.error_count += 1
         
         finally:
             # Cleanup
             print(f"\n🛑 INGESTION: Shutting down "
-                  f"(Processed: {self.message_count}, Errors: {self.error_count})")
+                  f"(Processed: {self.message_count}, Errors: {self.error_count}, "
+                  f"Lost: {self.decoder.total_lost()})")
             
             if self.sub_socket:
                 self.sub_socket.close()
-            if self.context:
-                self.context.term()
             
             print("✅ INGESTION: Worker stopped")
 
@@ -160,7 +239,11 @@ class IngestionWorkerThreaded(threading.Thread):
 def create_ingestion_worker_threaded(
     ingestion_queue: queue.Queue,
     shutdown_event: threading.Event,
-    zmq_sub_address: str = "tcp://127.0.0.1:7777"
+    zmq_sub_address: str = "tcp://127.0.0.1:7777",
+    tick_store: Optional[TickStore] = None,
+    journal: Optional[TickJournal] = None,
+    latency: Optional[LatencyRecorder] = None,
+    sockets: Optional[SocketFactory] = None
 ) -> threading.Thread:
     """
     Factory function to create Ingestion Worker thread.
@@ -169,6 +252,10 @@ def create_ingestion_worker_threaded(
         ingestion_queue: Thread-safe queue
         shutdown_event: Shutdown event
         zmq_sub_address: ZMQ address
+        tick_store: Shared per-symbol tick rings
+        journal: Raw frame journal (optional)
+        latency: Stage latency histograms (optional)
+        sockets: Socket factory (default: the shared one)
         
     Returns:
         IngestionWorkerThreaded instance (not started)
@@ -176,5 +263,217 @@ def create_ingestion_worker_threaded(
     return IngestionWorkerThreaded(
         ingestion_queue=ingestion_queue,
         shutdown_event=shutdown_event,
-        zmq_sub_address=zmq_sub_address
+        zmq_sub_address=zmq_sub_address,
+        tick_store=tick_store,
+        journal=journal,
+        latency=latency,
+        sockets=sockets
+    )
+
+
+class IngestionWorkerProcess(multiprocessing.Process):
+    """
+    Ingestion Worker running in its own process.
+    
+    Receives tick data from the Feeder via ZMQ SUB, decodes it and
+    writes the ticks into a SharedTickRing in batches. The strategy
+    process reads the ring through a SharedRingMailbox and owns the
+    TickStore. Decoder and SEQ_ID counters are mirrored into the ring
+    header so the parent can report tick loss.
+    
+    With ``stamp_recv`` each record carries its perf_counter_ns receive
+    stamp (a system-wide clock), so the strategy process can record the
+    dequeue/analysis/publish latency stages. The decode and wire stages
+    are not recorded in this mode.
+    """
+    
+    BATCH_SIZE = 1000       # Max ticks decoded per ring write
+    POLL_TIMEOUT_MS = 100   # Max wait for data (bounds shutdown latency)
+    
+    def __init__(
+        self,
+        ring: SharedTickRing,
+        shutdown_event: multiprocessing.Event,
+        zmq_sub_address: str = "tcp://127.0.0.1:7777",
+        stamp_recv: bool = False,
+        log_config: Optional[Dict[str, Any]] = None,
+        socket_options: Optional[Dict[str, SocketOptions]] = None,
+        curve: Optional[CurveKeys] = None
+    ):
+        """
+        Initialize Ingestion Worker process.
+        
+        Args:
+            ring: Shared ring to write ticks into (created by the parent)
+            shutdown_event: multiprocessing.Event to signal shutdown
+            zmq_sub_address: ZMQ address to subscribe to
+            stamp_recv: Stamp each tick with its receive time (latency tracking)
+            log_config: setup_logging() arguments for the child (console
+                only; the log file belongs to the parent)
+            socket_options: Role -> SocketOptions for the child's own
+                context (default: the shared factory's options)
+            curve: Curve keys for the child's socket (default: the shared
+                factory's)
+        """
+        super().__init__(name="IngestionProcess")
+        self.ring = ring
+        self.log_config = log_config
+        if socket_options is None:
+            socket_options = get_socket_factory().options
+        self.socket_options = socket_options
+        self.curve = curve if curve is not None else get_socket_factory().curve
+        self.shutdown_event = shutdown_event
+        self.zmq_sub_address = zmq_sub_address
+        self.stamp_recv = stamp_recv
+    
+    def get_sequence_stats(self) -> Dict[str, Any]:
+        """
+        Get SEQ_ID loss counters as published by the child process.
+        
+        Returns:
+            Dictionary shaped like TickDecoder.get_stats()
+        """
+        ring_stats = self.ring.get_stats()
+        seq_stats = self.ring.get_sequence_stats()
+        feeders = {self.zmq_sub_address: seq_stats} if seq_stats['received'] else {}
+        return {
+            'decoded': ring_stats['decoded'],
+            'errors': ring_stats['errors'],
+            'feeders': feeders,
+        }
+    
+    def run(self) -> None:
+        """Main worker loop (runs in the child process)."""
+        # Ctrl+C reaches the whole process group; the parent decides
+        signal.signal(signal.SIGINT, signal.SIG_IGN)
+        
+        # The child gets its own log listener thread
+        if self.log_config is not None:
+            setup_logging(**self.log_config)
+        
+        print(f"🔄 INGESTION: Worker process started (PID {self.pid})")
+        
+        decoder = TickDecoder()
+        decode = decoder.decode
+        feeder = self.zmq_sub_address
+        ring = self.ring
+        stamp_recv = self.stamp_recv
+        message_count = 0
+        dropped = 0
+        
+        # ZMQ contexts do not survive fork: the child builds its own
+        sockets = SocketFactory(options=self.socket_options, curve=self.curve)
+        sub_socket = None
+        
+        try:
+            sub_socket = sockets.socket(TICK_SUB, self.zmq_sub_address)
+            print(f"📥 INGESTION: Bound to {self.zmq_sub_address}")
+            
+            while not self.shutdown_event.is_set():
+                if not sub_socket.poll(self.POLL_TIMEOUT_MS):
+                    continue
+                
+                time_msc, seq, bid, ask, flags, symbol = [], [], [], [], [], []
+                recv = [] if stamp_recv else None
+                while len(seq) < self.BATCH_SIZE:
+                    try:
+                        raw_data = sub_socket.recv(zmq.NOBLOCK)
+                    except zmq.Again:
+                        break
+                    if stamp_recv:
+                        recv.append(time.perf_counter_ns())
+                    
+                    try:
+                        tick = decode(raw_data, feeder)
+                        if len(tick.symbol) > SYMBOL_BYTES:
+                            # A truncated name would be read back as another symbol
+                            raise ValueError(f"symbol '{tick.symbol}' is longer than "
+                                             f"{SYMBOL_BYTES} bytes")
+                    except ValueError as e:
+                        logger.warning("⚠️ INGESTION: Parse error: %s", e,
+                                       extra={'rate_key': 'ingestion.parse_error'})
+                        if stamp_recv:
+                            recv.pop()
+                        continue
+                    
+                    time_msc.append(tick.time_msc)
+                    seq.append(tick.seq)
+                    bid.append(tick.bid)
+                    ask.append(tick.ask)
+                    flags.append(tick.flags)
+                    symbol.append(tick.symbol)
+                
+                written = ring.push_many(time_msc, seq, bid, ask, flags, symbol, recv)
+                dropped += len(seq) - written
+                
+                tracker = decoder.trackers.get(feeder)
+                if tracker is not None:
+                    ring.publish_sequence_stats(decoder.decoded, decoder.errors,
+                                                tracker.get_stats())
+                
+                # Progress every 100 messages (rate-limited by the logger)
+                previous = message_count
+                message_count += len(seq)
+                if message_count // 100 != previous // 100:
+                    pending = len(ring)
+                    lost = decoder.total_lost()
+                    logger.info(
+                        "📊 INGESTION: Processed %d ticks (Ring: %d/%d, Dropped: %d, Lost: %d)",
+                        message_count, pending, ring.capacity, dropped, lost,
+                        extra={'rate_key': 'ingestion.progress',
+                               'fields': {'ticks': message_count, 'ring_size': pending,
+                                          'dropped': dropped, 'lost': lost}})
+        
+        except Exception as e:
+            print(f"❌ INGESTION: Unexpected error: {e}")
+            import traceback
+            traceback.print_exc()
+        
+        finally:
+            print(f"\n🛑 INGESTION: Shutting down "
+                  f"(Processed: {message_count}, Errors: {decoder.errors}, "
+                  f"Dropped: {dropped}, Lost: {decoder.total_lost()})")
+            
+            if sub_socket is not None:
+                sub_socket.close()
+            sockets.close()
+            ring.close()
+            
+            print("✅ INGESTION: Worker process stopped")
+            if self.log_config is not None:
+                shutdown_logging()
+
+
+def create_ingestion_worker_process(
+    ring: SharedTickRing,
+    shutdown_event: multiprocessing.Event,
+    zmq_sub_address: str = "tcp://127.0.0.1:7777",
+    stamp_recv: bool = False,
+    log_config: Optional[Dict[str, Any]] = None,
+    socket_options: Optional[Dict[str, SocketOptions]] = None,
+    curve: Optional[CurveKeys] = None
+) -> multiprocessing.Process:
+    """
+    Factory function to create Ingestion Worker process.
+    
+    Args:
+        ring: Shared ring the process writes ticks into
+        shutdown_event: multiprocessing.Event (shared with the parent)
+        zmq_sub_address: ZMQ address
+        stamp_recv: Stamp ticks with their receive time (latency tracking)
+        log_config: setup_logging() arguments for the child process
+        socket_options: Role -> SocketOptions (default: the shared factory's)
+        curve: Curve keys (default: the shared factory's)
+        
+    Returns:
+        IngestionWorkerProcess instance (not started)
+    """
+    return IngestionWorkerProcess(
+        ring=ring,
+        shutdown_event=shutdown_event,
+        zmq_sub_address=zmq_sub_address,
+        stamp_recv=stamp_recv,
+        log_config=log_config,
+        socket_options=socket_options,
+        curve=curve
     )
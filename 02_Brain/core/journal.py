@@ -0,0 +1,388 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+FlashEASuite V2 - Tick Journal
+Append-only binary journal of raw Feeder frames
+
+The ingestion worker hands each raw frame (plus its local receive time
+in ns) to TickJournal, which writes it from a background thread through
+buffered I/O. Segments rotate by size or by UTC day.
+
+Segment file ``<prefix>-YYYYMMDD-NNNN.journal``:
+    header   8 bytes  MAGIC
+    frames   [u32 length][u64 recv_ns][payload] ...  (little-endian)
+
+Index file ``<prefix>-YYYYMMDD-NNNN.idx`` (one entry per block of frames):
+    [u64 offset][u64 first_recv_ns][i64 first_seq][i64 first_time_msc]
+    (-1 when the block's first frame could not be decoded)
+
+JournalReader memory-maps a segment, iterates frames and seeks by
+Feeder time using the block index.
+"""
+
+import glob
+import mmap
+import os
+import queue
+import struct
+import threading
+import time
+from bisect import bisect_right
+from typing import Any, Dict, Iterator, List, NamedTuple, Optional
+
+import numpy as np
+
+from .tick_codec import TickDecoder
+
+MAGIC = b"FJRNL\x00\x01\x00"
+SEGMENT_SUFFIX = ".journal"
+INDEX_SUFFIX = ".idx"
+
+_FRAME_HEADER = struct.Struct("<IQ")        # length, recv_ns
+_INDEX_ENTRY = struct.Struct("<QQqq")       # offset, first_recv_ns, first_seq, first_time_msc
+
+INDEX_DTYPE = np.dtype([
+    ('offset', '<u8'),
+    ('first_recv_ns', '<u8'),
+    ('first_seq', '<i8'),
+    ('first_time_msc', '<i8'),
+])
+
+_NS_PER_DAY = 86_400 * 1_000_000_000
+_STOP = object()
+
+
+class JournalFrame(NamedTuple):
+    """One journaled Feeder frame."""
+    recv_ns: int        # Local receive time (time.time_ns)
+    payload: bytes      # Raw Feeder frame (MessagePack)
+
+
+def list_segments(directory: str, prefix: str = "ticks") -> List[str]:
+    """
+    List journal segments in write order.
+
+    Args:
+        directory: Journal directory
+        prefix: Segment name prefix
+
+    Returns:
+        Sorted segment paths
+    """
+    return sorted(glob.glob(os.path.join(directory, f"{prefix}-*{SEGMENT_SUFFIX}")))
+
+
+class TickJournal(threading.Thread):
+    """
+    Background writer for the segmented tick journal.
+
+    append() only enqueues (raw frame, receive time, SEQ_ID, time_msc)
+    on a SimpleQueue; the journal thread does all file I/O. The queue is
+    unbounded so the hot path never blocks on a slow disk; watch the
+    'pending' statistic.
+    """
+
+    def __init__(
+        self,
+        directory: str,
+        prefix: str = "ticks",
+        max_segment_bytes: int = 256 * 1024 * 1024,
+        block_frames: int = 1024,
+        flush_interval: float = 1.0,
+        buffer_size: int = 1024 * 1024
+    ):
+        """
+        Initialize the journal (call start() to begin writing).
+
+        Args:
+            directory: Journal directory (created if missing)
+            prefix: Segment name prefix
+            max_segment_bytes: Rotate when a segment would exceed this size
+            block_frames: Frames per index block
+            flush_interval: Max seconds between flushes to the OS
+            buffer_size: Write buffer size (bytes)
+        """
+        super().__init__(name="TickJournal", daemon=True)
+        self.directory = directory
+        self.prefix = prefix
+        self.max_segment_bytes = max_segment_bytes
+        self.block_frames = block_frames
+        self.flush_interval = flush_interval
+        self.buffer_size = buffer_size
+
+        self._queue = queue.SimpleQueue()
+
+        # Current segment (journal thread only)
+        self._segment = None
+        self._index = None
+        self._segment_day = None
+        self._offset = 0
+        self._block_fill = 0
+
+        # Statistics
+        self.frames_written = 0
+        self.bytes_written = 0
+        self.segments = 0
+        self.current_path = None
+
+    # --- Hot path ---
+
+    def append(self, raw_data: bytes, recv_ns: int, seq: int = -1, time_msc: int = -1) -> None:
+        """
+        Queue one raw frame for writing (never blocks).
+
+        Args:
+            raw_data: Raw Feeder frame
+            recv_ns: Local receive time (time.time_ns())
+            seq: Decoded SEQ_ID (-1 if the frame did not decode)
+            time_msc: Decoded Feeder time (-1 if the frame did not decode)
+        """
+        self._queue.put((raw_data, recv_ns, seq, time_msc))
+
+    # --- Journal thread ---
+
+    def _open_segment(self, day: int) -> None:
+        """Close the current segment and open the next one for ``day``."""
+        self._close_segment()
+        os.makedirs(self.directory, exist_ok=True)
+
+        date = time.strftime("%Y%m%d", time.gmtime(day * 86_400))
+        existing = glob.glob(os.path.join(
+            self.directory, f"{self.prefix}-{date}-*{SEGMENT_SUFFIX}"))
+        number = 1 + max((int(path[-len(SEGMENT_SUFFIX) - 4:-len(SEGMENT_SUFFIX)])
+                          for path in existing), default=0)
+
+        base = os.path.join(self.directory, f"{self.prefix}-{date}-{number:04d}")
+        self._segment = open(base + SEGMENT_SUFFIX, "wb", buffering=self.buffer_size)
+        self._index = open(base + INDEX_SUFFIX, "wb", buffering=64 * 1024)
+        self._segment.write(MAGIC)
+
+        self._segment_day = day
+        self._offset = len(MAGIC)
+        self._block_fill = 0
+        self.segments += 1
+        self.current_path = base + SEGMENT_SUFFIX
+
+    def _close_segment(self) -> None:
+        for f in (self._segment, self._index):
+            if f is not None:
+                f.close()
+        self._segment = None
+        self._index = None
+
+    def _write(self, raw_data: bytes, recv_ns: int, seq: int, time_msc: int) -> None:
+        size = _FRAME_HEADER.size + len(raw_data)
+        day = recv_ns // _NS_PER_DAY
+
+        if (self._segment is None or day != self._segment_day
+                or self._offset + size > self.max_segment_bytes):
+            self._open_segment(day)
+
+        if self._block_fill == 0:
+            self._index.write(_INDEX_ENTRY.pack(self._offset, recv_ns, seq, time_msc))
+
+        self._segment.write(_FRAME_HEADER.pack(len(raw_data), recv_ns))
+        self._segment.write(raw_data)
+
+        self._offset += size
+        self._block_fill = (self._block_fill + 1) % self.block_frames
+        self.frames_written += 1
+        self.bytes_written += size
+
+    def _flush(self) -> None:
+        for f in (self._segment, self._index):
+            if f is not None:
+                f.flush()
+
+    def run(self) -> None:
+        """Journal thread: write queued frames, flush at least every flush_interval."""
+        get = self._queue.get
+        next_flush = time.monotonic() + self.flush_interval
+
+        try:
+            while True:
+                try:
+                    item = get(timeout=self.flush_interval)
+                except queue.Empty:
+                    item = None
+
+                if item is _STOP:
+                    break
+                if item is not None:
+                    self._write(*item)
+
+                now = time.monotonic()
+                if now >= next_flush:
+                    self._flush()
+                    next_flush = now + self.flush_interval
+
+            # Write whatever was queued before close()
+            while True:
+                try:
+                    item = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                if item is not _STOP:
+                    self._write(*item)
+
+        except Exception as e:
+            print(f"❌ JOURNAL: Write failed, journaling stopped: {e}")
+
+        finally:
+            self._close_segment()
+
+    def close(self, timeout: Optional[float] = 5.0) -> None:
+        """Write pending frames, close the segment and stop the thread."""
+        self._queue.put(_STOP)
+        if self.is_alive():
+            self.join(timeout)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get journal statistics.
+
+        Returns:
+            Dictionary with frames/bytes written, segments and queue backlog
+        """
+        return {
+            'frames_written': self.frames_written,
+            'bytes_written': self.bytes_written,
+            'segments': self.segments,
+            'pending': self._queue.qsize(),
+            'current_path': self.current_path,
+        }
+
+
+class JournalReader:
+    """
+    Memory-mapped reader for one journal segment.
+
+    Frames are read straight from the mapping, so opening a large
+    segment costs nothing until frames are iterated. The block index is
+    loaded from the ``.idx`` file, or rebuilt by scanning the segment
+    if the index is missing (e.g. after a crash).
+    """
+
+    def __init__(self, path: str):
+        """
+        Open a segment.
+
+        Args:
+            path: Segment path (``.journal``)
+
+        Raises:
+            ValueError: If the file is not a tick journal segment
+        """
+        self.path = path
+        self._file = open(path, "rb")
+        self._size = os.fstat(self._file.fileno()).st_size
+        self._mm = None
+
+        if self._size < len(MAGIC):
+            self._file.close()
+            raise ValueError(f"{path}: not a tick journal segment (too short)")
+
+        self._mm = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        if self._mm[:len(MAGIC)] != MAGIC:
+            self.close()
+            raise ValueError(f"{path}: not a tick journal segment (bad magic)")
+
+        self._decoder = TickDecoder(track_sequence=False)
+        self.index = self._load_index()
+
+    def __enter__(self) -> "JournalReader":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def __iter__(self) -> Iterator[JournalFrame]:
+        return self.frames()
+
+    def close(self) -> None:
+        if self._mm is not None:
+            self._mm.close()
+            self._mm = None
+        self._file.close()
+
+    def _load_index(self) -> np.ndarray:
+        index_path = self.path[:-len(SEGMENT_SUFFIX)] + INDEX_SUFFIX
+        if os.path.exists(index_path):
+            index = np.fromfile(index_path, dtype=INDEX_DTYPE)
+            # Drop entries for blocks the segment does not contain (torn write)
+            return index[index['offset'] < self._size]
+        return self._build_index()
+
+    def _build_index(self, block_frames: int = 1024) -> np.ndarray:
+        """Scan the segment and index every ``block_frames``-th frame."""
+        entries = []
+        for i, (offset, frame) in enumerate(self._scan(len(MAGIC))):
+            if i % block_frames == 0:
+                seq, time_msc = self._frame_key(frame.payload)
+                entries.append((offset, frame.recv_ns, seq, time_msc))
+        return np.array(entries, dtype=INDEX_DTYPE)
+
+    def _frame_key(self, payload: bytes) -> tuple:
+        """(seq, time_msc) of a frame, or (-1, -1) if it does not decode."""
+        try:
+            tick = self._decoder.decode(payload)
+        except ValueError:
+            return -1, -1
+        return tick.seq, tick.time_msc
+
+    def _scan(self, offset: int) -> Iterator[tuple]:
+        """Yield (offset, JournalFrame) from ``offset`` to the last complete frame."""
+        mm = self._mm
+        unpack = _FRAME_HEADER.unpack_from
+        header_size = _FRAME_HEADER.size
+        end = self._size
+
+        while offset + header_size <= end:
+            length, recv_ns = unpack(mm, offset)
+            start = offset + header_size
+            if start + length > end:
+                break  # Torn final frame
+            yield offset, JournalFrame(recv_ns, mm[start:start + length])
+            offset = start + length
+
+    def frames(self, offset: Optional[int] = None) -> Iterator[JournalFrame]:
+        """
+        Iterate frames in write order.
+
+        Args:
+            offset: Byte offset of the first frame (default: start of segment)
+        """
+        for _, frame in self._scan(len(MAGIC) if offset is None else offset):
+            yield frame
+
+    def seek(self, time_msc: int) -> int:
+        """
+        Find the first frame at or after a Feeder timestamp.
+
+        Uses the block index to jump to the right block, then scans at
+        most one block (plus undecodable frames).
+
+        Args:
+            time_msc: Feeder server time (milliseconds)
+
+        Returns:
+            Byte offset for frames(), or the segment size if no frame qualifies
+        """
+        index = self.index[self.index['first_time_msc'] >= 0]
+        block = bisect_right(index['first_time_msc'].tolist(), time_msc) - 1
+        offset = int(index['offset'][block]) if block >= 0 else len(MAGIC)
+
+        for frame_offset, frame in self._scan(offset):
+            _, frame_time = self._frame_key(frame.payload)
+            if frame_time >= time_msc:
+                return frame_offset
+        return self._size
+
+    def frames_since(self, time_msc: int) -> Iterator[JournalFrame]:
+        """Iterate frames from the first one at or after ``time_msc``."""
+        return self.frames(self.seek(time_msc))
+
+    @property
+    def size(self) -> int:
+        """Segment size in bytes."""
+        return self._size
@@ -0,0 +1,225 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+FlashEASuite V2 - Latency Instrumentation
+Per-stage tick latency histograms (HDR-style, allocation-free recording)
+
+Every tick is stamped with perf_counter_ns when its frame is received
+(Tick.recv_ns). Each later stage records "time since receive" into its
+own histogram, so the stages read as a cumulative latency profile:
+
+    wire      Feeder server time (time_msc) -> receive, offset-corrected
+    decode    receive -> decoded
+    enqueue   receive -> handed to the engine queue
+    dequeue   receive -> taken by the engine
+    analysis  receive -> analysis done
+    publish   receive -> policy sent (ticks that trigger a policy)
+
+Each histogram has a single writer thread; the reporter only reads.
+"""
+
+import time
+from array import array
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+STAGES = ('wire', 'decode', 'enqueue', 'dequeue', 'analysis', 'publish')
+WIRE, DECODE, ENQUEUE, DEQUEUE, ANALYSIS, PUBLISH = range(len(STAGES))
+
+# MT5 server time is usually a whole number of quarter-hours off UTC
+_TZ_STEP_MS = 15 * 60 * 1000
+
+
+class LatencyHistogram:
+    """
+    Log-linear histogram of nanosecond values (HDR histogram layout).
+
+    Values below 2**SUB_BITS are exact; above that every power-of-two
+    range is split into 2**(SUB_BITS - 1) equal buckets, so the relative
+    error is below 2**-(SUB_BITS - 1) (~1.6% with SUB_BITS = 7). Counts
+    live in one preallocated array: record() creates no containers and
+    touches a fixed amount of memory.
+    """
+
+    SUB_BITS = 7
+    MAX_BITS = 40   # Values clamp at ~18 minutes
+
+    def __init__(self):
+        self._sub_count = 1 << self.SUB_BITS
+        self._half = self._sub_count >> 1
+        self._half_bits = self.SUB_BITS - 1
+        size = self._sub_count + (self.MAX_BITS - self.SUB_BITS) * self._half
+        self._last_index = size - 1
+
+        self.counts = array('q', bytes(8 * size))
+        self.total = 0
+        self.max = 0
+
+    def record(self, value_ns: int) -> None:
+        """
+        Record one value (single writer thread).
+
+        Args:
+            value_ns: Latency in nanoseconds (negative values count as 0)
+        """
+        if value_ns < self._sub_count:
+            index = value_ns if value_ns > 0 else 0
+        else:
+            # = sub_count + (shift - 1) * half + (value_ns >> shift) - half
+            shift = value_ns.bit_length() - self.SUB_BITS
+            index = (shift << self._half_bits) + (value_ns >> shift)
+            if index > self._last_index:
+                index = self._last_index
+
+        self.counts[index] += 1
+        self.total += 1
+        if value_ns > self.max:
+            self.max = value_ns
+
+    def bucket_values(self) -> np.ndarray:
+        """Representative value (bucket midpoint, ns) of every bucket."""
+        index = np.arange(len(self.counts), dtype=np.int64)
+        values = index.copy()
+        high = index >= self._sub_count
+        offset = index[high] - self._sub_count
+        shift = offset // self._half + 1
+        low = (offset % self._half + self._half) << shift
+        values[high] = low + (np.int64(1) << shift) // 2
+        return values
+
+    def snapshot(self) -> np.ndarray:
+        """Copy of the bucket counts (safe to take from another thread)."""
+        return np.frombuffer(self.counts, dtype=np.int64).copy()
+
+
+def percentiles(counts: np.ndarray, values: np.ndarray,
+                quantiles=(0.5, 0.99, 0.999)) -> List[float]:
+    """
+    Percentiles from histogram bucket counts.
+
+    Args:
+        counts: Bucket counts
+        values: Bucket representative values (LatencyHistogram.bucket_values)
+        quantiles: Quantiles in [0, 1]
+
+    Returns:
+        Value (ns) for each quantile (0.0 if the histogram is empty)
+    """
+    total = int(counts.sum())
+    if total == 0:
+        return [0.0 for _ in quantiles]
+    cumulative = np.cumsum(counts)
+    ranks = [max(1, int(np.ceil(q * total))) for q in quantiles]
+    return [float(values[np.searchsorted(cumulative, rank)]) for rank in ranks]
+
+
+class LatencyRecorder:
+    """
+    Stage histograms for the whole pipeline plus interval reporting.
+
+    Workers call record()/record_wire() with Tick.recv_ns; report()
+    returns percentiles for what was recorded since the previous report.
+    """
+
+    def __init__(self):
+        self.histograms = [LatencyHistogram() for _ in STAGES]
+        self._values = self.histograms[0].bucket_values()
+        self._previous = [h.snapshot() for h in self.histograms]
+        self._last_report = time.monotonic()
+
+        # Feeder clock offset (ms): smallest receive - time_msc seen so far
+        self._wire_floor_ms = None
+
+    def record(self, stage: int, recv_ns: int) -> None:
+        """
+        Record the time from receive to now for one stage.
+
+        Args:
+            stage: Stage index (DECODE, ENQUEUE, ...)
+            recv_ns: Tick.recv_ns (0 = tick was not stamped, ignored)
+        """
+        if recv_ns:
+            self.histograms[stage].record(time.perf_counter_ns() - recv_ns)
+
+    def record_wire(self, time_msc: int, recv_wall_ms: int) -> None:
+        """
+        Record the Feeder-to-Brain leg from the tick's server time.
+
+        MT5 server time is in the broker's time zone, so the raw
+        difference is corrected by the whole quarter-hours of the
+        smallest difference seen (the time zone offset). What remains
+        is wire latency plus any clock skew between the two machines.
+
+        Args:
+            time_msc: Tick server time (ms)
+            recv_wall_ms: Local wall-clock receive time (ms)
+        """
+        delta = recv_wall_ms - time_msc
+        floor = self._wire_floor_ms
+        if floor is None or delta < floor:
+            floor = self._wire_floor_ms = delta
+        offset = round(floor / _TZ_STEP_MS) * _TZ_STEP_MS
+        self.histograms[WIRE].record((delta - offset) * 1_000_000)
+
+    def report(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Percentiles per stage since the previous report.
+
+        Returns:
+            {stage: {'count', 'p50_us', 'p99_us', 'p999_us', 'max_us'}}
+            for stages with at least one sample in the interval
+        """
+        now = time.monotonic()
+        result = {}
+
+        for i, (name, histogram) in enumerate(zip(STAGES, self.histograms)):
+            current = histogram.snapshot()
+            interval = current - self._previous[i]
+            self._previous[i] = current
+
+            count = int(interval.sum())
+            if count == 0:
+                continue
+
+            p50, p99, p999 = percentiles(interval, self._values)
+            nonzero = np.nonzero(interval)[0]
+            result[name] = {
+                'count': count,
+                'p50_us': p50 / 1000.0,
+                'p99_us': p99 / 1000.0,
+                'p999_us': p999 / 1000.0,
+                'max_us': float(self._values[nonzero[-1]]) / 1000.0,
+            }
+
+        result_seconds = now - self._last_report
+        self._last_report = now
+        for stats in result.values():
+            stats['interval_s'] = result_seconds
+        return result
+
+    def print_report(self, label: str = "LATENCY") -> None:
+        """Print report() as a table (nothing if no samples)."""
+        report = self.report()
+        if not report:
+            return
+
+        interval = next(iter(report.values()))['interval_s']
+        print(f"\n⏱️ {label} (last {interval:.0f}s, µs since receive; wire = Feeder -> Brain)")
+        print(f"   {'stage':<10}{'count':>9}{'p50':>10}{'p99':>10}{'p99.9':>10}{'max':>10}")
+        for name, s in report.items():
+            print(f"   {name:<10}{s['count']:>9}{s['p50_us']:>10.1f}{s['p99_us']:>10.1f}"
+                  f"{s['p999_us']:>10.1f}{s['max_us']:>10.1f}")
+
+
+def create_latency_recorder(enabled: bool = True) -> Optional[LatencyRecorder]:
+    """
+    Create the pipeline latency recorder.
+
+    Args:
+        enabled: False to disable instrumentation (workers skip stamping)
+
+    Returns:
+        LatencyRecorder, or None when disabled
+    """
+    return LatencyRecorder() if enabled else None
@@ -0,0 +1,294 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+FlashEASuite V2 - Stage Links
+ZMQ PUSH/PULL links between Brain stages (inproc, ipc or tcp)
+
+A StageLink stands in for the queue between two stages: it exposes the
+same put/get/get_nowait/qsize/empty/get_stats subset as BoundedQueue, so
+the ingestion worker, execution listener and strategy engine use it
+unchanged. Each item is packed into one msgpack frame and pushed through
+a ZMQ pipe; producer and consumer share no lock and no Python objects.
+
+A link built with a ``decoder`` carries frames that are already encoded
+(the Feeder's tick frames): put_frame() hands the received bytes to ZMQ
+without copying or re-packing them, and get() decodes each frame once,
+on the consumer side. The transport is chosen by the address alone:
+
+    inproc://brain.ingestion       threads of one process (shared context)
+    ipc:///tmp/flashea-ingestion   processes on one host (POSIX)
+    tcp://10.0.0.5:7790            stages on different hosts
+
+The consumer end binds, the producer end connects. Each end is created
+on first use by the thread that uses it (ZMQ sockets are not
+thread-safe), so a process only opens the end it needs.
+
+Within one process the queues are faster (see benchmarks/bench_stage_links.py):
+a link is for stages that run in different processes or on different hosts.
+"""
+
+import queue
+from datetime import datetime
+from typing import Any, Callable, Dict, Optional
+
+import msgpack
+import zmq
+
+from .sockets import LINK_PULL, LINK_PUSH, SocketFactory, get_socket_factory
+
+_new_item = tuple.__new__
+
+# Trade results carry a (naive, local) datetime: sent as ISO text in an ext type
+_DATETIME_EXT = 1
+
+
+def _pack_default(obj: Any) -> Any:
+    if isinstance(obj, datetime):
+        return msgpack.ExtType(_DATETIME_EXT, obj.isoformat().encode())
+    raise TypeError(f"Cannot send {type(obj).__name__} over a stage link")
+
+
+def _ext_hook(code: int, data: bytes) -> Any:
+    if code == _DATETIME_EXT:
+        return datetime.fromisoformat(data.decode())
+    return msgpack.ExtType(code, data)
+
+
+class StageLink:
+    """
+    One-way queue-compatible link between two stages (single producer).
+
+    A full pipe (send + receive HWM) blocks the producer like the
+    'block' queue policy: put() waits up to ``timeout`` and then raises
+    queue.Full. qsize() only counts what this process put and took, so
+    it is exact when both ends are local and 0/approximate otherwise.
+    """
+
+    def __init__(
+        self,
+        address: str,
+        name: str = 'link',
+        item_type: Optional[type] = None,
+        sockets: Optional[SocketFactory] = None,
+        decoder: Optional[Callable[[bytes, int], Any]] = None,
+        stamped: bool = False
+    ):
+        """
+        Initialize link (no sockets are opened yet).
+
+        Args:
+            address: ZMQ endpoint (inproc://, ipc:// or tcp://)
+            name: Name used in statistics
+            item_type: NamedTuple class to rebuild items as (e.g. Tick);
+                None passes msgpack values through (dicts for trade results)
+            sockets: Socket factory (default: the shared one; inproc links
+                need both ends on the same factory)
+            decoder: decoder(frame, recv_ns) -> item for links fed with
+                put_frame() (e.g. tick_codec.unpack_tick); None = put()/item_type
+            stamped: put_frame() sends each frame's recv_ns along (both ends
+                must agree; off = the decoder gets 0)
+        """
+        self.address = address
+        self.name = name
+        self.policy = 'zmq_link'
+        self.item_type = item_type
+        self.decoder = decoder
+        self.stamped = stamped
+        # put_frame() send flags, combined once (IntFlag | costs more than the send)
+        self._more = int(zmq.SNDMORE) if stamped else 0
+        self._frame_flags = int(zmq.NOBLOCK) | self._more
+        self.sockets = sockets or get_socket_factory()
+
+        options = self.sockets.options
+        self.maxsize = ((options[LINK_PUSH].sndhwm or 1000) +
+                        (options[LINK_PULL].rcvhwm or 1000))
+
+        self._push: Optional[zmq.Socket] = None
+        self._pull: Optional[zmq.Socket] = None
+        self._packb = msgpack.Packer(default=_pack_default).pack
+
+        # Statistics (each counter has a single writer thread)
+        self.puts = 0
+        self.gets = 0
+        self.drops = 0
+        self.high_water = 0
+
+    # --- Producer side ---
+
+    def put(self, item: Any, block: bool = True, timeout: Optional[float] = None) -> None:
+        """
+        Send an item to the consumer stage.
+
+        Args:
+            item: Tick, dict or any msgpack-serializable value
+            block: Wait while the pipe is full
+            timeout: Max wait (seconds, None = forever)
+
+        Raises:
+            queue.Full: Pipe still full after ``timeout`` (or at once if not block)
+        """
+        sock = self._push
+        if sock is None:
+            sock = self._push = self.sockets.socket(LINK_PUSH, self.address, bind=False)
+
+        frame = self._packb(item)
+        try:
+            # Fast path: the pipe has room (no poll() round trip)
+            sock.send(frame, zmq.NOBLOCK)
+        except zmq.Again:
+            if not block or (timeout is not None and
+                             not sock.poll(int(timeout * 1000), zmq.POLLOUT)):
+                self.drops += 1
+                raise queue.Full from None
+            sock.send(frame)
+
+        self.puts += 1
+        pending = self.puts - self.gets
+        if pending > self.high_water:
+            self.high_water = pending
+
+    def put_frame(
+        self,
+        frame: bytes,
+        recv_ns: int = 0,
+        block: bool = True,
+        timeout: Optional[float] = None
+    ) -> None:
+        """
+        Send an already-encoded frame to the consumer stage (not packed again).
+
+        Args:
+            frame: Frame as received (e.g. a Feeder tick frame)
+            recv_ns: Receive stamp for the decoder (sent as a second
+                message part on stamped links, dropped otherwise)
+            block: Wait while the pipe is full
+            timeout: Max wait (seconds, None = forever)
+
+        Raises:
+            queue.Full: Pipe still full after ``timeout`` (or at once if not block)
+        """
+        sock = self._push
+        if sock is None:
+            sock = self._push = self.sockets.socket(LINK_PUSH, self.address, bind=False)
+
+        # copy=False: pyzmq still copies frames under zmq.COPY_THRESHOLD,
+        # which is cheaper than pinning a buffer that small
+        more = self._more
+        try:
+            sock.send(frame, self._frame_flags, copy=False)
+        except zmq.Again:
+            if not block or (timeout is not None and
+                             not sock.poll(int(timeout * 1000), zmq.POLLOUT)):
+                self.drops += 1
+                raise queue.Full from None
+            sock.send(frame, more, copy=False)
+        if more:
+            # Parts of one message are queued together: this never blocks
+            sock.send(recv_ns.to_bytes(8, 'little'))
+
+        self.puts += 1
+        pending = self.puts - self.gets
+        if pending > self.high_water:
+            self.high_water = pending
+
+    # --- Consumer side ---
+
+    def get(self, block: bool = True, timeout: Optional[float] = None) -> Any:
+        """
+        Take the next item (queue.Queue compatible).
+
+        Args:
+            block: Wait for an item
+            timeout: Max wait (seconds, None = forever)
+
+        Raises:
+            queue.Empty: If nothing arrives in time
+        """
+        sock = self._pull
+        if sock is None:
+            sock = self._pull = self.sockets.socket(LINK_PULL, self.address)
+
+        try:
+            # Fast path: an item is already waiting (no poll() round trip)
+            frame = sock.recv(zmq.NOBLOCK)
+        except zmq.Again:
+            if not block or (timeout is not None and not sock.poll(int(timeout * 1000))):
+                raise queue.Empty from None
+            frame = sock.recv()
+
+        self.gets += 1
+        if self.decoder is not None:
+            recv_ns = int.from_bytes(sock.recv(), 'little') if self.stamped else 0
+            return self.decoder(frame, recv_ns)
+        if self.item_type is None:
+            return msgpack.unpackb(frame, ext_hook=_ext_hook)
+        return _new_item(self.item_type, msgpack.unpackb(frame, use_list=False))
+
+    def get_nowait(self) -> Any:
+        """Take the next item without waiting (raises queue.Empty)."""
+        return self.get(block=False)
+
+    def qsize(self) -> int:
+        """Items put but not yet taken in this process."""
+        return max(0, self.puts - self.gets)
+
+    def empty(self) -> bool:
+        return self.qsize() == 0
+
+    # --- Monitoring / shutdown ---
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get link statistics (same keys as BoundedQueue.get_stats).
+
+        Returns:
+            Dictionary with local size, puts, drops and high-water mark
+        """
+        return {
+            'name': self.name,
+            'policy': self.policy,
+            'size': self.qsize(),
+            'maxsize': self.maxsize,
+            'puts': self.puts,
+            'drops': self.drops,
+            'conflated': 0,
+            'high_water': self.high_water,
+        }
+
+    def close(self) -> None:
+        """
+        Close both ends (after the stages using them have stopped).
+
+        The producer end keeps its LINGER so items still in flight over
+        ipc/tcp reach the consumer; the consumer end drops what is left.
+        """
+        if self._push is not None:
+            self._push.close()
+        if self._pull is not None:
+            self._pull.close(linger=0)
+        self._push = self._pull = None
+
+
+def create_stage_link(
+    address: str,
+    name: str = 'link',
+    item_type: Optional[type] = None,
+    sockets: Optional[SocketFactory] = None,
+    decoder: Optional[Callable[[bytes, int], Any]] = None,
+    stamped: bool = False
+) -> StageLink:
+    """
+    Factory function to create a stage link.
+
+    Args:
+        address: ZMQ endpoint (inproc://, ipc:// or tcp://)
+        name: Name used in statistics
+        item_type: NamedTuple class to rebuild items as (e.g. Tick)
+        sockets: Socket factory (default: the shared one)
+        decoder: decoder(frame, recv_ns) -> item for links fed with put_frame()
+        stamped: Send each frame's recv_ns along with it
+
+    Returns:
+        StageLink instance (sockets open on first put/get)
+    """
+    return StageLink(address, name, item_type, sockets, decoder, stamped)
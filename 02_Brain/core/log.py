@@ -0,0 +1,194 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+FlashEASuite V2 - Logging
+Asynchronous, rate-limited structured logging for the worker threads
+
+Workers log through a QueueHandler: a call only filters the record and
+puts it on an in-memory queue. A QueueListener thread does the actual
+console and file I/O, so a slow terminal (Windows console, SSH) never
+stalls ingestion or the strategy loop.
+
+Console lines use config.LOG_FORMAT; the log file gets one JSON object
+per line. Structured fields and rate limiting are passed via ``extra``:
+
+    logger.warning("Parse error: %s", e, extra={'rate_key': 'ingestion.parse'})
+    logger.info("Trade result", extra={'fields': {'ticket': 123, 'profit': 4.2}})
+
+Records with the same ``rate_key`` are let through at most once per
+``rate_limit_seconds``; the next one that passes carries the number of
+suppressed records.
+"""
+
+import json
+import logging
+import logging.handlers
+import os
+import queue
+import sys
+import threading
+import time
+from datetime import datetime, timezone
+from typing import Dict, Optional
+
+ROOT_LOGGER = "flashea"
+
+_listener: Optional[logging.handlers.QueueListener] = None
+_handler: Optional[logging.handlers.QueueHandler] = None
+
+
+def get_logger(name: str) -> logging.Logger:
+    """
+    Get a Brain logger.
+
+    Args:
+        name: Component name (e.g. 'ingestion', 'strategy.policy')
+
+    Returns:
+        Logger under the ``flashea`` hierarchy
+    """
+    return logging.getLogger(f"{ROOT_LOGGER}.{name}")
+
+
+class RateLimitFilter(logging.Filter):
+    """
+    Drop repeats of a rate-limited message (records with ``rate_key``).
+
+    Runs in the logging thread before the record is queued, so dropped
+    records cost one dict lookup. Records without ``rate_key`` always pass.
+    """
+
+    def __init__(self, interval: float = 10.0):
+        """
+        Args:
+            interval: Minimum seconds between records with the same key
+        """
+        super().__init__()
+        self.interval = interval
+        self._next_allowed: Dict[str, float] = {}
+        self._suppressed: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        key = getattr(record, 'rate_key', None)
+        if key is None:
+            return True
+
+        now = time.monotonic()
+        with self._lock:
+            if now < self._next_allowed.get(key, 0.0):
+                self._suppressed[key] = self._suppressed.get(key, 0) + 1
+                return False
+            self._next_allowed[key] = now + self.interval
+            suppressed = self._suppressed.pop(key, 0)
+
+        if suppressed:
+            record.suppressed = suppressed
+        return True
+
+    def get_stats(self) -> Dict[str, int]:
+        """Records suppressed per key since each key last passed."""
+        with self._lock:
+            return dict(self._suppressed)
+
+
+class JsonFormatter(logging.Formatter):
+    """One JSON object per record: time, level, logger, thread, message, fields."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            'ts': datetime.fromtimestamp(record.created, timezone.utc)
+                          .isoformat(timespec='milliseconds'),
+            'level': record.levelname,
+            'logger': record.name,
+            'thread': record.threadName,
+            'msg': record.getMessage(),
+        }
+        fields = getattr(record, 'fields', None)
+        if fields:
+            entry.update(fields)
+        suppressed = getattr(record, 'suppressed', 0)
+        if suppressed:
+            entry['suppressed'] = suppressed
+        if record.exc_info:
+            entry['exc'] = self.formatException(record.exc_info)
+        return json.dumps(entry, ensure_ascii=False, default=str)
+
+
+class _ConsoleFormatter(logging.Formatter):
+    """config.LOG_FORMAT plus a note for suppressed repeats."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        text = super().format(record)
+        suppressed = getattr(record, 'suppressed', 0)
+        if suppressed:
+            text += f" (+{suppressed} similar suppressed)"
+        return text
+
+
+def setup_logging(
+    level: str = "INFO",
+    log_file: Optional[str] = None,
+    console_format: str = "%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+    rate_limit_seconds: float = 10.0,
+    max_file_bytes: int = 64 * 1024 * 1024,
+    backup_count: int = 5
+) -> logging.handlers.QueueListener:
+    """
+    Route the ``flashea`` loggers through a queue to console and file.
+
+    Safe to call again (e.g. in a forked child): the previous setup is
+    replaced.
+
+    Args:
+        level: LOG_LEVEL name (DEBUG, INFO, WARNING, ERROR, CRITICAL)
+        log_file: JSON lines file (None = console only)
+        console_format: logging format string for the console
+        rate_limit_seconds: Minimum gap between records with the same rate_key
+        max_file_bytes: Rotate the log file at this size
+        backup_count: Rotated files to keep
+
+    Returns:
+        The running QueueListener
+    """
+    shutdown_logging()
+
+    console = logging.StreamHandler(sys.stdout)
+    console.setFormatter(_ConsoleFormatter(console_format))
+    handlers = [console]
+
+    if log_file:
+        directory = os.path.dirname(log_file)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        file_handler = logging.handlers.RotatingFileHandler(
+            log_file, maxBytes=max_file_bytes, backupCount=backup_count, encoding="utf-8")
+        file_handler.setFormatter(JsonFormatter())
+        handlers.append(file_handler)
+
+    global _listener, _handler
+    _handler = logging.handlers.QueueHandler(queue.SimpleQueue())
+    _handler.addFilter(RateLimitFilter(rate_limit_seconds))
+
+    root = logging.getLogger(ROOT_LOGGER)
+    root.setLevel(level)
+    root.addHandler(_handler)
+    root.propagate = False
+
+    _listener = logging.handlers.QueueListener(
+        _handler.queue, *handlers, respect_handler_level=True)
+    _listener.start()
+    return _listener
+
+
+def shutdown_logging() -> None:
+    """Write out queued records and stop the listener thread."""
+    global _listener, _handler
+    if _handler is not None:
+        logging.getLogger(ROOT_LOGGER).removeHandler(_handler)
+        _handler = None
+    if _listener is not None:
+        _listener.stop()
+        for handler in _listener.handlers:
+            handler.close()
+        _listener = None
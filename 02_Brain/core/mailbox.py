@@ -0,0 +1,190 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+FlashEASuite V2 - Conflating Mailbox
+Per-symbol latest-value handoff between ingestion and strategy
+
+Under a burst the strategy engine only needs the newest price for each
+symbol. The mailbox keeps one slot per symbol holding the latest tick,
+how many ticks were coalesced into it, and the bid/ask range seen since
+the engine last read it.
+"""
+
+import queue
+import threading
+import time
+from typing import Any, Dict, List, NamedTuple, Optional
+
+from .tick_codec import Tick
+
+# Slot layout (mutable list, reused while the symbol is pending)
+_TICK, _COUNT, _BID_LOW, _BID_HIGH, _ASK_LOW, _ASK_HIGH = range(6)
+
+
+class MailboxUpdate(NamedTuple):
+    """Latest tick for a symbol plus what was coalesced since the last read."""
+    tick: Tick
+    count: int          # Ticks received since the last read (>= 1)
+    bid_low: float
+    bid_high: float
+    ask_low: float
+    ask_high: float
+
+
+class ConflatingMailbox:
+    """
+    Latest-value-per-symbol mailbox (single producer, single consumer).
+
+    Exposes the queue.Queue subset used by the Brain workers
+    (put/get/get_nowait/qsize/empty), so it can replace ingestion_queue
+    directly. put() never blocks: a tick for a symbol that is already
+    pending overwrites it and bumps the coalesced count. The engine
+    should use drain() to take at most one update per symbol per cycle.
+    """
+
+    def __init__(self, name: str = 'Ingestion'):
+        """
+        Initialize mailbox.
+
+        Args:
+            name: Name used in statistics
+        """
+        self.name = name
+        self.policy = 'conflate_mailbox'
+        self.maxsize = 0  # Bounded by the number of symbols
+
+        self._lock = threading.Lock()
+        self._not_empty = threading.Condition(self._lock)
+
+        # symbol -> slot, in order of first arrival since the last read
+        self._slots: Dict[str, list] = {}
+
+        # Statistics (guarded by self._lock)
+        self.puts = 0
+        self.conflated = 0
+        self.high_water = 0
+        self.max_coalesced = 0
+
+    # --- Producer side ---
+
+    def put(self, tick: Tick, block: bool = True, timeout: Optional[float] = None) -> None:
+        """
+        Publish a tick for its symbol (never blocks).
+
+        Args:
+            tick: Decoded Tick
+            block: Ignored (queue.Queue compatibility)
+            timeout: Ignored (queue.Queue compatibility)
+        """
+        bid = tick.bid
+        ask = tick.ask
+
+        with self._lock:
+            self.puts += 1
+            slot = self._slots.get(tick.symbol)
+
+            if slot is None:
+                self._slots[tick.symbol] = [tick, 1, bid, bid, ask, ask]
+                if len(self._slots) > self.high_water:
+                    self.high_water = len(self._slots)
+                self._not_empty.notify()
+                return
+
+            slot[_TICK] = tick
+            slot[_COUNT] += 1
+            if bid < slot[_BID_LOW]:
+                slot[_BID_LOW] = bid
+            elif bid > slot[_BID_HIGH]:
+                slot[_BID_HIGH] = bid
+            if ask < slot[_ASK_LOW]:
+                slot[_ASK_LOW] = ask
+            elif ask > slot[_ASK_HIGH]:
+                slot[_ASK_HIGH] = ask
+            self.conflated += 1
+
+    # --- Consumer side ---
+
+    def drain(self, timeout: Optional[float] = None) -> List[MailboxUpdate]:
+        """
+        Take every pending update at once (one per symbol).
+
+        Args:
+            timeout: Max time to wait for the first update
+                (None = wait forever, 0 = don't wait)
+
+        Returns:
+            List of MailboxUpdate in order of first arrival (may be empty)
+        """
+        with self._not_empty:
+            if not self._slots and timeout != 0:
+                self._not_empty.wait(timeout)
+
+            if not self._slots:
+                return []
+
+            slots = self._slots
+            self._slots = {}
+
+            for slot in slots.values():
+                if slot[_COUNT] > self.max_coalesced:
+                    self.max_coalesced = slot[_COUNT]
+
+        return [MailboxUpdate(*slot) for slot in slots.values()]
+
+    def get(self, block: bool = True, timeout: Optional[float] = None) -> MailboxUpdate:
+        """
+        Take the oldest pending update (queue.Queue compatible).
+
+        Raises:
+            queue.Empty: If nothing arrives in time
+        """
+        with self._not_empty:
+            if block:
+                deadline = None if timeout is None else time.monotonic() + timeout
+                while not self._slots:
+                    remaining = None if deadline is None else deadline - time.monotonic()
+                    if remaining is not None and remaining <= 0:
+                        raise queue.Empty
+                    self._not_empty.wait(remaining)
+            elif not self._slots:
+                raise queue.Empty
+
+            symbol = next(iter(self._slots))
+            slot = self._slots.pop(symbol)
+            if slot[_COUNT] > self.max_coalesced:
+                self.max_coalesced = slot[_COUNT]
+
+        return MailboxUpdate(*slot)
+
+    def get_nowait(self) -> MailboxUpdate:
+        """Take the oldest pending update without waiting."""
+        return self.get(block=False)
+
+    # --- Monitoring ---
+
+    def qsize(self) -> int:
+        """Number of symbols with a pending update."""
+        return len(self._slots)
+
+    def empty(self) -> bool:
+        return not self._slots
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get mailbox statistics (same keys as BoundedQueue.get_stats).
+
+        Returns:
+            Dictionary with pending symbols, puts and conflation counts
+        """
+        with self._lock:
+            return {
+                'name': self.name,
+                'policy': self.policy,
+                'size': len(self._slots),
+                'maxsize': self.maxsize,
+                'puts': self.puts,
+                'drops': 0,
+                'conflated': self.conflated,
+                'high_water': self.high_water,
+                'max_coalesced': self.max_coalesced,
+            }
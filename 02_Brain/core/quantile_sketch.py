@@ -0,0 +1,191 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+FlashEASuite V2 - Quantile Sketch
+Streaming quantiles in constant memory (P²), over a rolling window
+
+P2Quantiles tracks a fixed set of quantiles with the extended P²
+algorithm (Jain & Chlamtac, extended to several quantiles by
+Raatikainen): m quantiles use 2m+3 markers whose heights are moved
+towards their target ranks with a piecewise-parabolic fit as values
+arrive. Nothing is stored beyond the markers, so memory and the cost
+per value stay the same however long the stream runs.
+
+A P² sketch cannot forget old values, so RollingQuantiles keeps two of
+them and starts a new one every half window. The older sketch answers,
+which means an estimate covers between half a window and a whole
+window of the latest values.
+"""
+
+from bisect import bisect_right
+from typing import Dict, List, Optional, Sequence
+
+
+class P2Quantiles:
+    """
+    Extended P² estimator for several quantiles of one stream.
+
+    Until 2m+3 values have been seen the values themselves are kept
+    and quantiles are exact (nearest rank); after that they are
+    estimates.
+    """
+
+    __slots__ = ('probs', 'count', '_size', '_heights', '_positions', '_desired', '_increments')
+
+    def __init__(self, probs: Sequence[float] = (0.5, 0.9, 0.99)):
+        """
+        Initialize sketch.
+
+        Args:
+            probs: Quantiles to track, increasing, each in (0, 1)
+
+        Raises:
+            ValueError: If probs is empty, unsorted or out of range
+        """
+        probs = tuple(probs)
+        if not probs or any(not 0.0 < p < 1.0 for p in probs) or list(probs) != sorted(set(probs)):
+            raise ValueError(f"Quantiles must be increasing and in (0, 1): {probs}")
+
+        # Marker ranks: 0, p1/2, p1, (p1+p2)/2, p2, ..., pm, (pm+1)/2, 1
+        increments = [0.0]
+        for p in probs + (1.0,):
+            increments += [(increments[-1] + p) / 2.0, p]
+
+        self.probs = probs
+        self.count = 0
+        self._size = len(increments)
+        self._increments = increments
+        self._heights: List[float] = []     # Warm-up: the values seen so far
+        self._positions: List[int] = []
+        self._desired: List[float] = []
+
+    def add(self, value: float) -> None:
+        """Add one value (O(m))."""
+        heights = self._heights
+        count = self.count = self.count + 1
+        size = self._size
+        if count <= size:
+            heights.append(value)
+            if count == size:
+                heights.sort()
+                self._positions = list(range(size))
+                self._desired = [(size - 1) * dp for dp in self._increments]
+            return
+
+        # Cell of the new value; markers above it move up one rank
+        last = size - 1
+        if value < heights[0]:
+            heights[0] = value
+            k = 1
+        elif value >= heights[last]:
+            heights[last] = value
+            k = last
+        else:
+            k = bisect_right(heights, value)
+        positions = self._positions
+        for i in range(k, size):
+            positions[i] += 1
+
+        # Move the inner markers that are a rank or more off their target
+        desired = self._desired
+        increments = self._increments
+        for i in range(1, last):
+            desired[i] += increments[i]
+            n = positions[i]
+            d = desired[i] - n
+            if d >= 1.0:
+                if positions[i + 1] - n <= 1:
+                    continue
+                s = 1
+            elif d <= -1.0:
+                if positions[i - 1] - n >= -1:
+                    continue
+                s = -1
+            else:
+                continue
+
+            q, q_prev, q_next = heights[i], heights[i - 1], heights[i + 1]
+            n_prev, n_next = positions[i - 1], positions[i + 1]
+            parabolic = q + s / (n_next - n_prev) * (
+                (n - n_prev + s) * (q_next - q) / (n_next - n)
+                + (n_next - n - s) * (q - q_prev) / (n - n_prev))
+            if q_prev < parabolic < q_next:
+                heights[i] = parabolic
+            else:
+                heights[i] = q + s * (heights[i + s] - q) / (positions[i + s] - n)
+            positions[i] = n + s
+
+    def quantiles(self) -> Dict[float, float]:
+        """
+        Current estimates.
+
+        Returns:
+            Dictionary of quantile -> value (empty before the first value)
+        """
+        count = self.count
+        if count == 0:
+            return {}
+        if count < self._size:
+            sample = sorted(self._heights)
+            return {p: sample[int(p * (count - 1) + 0.5)] for p in self.probs}
+        heights = self._heights
+        return {p: heights[2 * i + 2] for i, p in enumerate(self.probs)}
+
+
+class RollingQuantiles:
+    """
+    Quantiles of the values added over roughly the last ``window`` seconds.
+
+    Time comes from the caller (e.g. the Feeder's tick time), so a
+    replay gives the same estimates as the live session. Time must not
+    go backwards; values stamped earlier count in the current half.
+    """
+
+    def __init__(self, window: float = 900.0, probs: Sequence[float] = (0.5, 0.9, 0.99)):
+        """
+        Initialize rolling sketch.
+
+        Args:
+            window: Window length in seconds
+            probs: Quantiles to track (see P2Quantiles)
+        """
+        self.window = window
+        self.probs = tuple(probs)
+        self._half = window / 2.0
+        self._generation: Optional[int] = None    # Half-window the newer sketch started in
+        self._older = P2Quantiles(self.probs)
+        self._newer = self._older
+
+    def add(self, value: float, now: float) -> None:
+        """
+        Add one value.
+
+        Args:
+            value: Value to add
+            now: Time of the value in seconds
+        """
+        generation = int(now / self._half)
+        if self._generation is None or generation > self._generation:
+            if self._generation is not None and generation == self._generation + 1:
+                self._older = self._newer
+            else:
+                self._older = P2Quantiles(self.probs)   # Start (or a gap of a whole window)
+            self._newer = P2Quantiles(self.probs)
+            self._generation = generation
+
+        self._older.add(value)
+        self._newer.add(value)
+
+    @property
+    def count(self) -> int:
+        """Values behind the current estimates."""
+        return self._older.count
+
+    def quantiles(self) -> Dict[float, float]:
+        """
+        Current estimates (from the older sketch).
+
+        Returns:
+            Dictionary of quantile -> value (empty before the first value)
+        """
+        return self._older.quantiles()
@@ -0,0 +1,171 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+FlashEASuite V2 - Pipeline Queues
+Bounded thread-safe queues with selectable backpressure policies
+
+Drop-in replacement for queue.Queue between Brain stages. What happens
+when the queue is full is chosen per queue:
+
+- block:       standard queue.Queue behaviour (producer waits / Full)
+- drop_oldest: evict the oldest item to make room for the new one
+- drop_newest: discard the incoming item
+- conflate:    keep only the latest item per key (SYMBOL_KEY for tick
+               queues); if full, evict the oldest key
+"""
+
+import queue
+from collections import OrderedDict, deque
+from operator import attrgetter
+from typing import Any, Callable, Dict, Optional
+
+# Backpressure policies
+POLICY_BLOCK = 'block'
+POLICY_DROP_OLDEST = 'drop_oldest'
+POLICY_DROP_NEWEST = 'drop_newest'
+POLICY_CONFLATE = 'conflate'
+
+POLICIES = (POLICY_BLOCK, POLICY_DROP_OLDEST, POLICY_DROP_NEWEST, POLICY_CONFLATE)
+
+# Conflation key of queues that carry ticks (latest tick per symbol)
+SYMBOL_KEY = attrgetter('symbol')
+
+
+class BoundedQueue(queue.Queue):
+    """
+    queue.Queue with a backpressure policy and drop/high-water statistics.
+
+    Producers using a drop or conflate policy never block and never see
+    queue.Full. Consumers use the normal get()/get_nowait() interface.
+    """
+
+    def __init__(
+        self,
+        maxsize: int,
+        policy: str = POLICY_BLOCK,
+        name: str = 'queue',
+        key: Optional[Callable[[Any], Any]] = None
+    ):
+        """
+        Initialize bounded queue.
+
+        Args:
+            maxsize: Maximum number of items (must be > 0)
+            policy: One of POLICIES
+            name: Name used in statistics
+            key: Conflation key (required by the conflate policy, ignored
+                by the others); SYMBOL_KEY for tick queues
+
+        Raises:
+            ValueError: Unknown policy, maxsize <= 0, or conflate without key
+        """
+        if policy not in POLICIES:
+            raise ValueError(f"Unknown queue policy '{policy}' "
+                             f"(expected one of {', '.join(POLICIES)})")
+        if maxsize <= 0:
+            raise ValueError("maxsize must be positive for a bounded queue")
+        if policy == POLICY_CONFLATE and key is None:
+            raise ValueError(f"Queue '{name}': the conflate policy needs a key= "
+                             f"(SYMBOL_KEY for tick queues)")
+
+        self.policy = policy
+        self.name = name
+        self._key = key
+
+        # Statistics (guarded by self.mutex)
+        self.puts = 0
+        self.drops = 0
+        self.conflated = 0
+        self.high_water = 0
+
+        super().__init__(maxsize)
+
+    # --- queue.Queue storage hooks (called with self.mutex held) ---
+
+    def _init(self, maxsize: int) -> None:
+        if self.policy == POLICY_CONFLATE:
+            self.queue = OrderedDict()
+        else:
+            self.queue = deque()
+
+    def _put(self, item: Any) -> None:
+        if self.policy == POLICY_CONFLATE:
+            self.queue[self._key(item)] = item
+        else:
+            self.queue.append(item)
+
+        self.puts += 1
+        size = len(self.queue)
+        if size > self.high_water:
+            self.high_water = size
+
+    def _get(self) -> Any:
+        if self.policy == POLICY_CONFLATE:
+            return self.queue.popitem(last=False)[1]
+        return self.queue.popleft()
+
+    # --- Producer side ---
+
+    def put(self, item: Any, block: bool = True, timeout: Optional[float] = None) -> None:
+        """
+        Put an item, applying the queue's backpressure policy when full.
+
+        Args:
+            item: Item to enqueue
+            block: Block while full (block policy only)
+            timeout: Max time to block (block policy only)
+        """
+        if self.policy == POLICY_BLOCK:
+            try:
+                super().put(item, block, timeout)
+            except queue.Full:
+                # The producer gives up on the item: count it as a drop
+                with self.mutex:
+                    self.drops += 1
+                raise
+            return
+
+        with self.not_full:
+            if self.policy == POLICY_CONFLATE:
+                key = self._key(item)
+                if key in self.queue:
+                    # Replace in place: the key keeps its turn in line
+                    self.queue[key] = item
+                    self.puts += 1
+                    self.conflated += 1
+                    return
+
+            if self._qsize() >= self.maxsize:
+                if self.policy == POLICY_DROP_NEWEST:
+                    self.drops += 1
+                    return
+
+                # drop_oldest / conflate: make room
+                self._get()
+                self.drops += 1
+                self.unfinished_tasks -= 1
+
+            self._put(item)
+            self.unfinished_tasks += 1
+            self.not_empty.notify()
+
+    # --- Monitoring ---
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get queue statistics.
+
+        Returns:
+            Dictionary with size, drops and high-water mark
+        """
+        with self.mutex:
+            return {
+                'name': self.name,
+                'policy': self.policy,
+                'size': self._qsize(),
+                'maxsize': self.maxsize,
+                'puts': self.puts,
+                'drops': self.drops,
+                'conflated': self.conflated,
+                'high_water': self.high_water,
+            }
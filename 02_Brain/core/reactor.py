@@ -0,0 +1,280 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+FlashEASuite V2 - Brain Reactor (Single-Threaded Mode)
+Ingestion, strategy and feedback on one zmq.Poller loop
+
+Polls the Feeder SUB socket (7777) and the Trader PULL socket (7779)
+from a single thread, runs analysis inline and publishes policies on
+the PUB socket (7778). No Python queues and no cross-thread handoffs
+sit between receiving a tick and acting on it.
+"""
+
+import zmq
+import threading
+import time
+from typing import Dict, Any, Optional, Sequence
+
+from .execution_listener import parse_trade_result, log_trade_result
+from .journal import TickJournal
+from .latency import DECODE, LatencyRecorder
+from .log import get_logger
+from .sockets import RESULT_PULL, TICK_SUB, SocketFactory
+from .strategy.engine import StrategyEngineThreaded
+from .tick_codec import TickDecoder
+from .tick_store import TickStore
+
+logger = get_logger("reactor")
+
+
+class BrainReactor(StrategyEngineThreaded):
+    """
+    Single-threaded reactor running the whole Brain pipeline.
+
+    Reuses the Strategy Engine's tick processing, feedback handling and
+    periodic tasks. Ticks received in one poll cycle are conflated per
+    symbol (like ConflatingMailbox), so each symbol is analyzed at most
+    once per cycle with the coalesced tick count.
+    """
+
+    def __init__(
+        self,
+        shutdown_event: threading.Event,
+        zmq_sub_address: str = "tcp://127.0.0.1:7777",
+        zmq_pub_address: str = "tcp://127.0.0.1:7778",
+        zmq_pull_address: str = "tcp://127.0.0.1:7779",
+        tick_store: Optional[TickStore] = None,
+        journal: Optional[TickJournal] = None,
+        latency: Optional[LatencyRecorder] = None,
+        sockets: Optional[SocketFactory] = None,
+        grid_symbols: Optional[Sequence[str]] = None,
+        policy_encoding: str = 'compact'
+    ):
+        """
+        Initialize Brain Reactor.
+
+        Args:
+            shutdown_event: Event to signal shutdown
+            zmq_sub_address: ZMQ address for Feeder ticks (bind)
+            zmq_pub_address: ZMQ address to publish policies (bind)
+            zmq_pull_address: ZMQ address for trade results (bind)
+            tick_store: Per-symbol tick rings (created if None)
+            journal: Raw frame journal (None = don't record)
+            latency: Stage latency histograms (None = don't stamp ticks)
+            sockets: Socket factory (default: the shared one)
+            grid_symbols: Symbols that always get a Grid policy
+            policy_encoding: Policy payload encoding ('compact' or 'verbose')
+        """
+        super().__init__(
+            ingestion_queue=None,
+            signal_queue=None,
+            feedback_queue=None,
+            shutdown_event=shutdown_event,
+            zmq_pub_address=zmq_pub_address,
+            tick_store=tick_store if tick_store is not None else TickStore(),
+            latency=latency,
+            sockets=sockets,
+            grid_symbols=grid_symbols,
+            policy_encoding=policy_encoding
+        )
+        self.name = "BrainReactor"
+        self.zmq_sub_address = zmq_sub_address
+        self.zmq_pull_address = zmq_pull_address
+
+        # Extra sockets (PUB is created by the engine)
+        self.sub_socket = None
+        self.pull_socket = None
+
+        self.decoder = TickDecoder()
+        self.journal = journal
+
+        # Statistics
+        self.message_count = 0
+        self.feedback_count = 0
+        self.error_count = 0
+
+    def _setup_zmq(self) -> bool:
+        """Setup PUB (via engine), SUB and PULL sockets from the factory."""
+        if not super()._setup_zmq():
+            return False
+
+        try:
+            self.sub_socket = self.sockets.socket(TICK_SUB, self.zmq_sub_address)
+            self.pull_socket = self.sockets.socket(RESULT_PULL, self.zmq_pull_address)
+
+            print(f"📥 REACTOR: Ticks on {self.zmq_sub_address}, "
+                  f"trade results on {self.zmq_pull_address}")
+            return True
+
+        except Exception as e:
+            print(f"❌ REACTOR: Failed to setup ZMQ: {e}")
+            return False
+
+    def get_sequence_stats(self) -> Dict[str, Any]:
+        """
+        Get SEQ_ID loss counters (gaps, duplicates, reorders per Feeder).
+
+        Returns:
+            Decoder statistics dictionary
+        """
+        return self.decoder.get_stats()
+
+    def _poll_feedback(self) -> int:
+        """Drain pending trade results from the PULL socket (bounded)."""
+        processed = 0
+        while processed < self.FEEDBACK_BATCH_SIZE:
+            try:
+                raw_data = self.pull_socket.recv(zmq.NOBLOCK)
+            except zmq.Again:
+                break
+
+            processed += 1
+            result = parse_trade_result(raw_data)
+            if result:
+                self.feedback_count += 1
+                log_trade_result(result, self.feedback_count)
+                self.feedback_processor.process_feedback(result)
+
+        return processed
+
+    def _poll_ticks(self) -> int:
+        """
+        Drain pending ticks from the SUB socket (bounded), store each one,
+        then analyze the latest tick per symbol.
+        """
+        decode = self.decoder.decode
+        feeder = self.zmq_sub_address
+        store = self.tick_store
+        journal = self.journal
+        latency = self.latency
+        stamp_wall = journal is not None or latency is not None
+        latest = {}
+        counts = {}
+        received = 0
+
+        while received < self.TICK_BATCH_SIZE:
+            try:
+                raw_data = self.sub_socket.recv(zmq.NOBLOCK)
+            except zmq.Again:
+                break
+
+            received += 1
+            recv_ns = time.perf_counter_ns() if latency is not None else 0
+            wall_ns = time.time_ns() if stamp_wall else 0
+            try:
+                tick = decode(raw_data, feeder, recv_ns)
+            except ValueError as e:
+                logger.warning("⚠️ REACTOR: Parse error: %s", e,
+                               extra={'rate_key': 'reactor.parse_error'})
+                self.error_count += 1
+                if journal is not None:
+                    journal.append(raw_data, wall_ns)
+                continue
+
+            if journal is not None:
+                journal.append(raw_data, wall_ns, tick.seq, tick.time_msc)
+            if latency is not None:
+                latency.record(DECODE, recv_ns)
+                latency.record_wire(tick.time_msc, wall_ns // 1_000_000)
+
+            store.append(tick.symbol, tick.time_msc, tick.bid, tick.ask,
+                         tick.flags, tick.seq)
+            latest[tick.symbol] = tick
+            counts[tick.symbol] = counts.get(tick.symbol, 0) + 1
+
+        self.message_count += received
+
+        for symbol, tick in latest.items():
+            self._process_tick(tick, counts[symbol])
+
+        return received
+
+    def run(self) -> None:
+        """Main reactor loop."""
+        print("🔄 REACTOR: Worker started (single-threaded mode)")
+
+        # Setup ZMQ
+        if not self._setup_zmq():
+            print("❌ REACTOR: Failed to initialize, exiting")
+            return
+
+        poller = zmq.Poller()
+        poller.register(self.sub_socket, zmq.POLLIN)
+        poller.register(self.pull_socket, zmq.POLLIN)
+
+        self._schedule_jobs()
+        timers = self.timers
+
+        try:
+            while not self.shutdown_event.is_set():
+                # Wait for either socket until the next timer deadline
+                timeout = min(timers.time_until_next(self.MAX_IDLE_WAIT), self.MAX_IDLE_WAIT)
+                events = dict(poller.poll(timeout * 1000))
+
+                if self.pull_socket in events:
+                    self._poll_feedback()
+
+                if self.sub_socket in events:
+                    self._poll_ticks()
+
+                timers.run_due()
+
+        except Exception as e:
+            print(f"❌ REACTOR: Unexpected error: {e}")
+            import traceback
+            traceback.print_exc()
+
+        finally:
+            print(f"\n🛑 REACTOR: Shutting down "
+                  f"(Received: {self.message_count}, Ticks: {self.tick_count}, "
+                  f"Policies: {self.policy_count}, Lost: {self.decoder.total_lost()})")
+
+            for sock in (self.sub_socket, self.pull_socket, self.pub_socket):
+                if sock:
+                    sock.close()
+
+            print("✅ REACTOR: Worker stopped")
+
+
+def create_brain_reactor(
+    shutdown_event: threading.Event,
+    zmq_sub_address: str = "tcp://127.0.0.1:7777",
+    zmq_pub_address: str = "tcp://127.0.0.1:7778",
+    zmq_pull_address: str = "tcp://127.0.0.1:7779",
+    tick_store: Optional[TickStore] = None,
+    journal: Optional[TickJournal] = None,
+    latency: Optional[LatencyRecorder] = None,
+    sockets: Optional[SocketFactory] = None,
+    grid_symbols: Optional[Sequence[str]] = None,
+    policy_encoding: str = 'compact'
+) -> threading.Thread:
+    """
+    Factory function to create the single-threaded Brain Reactor.
+
+    Args:
+        shutdown_event: Shutdown event
+        zmq_sub_address: Feeder tick address
+        zmq_pub_address: Policy publish address
+        zmq_pull_address: Trade result address
+        tick_store: Per-symbol tick rings
+        journal: Raw frame journal (optional)
+        latency: Stage latency histograms (optional)
+        sockets: Socket factory (default: the shared one)
+        grid_symbols: Symbols that always get a Grid policy
+        policy_encoding: Policy payload encoding ('compact' or 'verbose')
+
+    Returns:
+        BrainReactor instance (not started)
+    """
+    return BrainReactor(
+        shutdown_event=shutdown_event,
+        zmq_sub_address=zmq_sub_address,
+        zmq_pub_address=zmq_pub_address,
+        zmq_pull_address=zmq_pull_address,
+        tick_store=tick_store,
+        journal=journal,
+        latency=latency,
+        sockets=sockets,
+        grid_symbols=grid_symbols,
+        policy_encoding=policy_encoding
+    )
@@ -0,0 +1,277 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+FlashEASuite V2 - Tick Replay
+Replays journaled Feeder frames into the Brain at a chosen speed
+
+Frames come from the tick journal (core/journal.py) and go either to
+the Brain's SUB port over ZMQ (exactly what the Feeder would send) or
+straight into an in-process ingestion stage (decode, TickStore, queue).
+
+Pacing follows the recorded receive times: speed 1.0 reproduces the
+original gaps, N replays N times faster, 0 sends as fast as possible.
+"""
+
+import time
+from typing import Any, Callable, Dict, Iterable, Iterator, List, NamedTuple, Optional, Sequence
+
+import zmq
+
+from .journal import JournalFrame, JournalReader, list_segments
+from .sockets import CurveKeys, apply_curve_client
+from .tick_codec import TickDecoder
+from .tick_store import TickStore
+
+
+class ReplaySample(NamedTuple):
+    """One progress sample taken during a replay."""
+    elapsed: float          # Seconds since the first frame was sent
+    sent: int               # Frames sent so far
+    rate: float             # Frames/s over the last interval
+    queue_size: int         # Engine queue depth (-1 if not observable)
+    queue_high_water: int   # Engine queue high-water mark (-1 if not observable)
+
+
+class ReplayReport(NamedTuple):
+    """Result of a finished replay."""
+    sent: int
+    wall_seconds: float
+    recorded_seconds: float
+    samples: List[ReplaySample]
+
+    @property
+    def ticks_per_second(self) -> float:
+        return self.sent / self.wall_seconds if self.wall_seconds > 0 else 0.0
+
+    @property
+    def effective_speed(self) -> float:
+        """Recorded time span divided by replay time."""
+        return self.recorded_seconds / self.wall_seconds if self.wall_seconds > 0 else 0.0
+
+
+def read_journal(
+    directory: str,
+    prefix: str = "ticks",
+    symbols: Optional[Sequence[str]] = None,
+    start_msc: Optional[int] = None,
+    end_msc: Optional[int] = None
+) -> Iterator[JournalFrame]:
+    """
+    Iterate journaled frames across segments, optionally filtered.
+
+    Time bounds use the Feeder time (time_msc, milliseconds); the start
+    bound seeks with each segment's block index. With any filter set,
+    frames that do not decode as ticks are skipped.
+
+    Args:
+        directory: Journal directory
+        prefix: Segment name prefix
+        symbols: Only these symbols (None = all)
+        start_msc: First Feeder time to include (inclusive)
+        end_msc: Last Feeder time to include (exclusive)
+    """
+    wanted = set(symbols) if symbols else None
+    filtered = wanted is not None or start_msc is not None or end_msc is not None
+    decode = TickDecoder(track_sequence=False).decode
+
+    for path in list_segments(directory, prefix):
+        with JournalReader(path) as reader:
+            index = reader.index
+            if end_msc is not None and len(index):
+                first_times = index['first_time_msc'][index['first_time_msc'] >= 0]
+                if len(first_times) and first_times[0] >= end_msc:
+                    break
+
+            frames = reader.frames_since(start_msc) if start_msc is not None else reader.frames()
+            for frame in frames:
+                if not filtered:
+                    yield frame
+                    continue
+
+                try:
+                    tick = decode(frame.payload)
+                except ValueError:
+                    continue
+
+                if end_msc is not None and tick.time_msc >= end_msc:
+                    return
+                if start_msc is not None and tick.time_msc < start_msc:
+                    continue
+                if wanted is not None and tick.symbol not in wanted:
+                    continue
+                yield frame
+
+
+class ZmqReplaySink:
+    """Send frames to the Brain's SUB port the way the Feeder does."""
+
+    def __init__(self, address: str = "tcp://127.0.0.1:7777", connect_delay: float = 1.0,
+                 curve: Optional[CurveKeys] = None):
+        """
+        Connect a PUB socket to the Brain.
+
+        Args:
+            address: Brain SUB address (the Brain binds, we connect)
+            connect_delay: Wait for the subscription to propagate (slow joiner)
+            curve: Connect as a Curve client (Brain running with CURVE_ENABLED)
+        """
+        self.context = zmq.Context()
+        self.socket = self.context.socket(zmq.PUB)
+        self.socket.setsockopt(zmq.SNDHWM, 0)
+        if curve is not None:
+            apply_curve_client(self.socket, curve)
+        self.socket.connect(address)
+        time.sleep(connect_delay)
+
+    def __call__(self, frame: JournalFrame) -> None:
+        self.socket.send(frame.payload)
+
+    def close(self) -> None:
+        self.socket.close(linger=1000)
+        self.context.term()
+
+
+class IngestionReplaySink:
+    """
+    Feed frames straight into the ingestion stage (no network).
+
+    Does what IngestionWorkerThreaded does per frame: decode with SEQ_ID
+    tracking, write the TickStore, put the tick on the ingestion queue.
+    """
+
+    def __init__(self, ingestion_queue: Any, tick_store: Optional[TickStore] = None,
+                 feeder: str = 'replay'):
+        """
+        Args:
+            ingestion_queue: Queue or mailbox the Strategy Engine drains
+            tick_store: Store shared with the engine (None = engine owns one)
+            feeder: Feeder name for SEQ_ID tracking
+        """
+        self.ingestion_queue = ingestion_queue
+        self.tick_store = tick_store
+        self.feeder = feeder
+        self.decoder = TickDecoder()
+
+    def __call__(self, frame: JournalFrame) -> None:
+        try:
+            tick = self.decoder.decode(frame.payload, self.feeder)
+        except ValueError:
+            return
+
+        if self.tick_store is not None:
+            self.tick_store.append(tick.symbol, tick.time_msc, tick.bid, tick.ask,
+                                   tick.flags, tick.seq)
+        self.ingestion_queue.put(tick, timeout=1.0)
+
+    def close(self) -> None:
+        pass
+
+
+class TickReplayer:
+    """
+    Paced replay of journaled frames into a sink.
+
+    Frames are scheduled on the recorded receive times (recv_ns) divided
+    by ``speed``. The replayer sleeps for gaps longer than a millisecond
+    and spins for the rest, so pacing holds at high tick rates.
+    """
+
+    SPIN_THRESHOLD_NS = 1_000_000   # Sleep only when the next frame is >1 ms away
+
+    def __init__(
+        self,
+        frames: Iterable[JournalFrame],
+        sink: Callable[[JournalFrame], None],
+        speed: float = 1.0,
+        report_interval: float = 1.0,
+        queue_stats: Optional[Callable[[], Dict[str, Any]]] = None,
+        on_sample: Optional[Callable[[ReplaySample], None]] = None
+    ):
+        """
+        Args:
+            frames: Frames to replay (e.g. read_journal(...))
+            sink: Called with each frame (ZmqReplaySink, IngestionReplaySink)
+            speed: 1.0 = original pacing, N = N x faster, 0 = as fast as possible
+            report_interval: Seconds between progress samples
+            queue_stats: Returns the engine queue's get_stats() (optional)
+            on_sample: Called with each progress sample (optional)
+        """
+        if speed < 0:
+            raise ValueError("speed must be >= 0 (0 = as fast as possible)")
+
+        self.frames = frames
+        self.sink = sink
+        self.speed = speed
+        self.report_interval = report_interval
+        self.queue_stats = queue_stats
+        self.on_sample = on_sample
+
+    def _sample(self, elapsed: float, sent: int, last_elapsed: float, last_sent: int) -> ReplaySample:
+        interval = elapsed - last_elapsed
+        rate = (sent - last_sent) / interval if interval > 0 else 0.0
+        size = high_water = -1
+        if self.queue_stats is not None:
+            stats = self.queue_stats()
+            size = stats['size']
+            high_water = stats['high_water']
+        return ReplaySample(elapsed, sent, rate, size, high_water)
+
+    def run(self) -> ReplayReport:
+        """
+        Replay every frame, then return the report.
+
+        Returns:
+            ReplayReport with totals and progress samples
+        """
+        sink = self.sink
+        speed = self.speed
+        spin = self.SPIN_THRESHOLD_NS
+        perf_ns = time.perf_counter_ns
+
+        samples = []
+        sent = 0
+        first_recv_ns = last_recv_ns = None
+        start_ns = 0
+        next_report_ns = 0
+        report_ns = int(self.report_interval * 1e9)
+        last_elapsed = 0.0
+        last_sent = 0
+
+        for frame in self.frames:
+            if first_recv_ns is None:
+                first_recv_ns = frame.recv_ns
+                start_ns = perf_ns()
+                next_report_ns = start_ns + report_ns
+            last_recv_ns = frame.recv_ns
+
+            if speed > 0:
+                due_ns = start_ns + int((frame.recv_ns - first_recv_ns) / speed)
+                wait_ns = due_ns - perf_ns()
+                if wait_ns > spin:
+                    time.sleep((wait_ns - spin) / 1e9)
+                while perf_ns() < due_ns:
+                    pass
+
+            sink(frame)
+            sent += 1
+
+            now_ns = perf_ns()
+            if now_ns >= next_report_ns:
+                elapsed = (now_ns - start_ns) / 1e9
+                sample = self._sample(elapsed, sent, last_elapsed, last_sent)
+                samples.append(sample)
+                if self.on_sample is not None:
+                    self.on_sample(sample)
+                last_elapsed, last_sent = elapsed, sent
+                next_report_ns = now_ns + report_ns
+
+        if sent == 0:
+            return ReplayReport(0, 0.0, 0.0, samples)
+
+        wall = (perf_ns() - start_ns) / 1e9
+        final = self._sample(wall, sent, last_elapsed, last_sent)
+        samples.append(final)
+        if self.on_sample is not None:
+            self.on_sample(final)
+
+        return ReplayReport(sent, wall, (last_recv_ns - first_recv_ns) / 1e9, samples)
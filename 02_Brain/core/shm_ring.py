@@ -0,0 +1,427 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+FlashEASuite V2 - Shared-Memory Tick Ring
+Single-producer / single-consumer tick ring between processes
+
+The ingestion process decodes ticks and writes them as fixed-size
+records into a ``multiprocessing.shared_memory`` block. The strategy
+process reads the records straight out of that block with NumPy: no
+pickling, no pipe, no copy through the multiprocessing machinery.
+
+Block layout:
+    header   32 x int64 (producer, consumer and statistics cache lines)
+    records  capacity x TICK_RECORD_DTYPE (capacity is a power of two)
+"""
+
+import multiprocessing
+import os
+import queue
+from multiprocessing import shared_memory
+from typing import Any, Dict, List, Optional, Sequence
+
+import numpy as np
+
+from .mailbox import MailboxUpdate
+from .tick_codec import TICK_MSG_TYPE, Tick
+from .tick_store import TickStore
+
+# Longest symbol name a record holds (MT5 allows up to 31 characters)
+SYMBOL_BYTES = 32
+
+TICK_RECORD_DTYPE = np.dtype([
+    ('time_msc', '<i8'),
+    ('seq', '<i8'),
+    ('bid', '<f8'),
+    ('ask', '<f8'),
+    ('flags', '<i4'),
+    ('symbol', f'S{SYMBOL_BYTES}'),
+    ('recv_ns', '<i8'),     # perf_counter_ns at receive (0 = not stamped)
+], align=True)
+
+# Header slots (int64). Each side writes only its own cache line.
+_HEADER_SLOTS = 32
+# Producer line
+_WRITE, _DROPPED, _DECODED, _ERRORS = 0, 1, 2, 3
+# Consumer line
+_READ, _WAITING = 8, 9
+# Feeder SEQ_ID statistics (producer writes, see publish_sequence_stats)
+_SEQ_FIELDS = ('last_seq', 'received', 'gaps', 'lost', 'duplicates', 'reorders', 'resets')
+_SEQ_BASE = 16
+
+_HEADER_BYTES = _HEADER_SLOTS * 8
+
+
+class SharedTickRing:
+    """
+    SPSC ring of tick records in shared memory.
+
+    The producer publishes records by advancing the write index after
+    the records are written; the consumer frees them by advancing the
+    read index after copying them out. When the ring is full the
+    producer drops the incoming ticks (it cannot evict records the
+    consumer may be reading) and counts them.
+
+    A consumer that finds the ring empty raises a "waiting" flag and
+    sleeps on a multiprocessing.Event; the producer only sets the event
+    when the flag is up, so a busy consumer costs no syscalls.
+
+    Create the ring in the parent process and pass it to the child
+    process as an argument: it pickles by shared memory name.
+    """
+
+    def __init__(
+        self,
+        capacity: int = 65536,
+        name: Optional[str] = None,
+        doorbell: Optional[Any] = None,
+        create: bool = True
+    ):
+        """
+        Create (or attach to) a ring.
+
+        Args:
+            capacity: Number of tick records (rounded up to a power of two)
+            name: Shared memory name (required when attaching)
+            doorbell: multiprocessing.Event used to wake the consumer
+            create: True to allocate the block, False to attach to ``name``
+        """
+        if capacity <= 0:
+            raise ValueError("capacity must be positive")
+
+        capacity = 1 << (capacity - 1).bit_length()
+        size = _HEADER_BYTES + capacity * TICK_RECORD_DTYPE.itemsize
+
+        self.capacity = capacity
+        self._mask = capacity - 1
+        # Only the creating process frees the block (a forked child
+        # inherits this object, so compare pids rather than a flag)
+        self._owner_pid = os.getpid() if create else None
+        self._shm = shared_memory.SharedMemory(name=name, create=create, size=size if create else 0)
+        self.name = self._shm.name
+        self.doorbell = doorbell if doorbell is not None else multiprocessing.Event()
+
+        self._header = np.ndarray((_HEADER_SLOTS,), dtype=np.int64, buffer=self._shm.buf)
+        self._records = np.ndarray((capacity,), dtype=TICK_RECORD_DTYPE,
+                                   buffer=self._shm.buf, offset=_HEADER_BYTES)
+        if create:
+            self._header[:] = 0
+
+    def __reduce__(self):
+        return (_attach, (self.capacity, self.name, self.doorbell))
+
+    def __len__(self) -> int:
+        """Number of records written but not yet read."""
+        header = self._header
+        return int(header[_WRITE] - header[_READ])
+
+    # --- Producer side ---
+
+    def push_many(
+        self,
+        time_msc: Sequence[int],
+        seq: Sequence[int],
+        bid: Sequence[float],
+        ask: Sequence[float],
+        flags: Sequence[int],
+        symbol: Sequence[str],
+        recv_ns: Optional[Sequence[int]] = None
+    ) -> int:
+        """
+        Write a batch of ticks (producer process only).
+
+        Args:
+            time_msc, seq, bid, ask, flags, symbol: Equal-length columns
+            recv_ns: Receive stamps (perf_counter_ns; None = not stamped)
+
+        Returns:
+            Number of ticks written (the rest were dropped: ring full)
+
+        Raises:
+            ValueError: A symbol is longer than SYMBOL_BYTES (it would be
+                truncated and mixed up with another symbol)
+        """
+        for name in symbol:
+            if len(name) > SYMBOL_BYTES:
+                raise ValueError(f"Symbol '{name}' is longer than {SYMBOL_BYTES} bytes")
+
+        header = self._header
+        n = len(time_msc)
+        write = int(header[_WRITE])
+        free = self.capacity - (write - int(header[_READ]))
+
+        if n > free:
+            header[_DROPPED] += n - free
+            n = free
+        if n == 0:
+            return 0
+
+        start = write & self._mask
+        first = min(n, self.capacity - start)
+        records = self._records
+        if recv_ns is None:
+            recv_ns = np.zeros(n, dtype=np.int64)
+        for field, column in (('time_msc', time_msc), ('seq', seq), ('bid', bid),
+                              ('ask', ask), ('flags', flags), ('symbol', symbol),
+                              ('recv_ns', recv_ns)):
+            records[field][start:start + first] = column[:first]
+            if first < n:
+                records[field][:n - first] = column[first:n]
+
+        # Publish only after every field is written
+        header[_WRITE] = write + n
+
+        if header[_WAITING]:
+            self.doorbell.set()
+        return n
+
+    def publish_sequence_stats(self, decoded: int, errors: int, stats: Dict[str, Any]) -> None:
+        """
+        Copy the producer's decoder counters into the header.
+
+        Args:
+            decoded: Frames decoded
+            errors: Frames rejected
+            stats: SequenceTracker.get_stats() of the Feeder
+        """
+        header = self._header
+        header[_DECODED] = decoded
+        header[_ERRORS] = errors
+        for offset, field in enumerate(_SEQ_FIELDS):
+            value = stats.get(field)
+            header[_SEQ_BASE + offset] = -1 if value is None else value
+
+    # --- Consumer side ---
+
+    def read(self, max_items: Optional[int] = None) -> np.ndarray:
+        """
+        Copy out and release pending records (consumer process only).
+
+        Args:
+            max_items: Maximum number of records (default: all pending)
+
+        Returns:
+            Structured array of TICK_RECORD_DTYPE, oldest first
+        """
+        header = self._header
+        read = int(header[_READ])
+        n = int(header[_WRITE]) - read
+        if max_items is not None:
+            n = min(n, max_items)
+        if n <= 0:
+            return self._records[:0].copy()
+
+        start = read & self._mask
+        end = start + n
+        if end <= self.capacity:
+            batch = self._records[start:end].copy()
+        else:
+            batch = np.concatenate((self._records[start:],
+                                    self._records[:end - self.capacity]))
+
+        header[_READ] = read + n
+        return batch
+
+    def wait(self, timeout: Optional[float]) -> bool:
+        """
+        Sleep until the producer writes or ``timeout`` expires.
+
+        Returns:
+            True if records are pending
+        """
+        header = self._header
+        header[_WAITING] = 1
+        try:
+            if header[_WRITE] != header[_READ]:
+                return True
+            self.doorbell.wait(timeout)
+            self.doorbell.clear()
+        finally:
+            header[_WAITING] = 0
+        return header[_WRITE] != header[_READ]
+
+    # --- Monitoring ---
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get ring occupancy and producer counters.
+
+        Returns:
+            Dictionary with pending records, drops and decoder counters
+        """
+        header = self._header
+        return {
+            'size': int(header[_WRITE] - header[_READ]),
+            'capacity': self.capacity,
+            'written': int(header[_WRITE]),
+            'dropped': int(header[_DROPPED]),
+            'decoded': int(header[_DECODED]),
+            'errors': int(header[_ERRORS]),
+        }
+
+    def get_sequence_stats(self) -> Dict[str, Any]:
+        """
+        Get the producer's SEQ_ID counters (SequenceTracker.get_stats keys).
+
+        Returns:
+            Dictionary with continuity statistics
+        """
+        values = [int(v) for v in self._header[_SEQ_BASE:_SEQ_BASE + len(_SEQ_FIELDS)]]
+        stats = dict(zip(_SEQ_FIELDS, values))
+        if stats['last_seq'] < 0:
+            stats['last_seq'] = None
+        expected = stats['received'] - stats['duplicates'] + stats['lost']
+        stats['loss_rate'] = (stats['lost'] / expected) if expected > 0 else 0.0
+        return stats
+
+    # --- Lifecycle ---
+
+    def close(self) -> None:
+        """Detach from the block (and free it if this side created it)."""
+        self._header = None
+        self._records = None
+        self._shm.close()
+        if self._owner_pid == os.getpid():
+            self._shm.unlink()
+
+
+def _attach(capacity: int, name: str, doorbell: Any) -> SharedTickRing:
+    """Unpickle helper: attach to an existing ring."""
+    return SharedTickRing(capacity, name=name, doorbell=doorbell, create=False)
+
+
+class SharedRingMailbox:
+    """
+    Consumer side of a SharedTickRing with the ConflatingMailbox interface.
+
+    drain() copies every pending record out of the ring, appends them to
+    the TickStore in one batch per symbol and returns one MailboxUpdate
+    per symbol, so the Strategy Engine runs unchanged on top of it.
+    """
+
+    def __init__(self, ring: SharedTickRing, tick_store: TickStore, name: str = 'Ingestion'):
+        """
+        Initialize the mailbox.
+
+        Args:
+            ring: Ring written by the ingestion process
+            tick_store: Store the engine's analyzers read from
+            name: Name used in statistics
+        """
+        self.ring = ring
+        self.tick_store = tick_store
+        self.name = name
+        self.policy = 'shm_ring'
+        self.maxsize = ring.capacity
+
+        # Statistics
+        self.puts = 0
+        self.conflated = 0
+        self.high_water = 0
+        self.max_coalesced = 0
+
+    def drain(self, timeout: Optional[float] = None) -> List[MailboxUpdate]:
+        """
+        Take every pending tick, conflated to one update per symbol.
+
+        Args:
+            timeout: Max time to wait for the first tick
+                (None = wait forever, 0 = don't wait)
+
+        Returns:
+            List of MailboxUpdate in order of first arrival (may be empty)
+        """
+        ring = self.ring
+        if not len(ring) and timeout != 0:
+            ring.wait(timeout)
+
+        batch = ring.read()
+        n = len(batch)
+        if n == 0:
+            return []
+
+        self.puts += n
+        if n > self.high_water:
+            self.high_water = n
+
+        symbols, first, inverse = np.unique(batch['symbol'], return_index=True,
+                                            return_inverse=True)
+        updates = []
+        for k in np.argsort(first):
+            rows = batch[inverse == k]
+            symbol = symbols[k].decode()
+            self.tick_store.extend(symbol, rows['time_msc'], rows['bid'], rows['ask'],
+                                   rows['flags'], rows['seq'])
+
+            last = rows[-1]
+            tick = Tick(TICK_MSG_TYPE, int(last['seq']), int(last['time_msc']), symbol,
+                        float(last['bid']), float(last['ask']), int(last['flags']),
+                        int(last['recv_ns']))
+            count = len(rows)
+            if count > self.max_coalesced:
+                self.max_coalesced = count
+            updates.append(MailboxUpdate(
+                tick, count,
+                float(rows['bid'].min()), float(rows['bid'].max()),
+                float(rows['ask'].min()), float(rows['ask'].max()),
+            ))
+
+        self.conflated += n - len(updates)
+        return updates
+
+    def get(self, block: bool = True, timeout: Optional[float] = None) -> MailboxUpdate:
+        """
+        Take the next pending tick (queue.Queue compatible).
+
+        Raises:
+            queue.Empty: If nothing arrives in time
+        """
+        if block and not len(self.ring):
+            self.ring.wait(timeout)
+
+        batch = self.ring.read(1)
+        if len(batch) == 0:
+            raise queue.Empty
+
+        row = batch[0]
+        symbol = row['symbol'].decode()
+        self.tick_store.append(symbol, int(row['time_msc']), float(row['bid']),
+                               float(row['ask']), int(row['flags']), int(row['seq']))
+        self.puts += 1
+        tick = Tick(TICK_MSG_TYPE, int(row['seq']), int(row['time_msc']), symbol,
+                    float(row['bid']), float(row['ask']), int(row['flags']),
+                    int(row['recv_ns']))
+        return MailboxUpdate(tick, 1, tick.bid, tick.bid, tick.ask, tick.ask)
+
+    def get_nowait(self) -> MailboxUpdate:
+        """Take the next pending tick without waiting."""
+        return self.get(block=False)
+
+    # --- Monitoring ---
+
+    def qsize(self) -> int:
+        """Number of ticks pending in the ring."""
+        return len(self.ring)
+
+    def empty(self) -> bool:
+        return not len(self.ring)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get mailbox statistics (same keys as BoundedQueue.get_stats).
+
+        Returns:
+            Dictionary with pending ticks, ring drops and batch sizes
+        """
+        ring_stats = self.ring.get_stats()
+        return {
+            'name': self.name,
+            'policy': self.policy,
+            'size': ring_stats['size'],
+            'maxsize': self.maxsize,
+            'puts': self.puts,
+            'drops': ring_stats['dropped'],
+            'conflated': self.conflated,
+            'high_water': self.high_water,
+            'max_coalesced': self.max_coalesced,
+        }
@@ -0,0 +1,335 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+FlashEASuite V2 - ZMQ Socket Factory
+One shared context and per-role socket options for every Brain worker
+
+Workers ask the factory for a socket by role instead of creating their
+own context. The factory applies the role's options (HWMs, linger,
+timeouts, kernel buffers, TCP keepalive, reconnect intervals, conflate)
+before bind/connect, which is when ZMQ reads most of them.
+
+main.py builds the role options from config.py and installs them with
+configure_sockets(); without that, ROLE_DEFAULTS apply.
+
+With CurveKeys the factory makes every bound socket a CurveZMQ server
+(encrypted, and only peers holding the client key pair are let in) and
+every connecting socket a client. The
+keys are the Z85 files in 00_Common/Keys that the MQL5 side loads via
+Include/Security.mqh.
+"""
+
+import os
+import threading
+from typing import Dict, NamedTuple, Optional
+
+import zmq
+from zmq.auth.thread import ThreadAuthenticator
+
+from .log import get_logger
+
+logger = get_logger('sockets')
+
+# Socket roles
+TICK_SUB = 'tick_sub'           # Feeder ticks (SUB, bind)
+POLICY_PUB = 'policy_pub'       # Policies to the Trader (PUB, bind)
+RESULT_PULL = 'result_pull'     # Trade results from the Trader (PULL, bind)
+LINK_PUSH = 'link_push'         # Stage link producer end (PUSH, connect)
+LINK_PULL = 'link_pull'         # Stage link consumer end (PULL, bind)
+
+ROLE_TYPES = {
+    TICK_SUB: zmq.SUB,
+    POLICY_PUB: zmq.PUB,
+    RESULT_PULL: zmq.PULL,
+    LINK_PUSH: zmq.PUSH,
+    LINK_PULL: zmq.PULL,
+}
+
+
+class SocketOptions(NamedTuple):
+    """Options for one socket role (None = leave the ZMQ default)."""
+    sndhwm: Optional[int] = None            # Messages queued per peer before drop/block
+    rcvhwm: Optional[int] = None
+    linger: Optional[int] = None            # ms to flush pending messages on close
+    rcvtimeo: Optional[int] = None          # ms (-1 = block forever)
+    sndtimeo: Optional[int] = None
+    rcvbuf: Optional[int] = None            # Kernel buffer size (bytes)
+    sndbuf: Optional[int] = None
+    conflate: bool = False                  # Keep only the newest message (SUB: single-symbol feeds only)
+    tcp_keepalive: Optional[bool] = None
+    tcp_keepalive_idle: Optional[int] = None    # s before the first probe
+    tcp_keepalive_intvl: Optional[int] = None   # s between probes
+    reconnect_ivl: Optional[int] = None         # ms
+    reconnect_ivl_max: Optional[int] = None     # ms
+
+
+# Unconfigured roles: ZMQ defaults, except that the blocking receivers
+# time out so worker loops can check their shutdown event
+ROLE_DEFAULTS = {
+    TICK_SUB: SocketOptions(rcvtimeo=1000),
+    POLICY_PUB: SocketOptions(),
+    RESULT_PULL: SocketOptions(rcvtimeo=1000),
+    LINK_PUSH: SocketOptions(linger=1000),
+    LINK_PULL: SocketOptions(linger=0),
+}
+
+_SOCKOPTS = (
+    ('sndhwm', zmq.SNDHWM),
+    ('rcvhwm', zmq.RCVHWM),
+    ('linger', zmq.LINGER),
+    ('rcvtimeo', zmq.RCVTIMEO),
+    ('sndtimeo', zmq.SNDTIMEO),
+    ('rcvbuf', zmq.RCVBUF),
+    ('sndbuf', zmq.SNDBUF),
+    ('tcp_keepalive_idle', zmq.TCP_KEEPALIVE_IDLE),
+    ('tcp_keepalive_intvl', zmq.TCP_KEEPALIVE_INTVL),
+    ('reconnect_ivl', zmq.RECONNECT_IVL),
+    ('reconnect_ivl_max', zmq.RECONNECT_IVL_MAX),
+)
+
+
+class CurveKeys(NamedTuple):
+    """CurveZMQ key pairs (Z85-encoded, 40 bytes each)."""
+    server_public: bytes
+    server_secret: bytes
+    client_public: bytes
+    client_secret: bytes
+
+
+_KEY_FILES = ('server.key', 'server.key_secret', 'client.key', 'client.key_secret')
+
+
+def load_curve_keys(keys_dir: str) -> CurveKeys:
+    """
+    Read the Curve key files once (server.key, client.key + *_secret).
+
+    Args:
+        keys_dir: Directory with the key files (00_Common/Keys)
+
+    Returns:
+        CurveKeys
+
+    Raises:
+        RuntimeError: libzmq was built without CURVE support
+        ValueError: A key is malformed or a public key does not match its secret
+    """
+    if not zmq.has('curve'):
+        raise RuntimeError("libzmq was built without CURVE support")
+
+    keys = []
+    for name in _KEY_FILES:
+        with open(os.path.join(keys_dir, name), 'rb') as f:
+            key = f.read().strip()
+        if len(key) != 40:
+            raise ValueError(f"{name}: expected a 40-character Z85 key, got {len(key)} bytes")
+        keys.append(key)
+
+    curve = CurveKeys(*keys)
+    for role, public, secret in (('server', curve.server_public, curve.server_secret),
+                                 ('client', curve.client_public, curve.client_secret)):
+        if zmq.curve_public(secret) != public:
+            raise ValueError(f"{role}.key does not match {role}.key_secret")
+    return curve
+
+
+def apply_curve_server(sock: zmq.Socket, curve: CurveKeys) -> None:
+    """Make a socket a CurveZMQ server (call before bind)."""
+    sock.setsockopt(zmq.CURVE_SERVER, 1)
+    sock.setsockopt(zmq.CURVE_SECRETKEY, curve.server_secret)
+    sock.setsockopt(zmq.CURVE_PUBLICKEY, curve.server_public)
+
+
+def apply_curve_client(sock: zmq.Socket, curve: CurveKeys) -> None:
+    """
+    Make a socket a CurveZMQ client of the Brain (call before connect).
+
+    For Python peers (replay, benchmarks, test scripts) and the
+    connecting end of stage links; the MQL5 side does the same with the
+    keys from Security.mqh.
+    """
+    sock.setsockopt(zmq.CURVE_SERVERKEY, curve.server_public)
+    sock.setsockopt(zmq.CURVE_PUBLICKEY, curve.client_public)
+    sock.setsockopt(zmq.CURVE_SECRETKEY, curve.client_secret)
+
+
+class _ClientKeyCheck:
+    """ZAP credentials provider: admit only the known client public keys."""
+
+    def __init__(self, allowed):
+        self.allowed = frozenset(allowed)
+
+    def callback(self, domain: str, key: bytes) -> bool:
+        if key in self.allowed:
+            return True
+        logger.warning("🔒 SOCKETS: Rejected Curve client %s", key.decode('ascii', 'replace'),
+                       extra={'rate_key': 'sockets.curve_denied'})
+        return False
+
+
+def apply_options(sock: zmq.Socket, options: SocketOptions) -> None:
+    """
+    Apply socket options (call before bind/connect).
+
+    Args:
+        sock: ZMQ socket (sync or asyncio)
+        options: Options to apply (None fields are skipped)
+    """
+    if options.conflate:
+        sock.setsockopt(zmq.CONFLATE, 1)
+    if options.tcp_keepalive is not None:
+        sock.setsockopt(zmq.TCP_KEEPALIVE, 1 if options.tcp_keepalive else 0)
+    for field, option in _SOCKOPTS:
+        value = getattr(options, field)
+        if value is not None:
+            sock.setsockopt(option, value)
+
+
+class SocketFactory:
+    """
+    Creates role-configured sockets on one context.
+
+    The context is created on first use. Contexts do not survive fork(),
+    so a child process builds its own factory from ``options`` and
+    ``curve``. With ``curve`` set, a ZAP authenticator thread runs on the
+    context from the first socket on.
+    """
+
+    def __init__(
+        self,
+        io_threads: int = 1,
+        options: Optional[Dict[str, SocketOptions]] = None,
+        context: Optional[zmq.Context] = None,
+        curve: Optional[CurveKeys] = None
+    ):
+        """
+        Args:
+            io_threads: ZMQ I/O threads for the context (~1 per Gbit/s)
+            options: Role -> SocketOptions (missing roles use ROLE_DEFAULTS)
+            context: Existing context to use (not terminated by close())
+            curve: Curve keys (None = plaintext sockets)
+        """
+        self.io_threads = io_threads
+        self.options = {**ROLE_DEFAULTS, **(options or {})}
+        self.curve = curve
+        self._context = context
+        self._owns_context = context is None
+        self._authenticator: Optional[ThreadAuthenticator] = None
+        self._lock = threading.Lock()
+
+    @property
+    def context(self) -> zmq.Context:
+        """The shared context (created on first use)."""
+        if self._context is None:
+            with self._lock:
+                if self._context is None:
+                    self._context = zmq.Context(io_threads=self.io_threads)
+        return self._context
+
+    def socket(
+        self,
+        role: str,
+        address: str,
+        bind: bool = True,
+        context: Optional[zmq.Context] = None,
+        **overrides
+    ) -> zmq.Socket:
+        """
+        Create, configure and bind/connect a socket for a role.
+
+        Args:
+            role: TICK_SUB, POLICY_PUB, RESULT_PULL, LINK_PUSH or LINK_PULL
+            address: Endpoint
+            bind: Bind (True) or connect (False)
+            context: Context to create the socket on, e.g. a zmq.asyncio
+                shadow of ``self.context`` (default: the shared context)
+            **overrides: SocketOptions fields to override for this socket
+
+        Returns:
+            Configured socket (SUB sockets subscribe to everything)
+        """
+        options = self.options.get(role, SocketOptions())
+        if overrides:
+            options = options._replace(**overrides)
+        if self.curve is not None:
+            self._start_authenticator()
+
+        sock = (context or self.context).socket(ROLE_TYPES[role])
+        try:
+            apply_options(sock, options)
+            if self.curve is not None:
+                (apply_curve_server if bind else apply_curve_client)(sock, self.curve)
+            if role == TICK_SUB:
+                sock.setsockopt(zmq.SUBSCRIBE, b"")
+            if bind:
+                sock.bind(address)
+            else:
+                sock.connect(address)
+        except Exception:
+            sock.close(linger=0)
+            raise
+        return sock
+
+    def _start_authenticator(self) -> None:
+        """Start the ZAP handler that checks client keys (once per context)."""
+        if self._authenticator is not None:
+            return
+        context = self.context
+        with self._lock:
+            if self._authenticator is None:
+                authenticator = ThreadAuthenticator(context, log=get_logger('sockets.zap'))
+                authenticator.start()
+                authenticator.configure_curve_callback(
+                    '*', credentials_provider=_ClientKeyCheck([self.curve.client_public]))
+                self._authenticator = authenticator
+
+    def close(self) -> None:
+        """Terminate the context if this factory created it (sockets must be closed)."""
+        if self._authenticator is not None:
+            self._authenticator.stop()
+            self._authenticator = None
+        if self._owns_context and self._context is not None:
+            self._context.term()
+        self._context = None
+
+
+_factory: Optional[SocketFactory] = None
+_factory_lock = threading.Lock()
+
+
+def configure_sockets(io_threads: int = 1,
+                      options: Optional[Dict[str, SocketOptions]] = None,
+                      curve: Optional[CurveKeys] = None) -> SocketFactory:
+    """
+    Install the process-wide socket factory (call once at startup).
+
+    Args:
+        io_threads: ZMQ I/O threads for the shared context
+        options: Role -> SocketOptions
+        curve: Curve keys (None = plaintext)
+
+    Returns:
+        The new shared SocketFactory
+    """
+    global _factory
+    with _factory_lock:
+        _factory = SocketFactory(io_threads, options, curve=curve)
+        return _factory
+
+
+def get_socket_factory() -> SocketFactory:
+    """Get the process-wide socket factory (ROLE_DEFAULTS if not configured)."""
+    global _factory
+    if _factory is None:
+        with _factory_lock:
+            if _factory is None:
+                _factory = SocketFactory()
+    return _factory
+
+
+def close_sockets() -> None:
+    """Terminate the shared context (after every worker closed its sockets)."""
+    global _factory
+    with _factory_lock:
+        if _factory is not None:
+            _factory.close()
+        _factory = None
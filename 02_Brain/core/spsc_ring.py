@@ -0,0 +1,257 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+FlashEASuite V2 - SPSC Ring
+Lock-free single-producer / single-consumer ring between two threads
+
+queue.Queue takes a mutex and signals a condition variable on every
+put/get. Between exactly one producer (ingestion) and one consumer
+(strategy engine) neither is needed: the ring is a preallocated list
+plus two counters, ``_tail`` written only by the producer and ``_head``
+only by the consumer. A slot is filled before ``_tail`` moves past it
+and cleared before ``_head`` does, and each of those steps is a single
+atomic store under the GIL, so neither side ever takes a lock.
+
+A lock is only involved when the consumer has nothing to do: it
+announces that it is about to sleep and waits on a threading.Event (or
+a Linux eventfd); the producer signals it only while that flag is set,
+so a busy pipeline never touches the wakeup at all.
+"""
+
+import os
+import queue
+import select
+import threading
+import time
+from typing import Any, Dict, List, Optional
+
+# Wakeup mechanisms for an idle consumer
+WAKEUP_EVENT = 'event'
+WAKEUP_EVENTFD = 'eventfd'     # Linux only (os.eventfd)
+
+
+class SpscRing:
+    """
+    Bounded SPSC ring with the queue.Queue subset used by the Brain workers.
+
+    put()/get()/get_nowait()/qsize()/empty()/get_stats() behave like a
+    BoundedQueue with the 'block' policy, so the ring can be passed as
+    ``ingestion_queue`` to the ingestion worker and the strategy engine.
+    push()/pop()/pop_batch() are the non-blocking primitives underneath.
+    Exactly one thread may put and exactly one thread may get.
+    """
+
+    FULL_BACKOFF = 0.0001   # Producer sleep while the ring is full (s)
+
+    def __init__(self, capacity: int = 65536, name: str = 'queue', wakeup: str = WAKEUP_EVENT):
+        """
+        Initialize ring.
+
+        Args:
+            capacity: Slots (rounded up to a power of two)
+            name: Name used in statistics
+            wakeup: WAKEUP_EVENT or WAKEUP_EVENTFD (falls back to an
+                Event where os.eventfd is unavailable)
+        """
+        size = 1
+        while size < capacity:
+            size <<= 1
+
+        self.name = name
+        self.policy = 'spsc'
+        self.maxsize = size
+        self._mask = size - 1
+        self._slots: List[Any] = [None] * size
+
+        self._head = 0          # Next slot to read (consumer)
+        self._tail = 0          # Next slot to write (producer)
+        self._sleeping = False  # Consumer is (about to be) waiting for data
+
+        if wakeup == WAKEUP_EVENTFD and hasattr(os, 'eventfd'):
+            self.wakeup = WAKEUP_EVENTFD
+            self._eventfd = os.eventfd(0, os.EFD_NONBLOCK | os.EFD_CLOEXEC)
+            self._event = None
+        else:
+            self.wakeup = WAKEUP_EVENT
+            self._eventfd = None
+            self._event = threading.Event()
+
+        # Statistics (producer-owned)
+        self.puts = 0
+        self.drops = 0
+        self.high_water = 0
+
+    # --- Producer side ---
+
+    def push(self, item: Any) -> bool:
+        """
+        Append an item without waiting.
+
+        Returns:
+            False if the ring is full
+        """
+        tail = self._tail
+        if tail - self._head > self._mask:
+            return False
+
+        self._slots[tail & self._mask] = item
+        self._tail = tail + 1
+
+        self.puts += 1
+        depth = tail + 1 - self._head
+        if depth > self.high_water:
+            self.high_water = depth
+
+        if self._sleeping:
+            self._wake()
+        return True
+
+    def put(self, item: Any, block: bool = True, timeout: Optional[float] = None) -> None:
+        """
+        Append an item, waiting while the ring is full (queue.Queue compatible).
+
+        Raises:
+            queue.Full: Still full after ``timeout`` (or at once if not block)
+        """
+        if self.push(item):
+            return
+
+        if block:
+            deadline = None if timeout is None else time.monotonic() + timeout
+            while deadline is None or time.monotonic() < deadline:
+                time.sleep(self.FULL_BACKOFF)
+                if self.push(item):
+                    return
+
+        self.drops += 1
+        raise queue.Full
+
+    # --- Consumer side ---
+
+    def pop(self) -> Any:
+        """
+        Take the oldest item without waiting.
+
+        Raises:
+            queue.Empty: If the ring is empty
+        """
+        head = self._head
+        if head == self._tail:
+            raise queue.Empty
+
+        index = head & self._mask
+        item = self._slots[index]
+        self._slots[index] = None
+        self._head = head + 1
+        return item
+
+    def pop_batch(self, max_items: int = 1000) -> List[Any]:
+        """
+        Take up to ``max_items`` items at once, oldest first (never waits).
+
+        Returns:
+            List of items (empty if the ring is empty)
+        """
+        head = self._head
+        count = min(self._tail - head, max_items)
+        if count <= 0:
+            return []
+
+        slots = self._slots
+        start = head & self._mask
+        end = start + count
+        if end <= len(slots):
+            items = slots[start:end]
+            slots[start:end] = [None] * count
+        else:
+            end -= len(slots)
+            items = slots[start:] + slots[:end]
+            slots[start:] = [None] * (len(slots) - start)
+            slots[:end] = [None] * end
+
+        self._head = head + count
+        return items
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait until the ring has data (consumer only).
+
+        Args:
+            timeout: Max wait in seconds (None = forever)
+
+        Returns:
+            True if data is available
+        """
+        if self._head != self._tail:
+            return True
+
+        self._sleeping = True
+        try:
+            # Re-check after announcing: a push in between has seen the flag
+            if self._head != self._tail:
+                return True
+            if self._event is not None:
+                self._event.wait(timeout)
+                self._event.clear()
+            else:
+                select.select([self._eventfd], [], [], timeout)
+                try:
+                    os.eventfd_read(self._eventfd)
+                except BlockingIOError:
+                    pass
+        finally:
+            self._sleeping = False
+        return self._head != self._tail
+
+    def get(self, block: bool = True, timeout: Optional[float] = None) -> Any:
+        """
+        Take the oldest item (queue.Queue compatible).
+
+        Raises:
+            queue.Empty: If nothing arrives in time
+        """
+        if self._head == self._tail and block:
+            self.wait(timeout)
+        return self.pop()
+
+    def get_nowait(self) -> Any:
+        """Take the oldest item without waiting (raises queue.Empty)."""
+        return self.pop()
+
+    def _wake(self) -> None:
+        if self._event is not None:
+            self._event.set()
+        else:
+            os.eventfd_write(self._eventfd, 1)
+
+    # --- Monitoring ---
+
+    def qsize(self) -> int:
+        return self._tail - self._head
+
+    def empty(self) -> bool:
+        return self._tail == self._head
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get ring statistics (same keys as BoundedQueue.get_stats).
+
+        Returns:
+            Dictionary with size, drops and high-water mark
+        """
+        return {
+            'name': self.name,
+            'policy': self.policy,
+            'size': self.qsize(),
+            'maxsize': self.maxsize,
+            'puts': self.puts,
+            'drops': self.drops,
+            'conflated': 0,
+            'high_water': self.high_water,
+        }
+
+    def close(self) -> None:
+        """Release the eventfd (if any)."""
+        if self._eventfd is not None:
+            os.close(self._eventfd)
+            self._eventfd = None
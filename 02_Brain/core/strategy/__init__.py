@@ -11,11 +11,24 @@ Modular strategy engine with:
 - Risk management
 """
 
-from .engine import StrategyEngineThreaded, create_strategy_engine_threaded
+from .engine import StrategyCore, StrategyEngineThreaded, create_strategy_engine_threaded
+from .policy import (
+    POLICY_FORMAT_COMPACT,
+    POLICY_FORMAT_VERBOSE,
+    POLICY_TOPIC_PREFIX,
+    decode_policy,
+    policy_topic
+)
 
 __all__ = [
+    'StrategyCore',
     'StrategyEngineThreaded',
-    'create_strategy_engine_threaded'
+    'create_strategy_engine_threaded',
+    'POLICY_TOPIC_PREFIX',
+    'POLICY_FORMAT_COMPACT',
+    'POLICY_FORMAT_VERBOSE',
+    'decode_policy',
+    'policy_topic'
 ]
 
 __version__ = '2.0.0'
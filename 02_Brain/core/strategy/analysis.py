@@ -5,8 +5,29 @@ FlashEASuite V2 - Market Analysis Module
 Handles tick analysis and signal generation
 """
 
-from typing import Dict, Any, Optional
-from collections import deque
+from typing import Dict, Any, List, Optional
+
+# Activity horizons (seconds) reported as tick rates, and their analytics keys.
+# The short rates change on almost every tick: they are reported with full
+# policies but never trigger one (policy.GridDecision leaves them out)
+ACTIVITY_WINDOWS = (1.0, 5.0, 60.0, 900.0, 3600.0)
+ACTIVITY_FIELDS = ('tick_rate_1s', 'tick_rate_5s', 'tick_rate_1m', 'tick_rate_15m', 'tick_rate_1h')
+
+# Spread percentiles over the 15-minute window, and the one used as spread gate.
+# The estimates move with every spread: only the gate is compared when
+# deciding on a full policy, with its own tolerance (policy.GridDecision)
+SPREAD_QUANTILES = (0.5, 0.9, 0.99)
+SPREAD_QUANTILE_FIELDS = ('spread_p50', 'spread_p90', 'spread_p99')
+SPREAD_GATE_QUANTILE = 0.99
+
+# Defaults for a symbol without analytics yet
+_NO_TICK_FLOW = {'tick_ratio': 0.0, 'spread_ratio': 1.0, 'avg_spread': 0.0,
+                 **dict.fromkeys(ACTIVITY_FIELDS, 0.0), **dict.fromkeys(SPREAD_QUANTILE_FIELDS, 0.0)}
+
+# Field order of get_symbol_analytics_row() (compact policy frames)
+ANALYTICS_FIELDS = ('tick_ratio', 'spread_ratio', 'avg_spread', 'strength_fast', 'strength_slow'
+                    ) + ACTIVITY_FIELDS + SPREAD_QUANTILE_FIELDS
+NO_ANALYTICS_ROW = tuple(_NO_TICK_FLOW.get(field, 0.0) for field in ANALYTICS_FIELDS)
 
 
 class MarketAnalyzer:
@@ -14,19 +35,28 @@ class MarketAnalyzer:
     Market analysis module for generating trading signals.
     
     Analyzes:
-    - Tick flow patterns
+    - Tick flow patterns (one TickFlowAnalyzer per symbol)
+    - Tick activity over several horizons (ACTIVITY_WINDOWS)
+    - Spread percentiles and the spread gate (SPREAD_GATE_QUANTILE)
     - Currency strength
     - Market conditions
     """
     
-    def __init__(self, has_modules: bool = False):
+    def __init__(self, has_modules: bool = False, tick_store=None):
         """
         Initialize Market Analyzer.
         
         Args:
             has_modules: Whether tick_analyzer and currency_meter are available
+            tick_store: Shared TickStore (CSM reads price history from it)
         """
         self.has_modules = has_modules
+        self.tick_store = tick_store
+        
+        # Tick flow analyzers, created on a symbol's first tick
+        self.tick_analyzers: Dict[str, Any] = {}
+        self._tick_analyzer_class = None
+        self.csm = None
         
         # Initialize modules if available
         if has_modules:
@@ -34,59 +64,66 @@ class MarketAnalyzer:
                 from modules.tick_analyzer import TickFlowAnalyzer
                 from modules.currency_meter import CurrencyStrengthMeter
                 
-                # Try with window_size parameter first
-                try:
-                    self.tick_analyzer = TickFlowAnalyzer(window_size=100)
-                except TypeError:
-                    # If doesn't support window_size, create without it
-                    self.tick_analyzer = TickFlowAnalyzer()
+                self._tick_analyzer_class = TickFlowAnalyzer
                 
                 try:
-                    self.csm = CurrencyStrengthMeter()
+                    self.csm = CurrencyStrengthMeter(tick_store=tick_store)
                 except Exception as e:
                     print(f"⚠️ CSM initialization warning: {e}")
                     self.csm = None
                     
             except ImportError as e:
                 print(f"⚠️ Failed to import modules: {e}")
-                self.tick_analyzer = None
-                self.csm = None
-        else:
-            self.tick_analyzer = None
-            self.csm = None
+    
+    def _new_tick_analyzer(self):
+        """Create a TickFlowAnalyzer for one symbol."""
+        # One tick ring answers every activity window
+        try:
+            return self._tick_analyzer_class(windows=ACTIVITY_WINDOWS,
+                                             spread_quantiles=SPREAD_QUANTILES)
+        except TypeError:
+            # If doesn't support them, create without it
+            return self._tick_analyzer_class()
     
     def analyze_market(
         self,
-        tick_data: Dict[str, Any],
-        tick_buffer: deque,
-        is_in_cooldown: bool
+        tick_data,
+        tick_ring,
+        is_in_cooldown: bool,
+        tick_count: int = 1
     ) -> Optional[str]:
         """
         Analyze market and generate signal.
         
         Args:
-            tick_data: Current tick data dictionary
-            tick_buffer: Historical tick buffer
+            tick_data: Current Tick (core.tick_codec.Tick)
+            tick_ring: TickRingBuffer with this symbol's tick history
             is_in_cooldown: Whether system is in cooldown
+            tick_count: Ticks coalesced into tick_data (for tick density)
             
         Returns:
             'BUY', 'SELL', or None
         """
-        # Check cooldown first
+        # Basic analysis
+        symbol = tick_data.symbol
+        bid = tick_data.bid
+        ask = tick_data.ask
+        
+        # Tick density must count every tick, including coalesced ones
+        # and ticks that arrive during cooldown; windows run on the
+        # Feeder's clock (time_msc), not on when the tick got here
+        tick_analyzer = self.tick_analyzers.get(symbol)
+        if tick_analyzer is None and self._tick_analyzer_class is not None:
+            tick_analyzer = self.tick_analyzers[symbol] = self._new_tick_analyzer()
+        if tick_analyzer is not None:
+            tick_analyzer.on_tick(bid, ask, tick_count, tick_data.time_msc / 1000.0)
+        
+        # Check cooldown
         if is_in_cooldown:
             return None
         
-        # Basic analysis
-        symbol = tick_data.get('symbol', '')
-        bid = tick_data.get('bid', 0.0)
-        ask = tick_data.get('ask', 0.0)
-        
         # Use modules if available
-        if self.has_modules and len(tick_buffer) > 10:
-            # Use TickAnalyzer
-            if self.tick_analyzer:
-                self.tick_analyzer.add_tick(bid)
-            
+        if self.has_modules and tick_ring is not None and len(tick_ring) > 10:
             # Use CSM (simplified - actual implementation is more complex)
             # This is just a placeholder
             pass
@@ -95,9 +132,119 @@ class MarketAnalyzer:
         # In production, implement your strategy logic here
         return None
     
-    def get_tick_analyzer(self):
-        """Get tick analyzer instance."""
-        return self.tick_analyzer
+    def get_symbol_analytics(self, symbol: str) -> Dict[str, float]:
+        """
+        Get the latest analytics of one symbol (for its Grid policy).
+        
+        Args:
+            symbol: Symbol name
+            
+        Returns:
+            Tick flow ratios, tick rates per activity window (ticks/s),
+            spread percentiles and, if the CSM knows both currencies,
+            base minus quote strength (fast and slow)
+        """
+        tick_analyzer = self.tick_analyzers.get(symbol)
+        if tick_analyzer is None:
+            analytics = dict(_NO_TICK_FLOW)
+        else:
+            analytics = {
+                'tick_ratio': tick_analyzer.current_tick_ratio,
+                'spread_ratio': tick_analyzer.current_spread_ratio,
+                'avg_spread': tick_analyzer.current_spread_avg,
+            }
+            rates = tick_analyzer.get_tick_rates(ACTIVITY_WINDOWS)
+            analytics.update(zip(ACTIVITY_FIELDS, rates.values()))
+            quantiles = tick_analyzer.get_spread_quantiles()
+            analytics.update((field, quantiles.get(q, 0.0))
+                             for field, q in zip(SPREAD_QUANTILE_FIELDS, SPREAD_QUANTILES))
+        
+        csm = self.csm
+        if csm is not None:
+            base, quote = symbol[:3], symbol[3:6]
+            fast, slow = csm.scores_fast, csm.scores_slow
+            if base in fast and quote in fast:
+                analytics['strength_fast'] = fast[base] - fast[quote]
+                analytics['strength_slow'] = slow[base] - slow[quote]
+        
+        return analytics
+    
+    def get_symbol_analytics_row(self, symbol: str) -> List[float]:
+        """
+        Get the same analytics as a list in ANALYTICS_FIELDS order.
+        
+        Used by compact policy frames; a strength the CSM cannot compute
+        is 0.0 instead of missing.
+        
+        Args:
+            symbol: Symbol name
+            
+        Returns:
+            [tick_ratio, spread_ratio, avg_spread, strength_fast, strength_slow,
+             tick_rate_1s, tick_rate_5s, tick_rate_1m, tick_rate_15m, tick_rate_1h,
+             spread_p50, spread_p90, spread_p99]
+        """
+        tick_analyzer = self.tick_analyzers.get(symbol)
+        if tick_analyzer is None:
+            row = list(NO_ANALYTICS_ROW)
+        else:
+            quantiles = tick_analyzer.get_spread_quantiles()
+            row = [tick_analyzer.current_tick_ratio, tick_analyzer.current_spread_ratio,
+                   tick_analyzer.current_spread_avg, 0.0, 0.0,
+                   *tick_analyzer.get_tick_rates(ACTIVITY_WINDOWS).values(),
+                   *(quantiles.get(q, 0.0) for q in SPREAD_QUANTILES)]
+        
+        csm = self.csm
+        if csm is not None:
+            base, quote = symbol[:3], symbol[3:6]
+            fast, slow = csm.scores_fast, csm.scores_slow
+            if base in fast and quote in fast:
+                row[3] = fast[base] - fast[quote]
+                row[4] = slow[base] - slow[quote]
+        
+        return row
+    
+    def get_spread_gate(self, symbol: str) -> float:
+        """
+        Get the widest spread at which a Grid may open (for its Grid policy).
+        
+        The SPREAD_GATE_QUANTILE percentile of the symbol's spread over
+        the last 15 minutes: unlike a multiple of the mean, it is not
+        dragged up by a few news spikes.
+        
+        Args:
+            symbol: Symbol name
+            
+        Returns:
+            Spread in price units (0.0 = no gate yet)
+        """
+        tick_analyzer = self.tick_analyzers.get(symbol)
+        if tick_analyzer is None:
+            return 0.0
+        return tick_analyzer.get_spread_quantiles().get(SPREAD_GATE_QUANTILE, 0.0)
+    
+    def get_csm_bias(self, symbol: str) -> float:
+        """
+        Get the symbol's CSM trend bias (analytics 'strength_slow').
+        
+        Args:
+            symbol: Symbol name
+            
+        Returns:
+            Base minus quote slow strength (0.0 if the CSM cannot compute it)
+        """
+        csm = self.csm
+        if csm is None:
+            return 0.0
+        slow = csm.scores_slow
+        base, quote = symbol[:3], symbol[3:6]
+        if base in slow and quote in slow:
+            return slow[base] - slow[quote]
+        return 0.0
+    
+    def get_tick_analyzer(self, symbol: str):
+        """Get the tick analyzer of a symbol (None before its first tick)."""
+        return self.tick_analyzers.get(symbol)
     
     def get_csm(self):
         """Get Currency Strength Meter instance."""
@@ -5,29 +5,240 @@ FlashEASuite V2 - Strategy Engine Core
 Main threading-safe engine class
 """
 
-import zmq
+import importlib.util
 import threading
 import queue
 import time
-from typing import Dict, Any
-from collections import deque
+from typing import Dict, List, Optional, Sequence, Tuple
 
 # Import sibling modules
 from .analysis import MarketAnalyzer
 from .feedback import FeedbackProcessor
 from .policy import PolicyPublisher
 
-# Import external modules (if available)
-try:
-    from modules.tick_analyzer import TickFlowAnalyzer
-    from modules.currency_meter import CurrencyStrengthMeter
-    HAS_MODULES = True
-except ImportError:
+from core.latency import ANALYSIS, DEQUEUE, PUBLISH, LatencyRecorder
+from core.log import get_logger
+from core.mailbox import ConflatingMailbox
+from core.shm_ring import SharedRingMailbox
+from core.sockets import POLICY_PUB, SocketFactory, get_socket_factory
+from core.spsc_ring import SpscRing
+from core.tick_codec import Tick
+from core.tick_store import TickStore
+from core.timer_wheel import TimerWheel
+
+logger = get_logger("strategy.engine")
+
+# External modules (if available); MarketAnalyzer imports them itself
+HAS_MODULES = importlib.util.find_spec("modules") is not None and all(
+    importlib.util.find_spec(name) is not None
+    for name in ("modules.tick_analyzer", "modules.currency_meter")
+)
+if not HAS_MODULES:
     print("⚠️ Warning: tick_analyzer or currency_meter not found, using basic mode")
-    HAS_MODULES = False
 
 
-class StrategyEngineThreaded(threading.Thread):
+class StrategyCore:
+    """
+    Transport-agnostic part of the Strategy Engine.
+    
+    Owns the analysis, feedback and policy sub-modules and the tick
+    history. Runtimes (threaded engine, reactor, asyncio Brain) feed it
+    ticks and trade results and provide ``pub_socket`` for publishing.
+    
+    Periodic work runs as jobs on ``timers`` (a TimerWheel): runtimes call
+    _schedule_jobs() once and then timers.run_due() from their loop,
+    sleeping until timers.next_deadline() in between.
+    """
+    
+    GRID_POLICY_INTERVAL = 5.0      # Publish Grid policy (or keepalive) every 5 seconds
+    POLICY_TOLERANCE = 0.05         # Relative confidence/risk change that triggers a full policy
+    POLICY_BIAS_TOLERANCE = 0.5     # CSM trend bias change (strength points) that triggers one
+    POLICY_GATE_TOLERANCE = 0.2     # Relative spread gate change that triggers one
+    POLICY_SNAPSHOT_INTERVAL = 30.0 # Full policy at least every 30s (late joiners)
+    DASHBOARD_INTERVAL = 10.0       # Print dashboard every 10 seconds
+    CSM_INTERVAL = 1.0              # Recalculate currency strengths every second
+    HEARTBEAT_INTERVAL = 10.0       # Heartbeat log record (config.HEARTBEAT_INTERVAL)
+    ACTIVE_SYMBOL_TIMEOUT = 60.0    # Grid policy for symbols with ticks in the last 60s
+    
+    def __init__(self, tick_store: Optional[TickStore] = None,
+                 latency: Optional[LatencyRecorder] = None,
+                 grid_symbols: Optional[Sequence[str]] = None,
+                 policy_encoding: str = 'compact'):
+        """
+        Initialize strategy state.
+        
+        Args:
+            tick_store: Per-symbol tick rings written by the ingestion
+                stage. If None, the strategy keeps its own store and
+                writes ticks into it itself.
+            latency: Stage latency histograms (dequeue/analysis/publish)
+            grid_symbols: Symbols that always get a Grid policy (e.g.
+                config.SUPPORTED_SYMBOLS); other symbols get one while
+                they are active
+            policy_encoding: Policy payload encoding ('compact' or
+                'verbose', see policy.py)
+        """
+        # ZMQ socket (set up by the runtime)
+        self.pub_socket = None
+        
+        # Tick history (per-symbol ring buffers)
+        self._owns_tick_store = tick_store is None
+        self.tick_store = TickStore() if tick_store is None else tick_store
+        self.latency = latency
+        
+        # Periodic and one-shot jobs (driven by the runtime's loop)
+        self.timers = TimerWheel()
+        
+        # Initialize sub-modules
+        self.market_analyzer = MarketAnalyzer(HAS_MODULES, self.tick_store)
+        self.feedback_processor = FeedbackProcessor(self.timers)
+        self.policy_publisher = PolicyPublisher(self.POLICY_TOLERANCE,
+                                                self.POLICY_SNAPSHOT_INTERVAL,
+                                                policy_encoding,
+                                                self.POLICY_BIAS_TOLERANCE,
+                                                self.POLICY_GATE_TOLERANCE)
+        
+        # Grid policy symbols: configured + recently active
+        self.grid_symbols = list(grid_symbols or [])
+        self._symbol_activity: Dict[str, Tuple[int, float]] = {}  # symbol -> (ticks, last change)
+        
+        # Statistics
+        self.tick_count = 0
+        self.policy_count = 0
+    
+    def _schedule_jobs(self) -> None:
+        """Register the periodic jobs (the first Grid policy goes out right away)."""
+        self.timers.schedule_periodic('grid_policy', self.GRID_POLICY_INTERVAL,
+                                      self._publish_grid_policy)
+        self.timers.schedule_periodic('dashboard', self.DASHBOARD_INTERVAL,
+                                      self._print_dashboard)
+        self.timers.schedule_periodic('heartbeat', self.HEARTBEAT_INTERVAL,
+                                      self._heartbeat, self.HEARTBEAT_INTERVAL)
+        
+        csm = self.market_analyzer.get_csm()
+        if csm is not None:
+            self.timers.schedule_periodic('csm', self.CSM_INTERVAL, csm.calculate_strengths)
+    
+    def _heartbeat(self) -> None:
+        """Log a liveness record with the engine counters."""
+        logger.info("💓 Heartbeat | Ticks: %d | Policies: %d",
+                    self.tick_count, self.policy_count,
+                    extra={'fields': {'ticks': self.tick_count,
+                                      'policies': self.policy_count}})
+    
+    def _print_dashboard(self) -> None:
+        """Print status dashboard."""
+        current_time = time.time()
+        
+        # Get feedback stats
+        stats = self.feedback_processor.get_stats()
+        
+        print("\n" + "=" * 70)
+        print("📊 STRATEGY ENGINE DASHBOARD")
+        print("=" * 70)
+        print(f"Ticks processed: {self.tick_count}")
+        print(f"Policies sent: {self.policy_count} "
+              f"(keepalives: {self.policy_publisher.keepalives_sent})")
+        print(f"Feedback: {stats['total_wins']}W/{stats['total_losses']}L ({stats['total_trades']} trades)")
+        print(f"Total profit: {stats['total_profit']:+.2f}")
+        print(f"Risk multiplier: {stats['risk_multiplier']:.2f}x")
+        
+        if stats['is_in_cooldown']:
+            remaining = stats['cooldown_until'] - current_time
+            print(f"⏳ COOLDOWN: {remaining:.0f}s remaining")
+        else:
+            print("✅ Trading active")
+        
+        csm = self.market_analyzer.get_csm()
+        if csm is not None:
+            print(f"CSM: {csm.get_dashboard_string()}")
+        
+        jobs = self.timers.get_stats()
+        print("Timers: " + ", ".join(
+            f"{name} {job['runs']}x {job['avg_ms']:.2f}/{job['max_ms']:.2f}ms"
+            for name, job in jobs.items()))
+        
+        print("=" * 70 + "\n")
+    
+    def _process_tick(self, tick_data: Tick, count: int = 1) -> None:
+        """
+        Analyze a single tick and publish a policy if it produces a signal.
+        
+        Args:
+            tick_data: Decoded Tick from the ingestion stage
+            count: Ticks coalesced into this one by the mailbox (>= 1)
+        """
+        latency = self.latency
+        if latency is not None:
+            latency.record(DEQUEUE, tick_data.recv_ns)
+        
+        self.tick_count += count
+        symbol = tick_data.symbol
+        
+        if self._owns_tick_store:
+            self.tick_store.append(
+                symbol, tick_data.time_msc, tick_data.bid, tick_data.ask,
+                tick_data.flags, tick_data.seq
+            )
+        
+        # Analyze market
+        signal = self.market_analyzer.analyze_market(
+            tick_data,
+            self.tick_store.get(symbol),
+            self.feedback_processor.is_in_cooldown(),
+            count
+        )
+        if latency is not None:
+            latency.record(ANALYSIS, tick_data.recv_ns)
+        
+        # Generate policy if signal exists
+        if signal:
+            self.policy_publisher.publish_policy(
+                signal,
+                symbol,
+                self.pub_socket,
+                self.feedback_processor
+            )
+            self.policy_count += 1
+            if latency is not None:
+                latency.record(PUBLISH, tick_data.recv_ns)
+    
+    def _active_symbols(self, now: float) -> List[str]:
+        """
+        Configured Grid symbols plus every symbol with recent ticks.
+        
+        Activity is read from the tick rings' write counters once per
+        cycle, so the tick path does no extra bookkeeping.
+        
+        Args:
+            now: Current monotonic time (seconds)
+        """
+        symbols = list(self.grid_symbols)
+        configured = set(symbols)
+        activity = self._symbol_activity
+        
+        for symbol in self.tick_store.symbols():
+            count = self.tick_store.get(symbol).total_count
+            previous = activity.get(symbol)
+            if previous is None or previous[0] != count:
+                activity[symbol] = previous = (count, now)
+            
+            if symbol not in configured and now - previous[1] <= self.ACTIVE_SYMBOL_TIMEOUT:
+                symbols.append(symbol)
+        
+        return symbols
+    
+    def _publish_grid_policy(self) -> None:
+        """Publish one Grid policy per active symbol with the current feedback state."""
+        self.policy_count += self.policy_publisher.publish_grid_policies(
+            self._active_symbols(time.monotonic()),
+            self.pub_socket,
+            self.feedback_processor,
+            self.market_analyzer
+        )
+
+
+class StrategyEngineThreaded(StrategyCore, threading.Thread):
     """
     Strategy Engine using Threading (Windows-safe).
     
@@ -37,15 +248,29 @@ class StrategyEngineThreaded(threading.Thread):
     
     Outputs:
     - Trading policies to MT5 via ZMQ PUB
+    
+    The main loop is event-driven: it blocks on the ingestion queue until
+    data arrives or the next timer deadline is due, then drains all
+    pending ticks and feedback in bounded batches.
     """
     
+    # Loop tuning
+    TICK_BATCH_SIZE = 1000          # Max ticks drained per cycle
+    FEEDBACK_BATCH_SIZE = 100       # Max trade results drained per cycle
+    MAX_IDLE_WAIT = 0.1             # Max block on empty queue (bounds feedback latency)
+    
     def __init__(
         self,
         ingestion_queue: queue.Queue,
         signal_queue: queue.Queue,
         feedback_queue: queue.Queue,
         shutdown_event: threading.Event,
-        zmq_pub_address: str = "tcp://127.0.0.1:7778"
+        zmq_pub_address: str = "tcp://127.0.0.1:7778",
+        tick_store: Optional[TickStore] = None,
+        latency: Optional[LatencyRecorder] = None,
+        sockets: Optional[SocketFactory] = None,
+        grid_symbols: Optional[Sequence[str]] = None,
+        policy_encoding: str = 'compact'
     ):
         """
         Initialize Strategy Engine.
@@ -56,37 +281,29 @@ class StrategyEngineThreaded(threading.Thread):
             feedback_queue: Queue with trade results (Feedback Loop)
             shutdown_event: Event to signal shutdown
             zmq_pub_address: ZMQ address to publish policies
+            tick_store: Per-symbol tick rings written by the ingestion
+                worker. If None, the engine keeps its own store and
+                writes ticks into it itself.
+            latency: Stage latency histograms (optional)
+            sockets: Socket factory (default: the shared one)
+            grid_symbols: Symbols that always get a Grid policy
+            policy_encoding: Policy payload encoding ('compact' or 'verbose')
         """
-        super().__init__(name="StrategyEngine")
+        threading.Thread.__init__(self, name="StrategyEngine")
+        StrategyCore.__init__(self, tick_store, latency, grid_symbols, policy_encoding)
         self.ingestion_queue = ingestion_queue
         self.signal_queue = signal_queue
         self.feedback_queue = feedback_queue
         self.shutdown_event = shutdown_event
         self.zmq_pub_address = zmq_pub_address
         
-        # ZMQ socket
-        self.context = None
-        self.pub_socket = None
-        
-        # Initialize sub-modules
-        self.market_analyzer = MarketAnalyzer(HAS_MODULES)
-        self.feedback_processor = FeedbackProcessor()
-        self.policy_publisher = PolicyPublisher()
-        
-        # Statistics
-        self.tick_count = 0
-        self.policy_count = 0
-        self.last_dashboard_time = 0
-        
-        # Tick buffer
-        self.tick_buffer = deque(maxlen=100)
+        # ZMQ sockets come from the shared factory (one context per process)
+        self.sockets = sockets or get_socket_factory()
     
     def _setup_zmq(self) -> bool:
         """Setup ZMQ PUB socket."""
         try:
-            self.context = zmq.Context()
-            self.pub_socket = self.context.socket(zmq.PUB)
-            self.pub_socket.bind(self.zmq_pub_address)
+            self.pub_socket = self.sockets.socket(POLICY_PUB, self.zmq_pub_address)
             
             print(f"📤 STRATEGY: Publishing policies on {self.zmq_pub_address}")
             return True
@@ -95,35 +312,74 @@ class StrategyEngineThreaded(threading.Thread):
             print(f"❌ STRATEGY: Failed to setup ZMQ: {e}")
             return False
     
-    def _print_dashboard(self) -> None:
-        """Print status dashboard."""
-        current_time = time.time()
+    def _drain_feedback(self) -> int:
+        """
+        Process every pending trade result (bounded per cycle).
         
-        # Print every 10 seconds
-        if current_time - self.last_dashboard_time < 10:
-            return
+        Returns:
+            Number of feedback messages processed
+        """
+        processed = 0
+        while processed < self.FEEDBACK_BATCH_SIZE:
+            try:
+                feedback = self.feedback_queue.get_nowait()
+            except queue.Empty:
+                break
+            
+            self.feedback_processor.process_feedback(feedback)
+            processed += 1
         
-        self.last_dashboard_time = current_time
+        return processed
+    
+    def _drain_ticks(self, timeout: float) -> int:
+        """
+        Wait for tick data, then drain everything pending (bounded per cycle).
         
-        # Get feedback stats
-        stats = self.feedback_processor.get_stats()
+        Blocks on the ingestion queue for at most ``timeout`` seconds, so the
+        engine wakes as soon as a tick arrives instead of sleeping blindly.
+        With a ConflatingMailbox (or the process mode's SharedRingMailbox),
+        at most one update per symbol is taken per cycle; an SpscRing is
+        drained with one batch pop.
         
-        print("\n" + "=" * 70)
-        print("📊 STRATEGY ENGINE DASHBOARD")
-        print("=" * 70)
-        print(f"Ticks processed: {self.tick_count}")
-        print(f"Policies sent: {self.policy_count}")
-        print(f"Feedback: {stats['total_wins']}W/{stats['total_losses']}L ({stats['total_trades']} trades)")
-        print(f"Total profit: {stats['total_profit']:+.2f}")
-        print(f"Risk multiplier: {stats['risk_multiplier']:.2f}x")
+        Args:
+            timeout: Maximum time to wait for the first tick (seconds)
+            
+        Returns:
+            Number of ticks (or symbol updates) processed
+        """
+        if isinstance(self.ingestion_queue, (ConflatingMailbox, SharedRingMailbox)):
+            updates = self.ingestion_queue.drain(timeout)
+            for update in updates:
+                self._process_tick(update.tick, update.count)
+            return len(updates)
         
-        if stats['is_in_cooldown']:
-            remaining = stats['cooldown_until'] - current_time
-            print(f"⏳ COOLDOWN: {remaining:.0f}s remaining")
-        else:
-            print("✅ Trading active")
+        if isinstance(self.ingestion_queue, SpscRing):
+            if timeout > 0:
+                self.ingestion_queue.wait(timeout)
+            ticks = self.ingestion_queue.pop_batch(self.TICK_BATCH_SIZE)
+            for tick_data in ticks:
+                self._process_tick(tick_data)
+            return len(ticks)
         
-        print("=" * 70 + "\n")
+        try:
+            tick_data = self.ingestion_queue.get(timeout=timeout) if timeout > 0 \
+                else self.ingestion_queue.get_nowait()
+        except queue.Empty:
+            return 0
+        
+        self._process_tick(tick_data)
+        processed = 1
+        
+        while processed < self.TICK_BATCH_SIZE:
+            try:
+                tick_data = self.ingestion_queue.get_nowait()
+            except queue.Empty:
+                break
+            
+            self._process_tick(tick_data)
+            processed += 1
+        
+        return processed
     
     def run(self) -> None:
         """Main worker loop."""
@@ -138,67 +394,20 @@ class StrategyEngineThreaded(threading.Thread):
         # Small delay to ensure socket binding
         time.sleep(1)
         
-        # Grid policy timer
-        last_grid_policy_time = 0
-        GRID_POLICY_INTERVAL = 5.0  # Publish Grid policy every 5 seconds
+        self._schedule_jobs()
+        timers = self.timers
         
         try:
             while not self.shutdown_event.is_set():
-                # Step 1: Check for feedback (non-blocking)
-                feedback = None
-                try:
-                    feedback = self.feedback_queue.get_nowait()
-                except queue.Empty:
-                    pass
-                
-                if feedback:
-                    self.feedback_processor.process_feedback(feedback)
-                
-                # Step 2: Process tick data (non-blocking)
-                tick_data = None
-                try:
-                    tick_data = self.ingestion_queue.get(timeout=0.1)
-                except queue.Empty:
-                    pass
-                
-                if tick_data:
-                    self.tick_count += 1
-                    self.tick_buffer.append(tick_data)
-                    
-                    # Analyze market
-                    signal = self.market_analyzer.analyze_market(
-                        tick_data,
-                        self.tick_buffer,
-                        self.feedback_processor.is_in_cooldown()
-                    )
-                    
-                    # Generate policy if signal exists
-                    if signal:
-                        symbol = tick_data.get('symbol', 'XAUUSD')
-                        self.policy_publisher.publish_policy(
-                            signal,
-                            symbol,
-                            self.pub_socket,
-                            self.feedback_processor
-                        )
-                        self.policy_count += 1
-                
-                # Step 3: Publish Grid policy periodically
-                current_time = time.time()
-                if current_time - last_grid_policy_time >= GRID_POLICY_INTERVAL:
-                    self.policy_publisher.publish_policy_with_grid_data(
-                        'XAUUSD',
-                        self.pub_socket,
-                        self.feedback_processor
-                    )
-                    self.policy_count += 1
-                    last_grid_policy_time = current_time
+                # Step 1: Drain feedback (trade results are rare but urgent)
+                self._drain_feedback()
                 
-                # Step 4: Print dashboard
-                self._print_dashboard()
+                # Step 2: Wait for ticks until the next deadline, then drain
+                self._drain_ticks(min(timers.time_until_next(self.MAX_IDLE_WAIT),
+                                      self.MAX_IDLE_WAIT))
                 
-                # Small sleep to prevent busy loop
-                time.sleep(0.01)
+                # Step 3: Timer jobs that are due (Grid policy, dashboard, CSM, ...)
+                timers.run_due()
         
         except Exception as e:
             print(f"❌ STRATEGY: Unexpected error: {e}")
@@ -212,8 +421,6 @@ class StrategyEngineThreaded(threading.Thread):
             
             if self.pub_socket:
                 self.pub_socket.close()
-            if self.context:
-                self.context.term()
             
             print("✅ STRATEGY ENGINE: Worker stopped")
 
@@ -223,7 +430,12 @@ def create_strategy_engine_threaded(
     signal_queue: queue.Queue,
     feedback_queue: queue.Queue,
     shutdown_event: threading.Event,
-    zmq_pub_address: str = "tcp://127.0.0.1:7778"
+    zmq_pub_address: str = "tcp://127.0.0.1:7778",
+    tick_store: Optional[TickStore] = None,
+    latency: Optional[LatencyRecorder] = None,
+    sockets: Optional[SocketFactory] = None,
+    grid_symbols: Optional[Sequence[str]] = None,
+    policy_encoding: str = 'compact'
 ) -> threading.Thread:
     """
     Factory function to create Strategy Engine thread.
@@ -234,6 +446,11 @@ def create_strategy_engine_threaded(
         feedback_queue: Thread-safe queue with trade results
         shutdown_event: Shutdown event
         zmq_pub_address: ZMQ address
+        tick_store: Per-symbol tick rings shared with the ingestion worker
+        latency: Stage latency histograms (optional)
+        sockets: Socket factory (default: the shared one)
+        grid_symbols: Symbols that always get a Grid policy
+        policy_encoding: Policy payload encoding ('compact' or 'verbose')
         
     Returns:
         StrategyEngineThreaded instance (not started)
@@ -243,5 +460,10 @@ def create_strategy_engine_threaded(
         signal_queue=signal_queue,
         feedback_queue=feedback_queue,
         shutdown_event=shutdown_event,
-        zmq_pub_address=zmq_pub_address
+        zmq_pub_address=zmq_pub_address,
+        tick_store=tick_store,
+        latency=latency,
+        sockets=sockets,
+        grid_symbols=grid_symbols,
+        policy_encoding=policy_encoding
     )
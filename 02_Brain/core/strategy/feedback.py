@@ -6,7 +6,12 @@ Handles trade results and risk adaptation
 """
 
 import time
-from typing import Dict, Any
+from typing import Dict, Any, Optional
+
+from core.log import get_logger
+from core.timer_wheel import TimerWheel
+
+logger = get_logger("strategy.feedback")
 
 
 class FeedbackProcessor:
@@ -18,10 +23,24 @@ class FeedbackProcessor:
     - Risk adjustment
     - Cooldown system
     - Performance statistics
+    
+    With a timer wheel, cooldown expiry and the "remaining" reminder are
+    timer jobs and is_in_cooldown() is a flag read; without one, the
+    cooldown is checked against the clock on every call.
     """
     
-    def __init__(self):
-        """Initialize Feedback Processor."""
+    COOLDOWN_END_JOB = 'feedback.cooldown_end'
+    COOLDOWN_LOG_JOB = 'feedback.cooldown_log'
+    
+    def __init__(self, timers: Optional[TimerWheel] = None):
+        """
+        Initialize Feedback Processor.
+        
+        Args:
+            timers: Timer wheel of the owning loop (None = check the clock)
+        """
+        self.timers = timers
+        
         # Feedback state variables
         self.consecutive_wins = 0
         self.consecutive_losses = 0
@@ -36,6 +55,8 @@ class FeedbackProcessor:
         self.LOSS_COOLDOWN_SECONDS = 30.0
         self.EMERGENCY_COOLDOWN_SECONDS = 300.0
         self.MAX_CONSECUTIVE_LOSSES = 3
+        self.COOLDOWN_LOG_INTERVAL = 10.0   # "remaining" message at most every 10s
+        self._next_cooldown_log = 0.0
         
         # Risk management
         self.risk_multiplier = 1.0  # Range: 0.5 - 1.5
@@ -67,7 +88,7 @@ class FeedbackProcessor:
         
         else:
             # Breakeven
-            print(f"⚪ FEEDBACK: BREAKEVEN | Ticket {ticket} | Profit: {profit:.2f}")
+            logger.info("⚪ FEEDBACK: BREAKEVEN | Ticket %d | Profit: %.2f", ticket, profit)
         
         # Display statistics
         self._print_statistics()
@@ -88,13 +109,14 @@ class FeedbackProcessor:
         if self._is_in_cooldown:
             self._is_in_cooldown = False
             self.cooldown_until = 0
-            print("✅ COOLDOWN CANCELED - Win during cooldown!")
+            self._cancel_cooldown_jobs()
+            logger.info("✅ COOLDOWN CANCELED - Win during cooldown!")
         
         # Hot streak detection
         if self.consecutive_wins >= 3:
-            print(f"🔥 HOT STREAK! {self.consecutive_wins} consecutive wins!")
+            logger.info("🔥 HOT STREAK! %d consecutive wins!", self.consecutive_wins)
         
-        print(f"💚 FEEDBACK: WIN | Ticket {ticket} | Profit: +{profit:.2f}")
+        logger.info("💚 FEEDBACK: WIN | Ticket %d | Profit: +%.2f", ticket, profit)
     
     def _process_loss(self, ticket: int, symbol: str, profit: float) -> None:
         """Process losing trade."""
@@ -115,21 +137,48 @@ class FeedbackProcessor:
             # EMERGENCY COOLDOWN
             self.cooldown_until = current_time + self.EMERGENCY_COOLDOWN_SECONDS
             self._is_in_cooldown = True
-            print(f"🚨 EMERGENCY COOLDOWN! {self.consecutive_losses} consecutive losses!")
-            print(f"🛑 Trading paused for {self.EMERGENCY_COOLDOWN_SECONDS:.0f} seconds")
+            logger.warning("🚨 EMERGENCY COOLDOWN! %d consecutive losses! "
+                           "Trading paused for %.0f seconds",
+                           self.consecutive_losses, self.EMERGENCY_COOLDOWN_SECONDS)
         else:
             # Normal cooldown
             self.cooldown_until = current_time + self.LOSS_COOLDOWN_SECONDS
             self._is_in_cooldown = True
-            print(f"⚠️ COOLDOWN ACTIVATED for {self.LOSS_COOLDOWN_SECONDS:.0f} seconds")
+            logger.warning("⚠️ COOLDOWN ACTIVATED for %.0f seconds", self.LOSS_COOLDOWN_SECONDS)
+        
+        if self.timers is not None:
+            self.timers.schedule(self.COOLDOWN_END_JOB, self.cooldown_until - current_time,
+                                 self._end_cooldown)
+            self.timers.schedule_periodic(self.COOLDOWN_LOG_JOB, self.COOLDOWN_LOG_INTERVAL,
+                                          self._log_cooldown, self.COOLDOWN_LOG_INTERVAL)
         
-        print(f"💔 FEEDBACK: LOSS | Ticket {ticket} | Loss: {profit:.2f}")
+        logger.info("💔 FEEDBACK: LOSS | Ticket %d | Loss: %.2f", ticket, profit)
     
     def _print_statistics(self) -> None:
-        """Print feedback statistics."""
+        """Log feedback statistics."""
         win_rate = (self.total_wins / self.total_trades * 100) if self.total_trades > 0 else 0
-        print(f"📊 Stats: {self.total_wins}W / {self.total_losses}L / {self.total_profit:+.2f} Total "
-              f"| Win Rate: {win_rate:.1f}% | Risk: {self.risk_multiplier:.2f}x")
+        logger.info(
+            "📊 Stats: %dW / %dL / %+.2f Total | Win Rate: %.1f%% | Risk: %.2fx",
+            self.total_wins, self.total_losses, self.total_profit, win_rate,
+            self.risk_multiplier,
+            extra={'fields': {'wins': self.total_wins, 'losses': self.total_losses,
+                              'total_profit': self.total_profit, 'win_rate': win_rate,
+                              'risk_multiplier': self.risk_multiplier}})
+    
+    def _end_cooldown(self) -> None:
+        """Timer job: cooldown expired."""
+        self._is_in_cooldown = False
+        self.timers.cancel(self.COOLDOWN_LOG_JOB)
+        logger.info("✅ COOLDOWN ENDED - Trading resumed")
+    
+    def _log_cooldown(self) -> None:
+        """Timer job: remaining cooldown reminder."""
+        logger.info("⏳ COOLDOWN: %.0fs remaining...", self.cooldown_until - time.time())
+    
+    def _cancel_cooldown_jobs(self) -> None:
+        if self.timers is not None:
+            self.timers.cancel(self.COOLDOWN_END_JOB)
+            self.timers.cancel(self.COOLDOWN_LOG_JOB)
     
     def is_in_cooldown(self) -> bool:
         """
@@ -138,23 +187,21 @@ class FeedbackProcessor:
         Returns:
             True if in cooldown (should not trade), False otherwise
         """
-        if not self._is_in_cooldown:
-            return False
+        if not self._is_in_cooldown or self.timers is not None:
+            return self._is_in_cooldown
         
         current_time = time.time()
         
         # Check if cooldown expired
         if current_time >= self.cooldown_until:
             self._is_in_cooldown = False
-            print("✅ COOLDOWN ENDED - Trading resumed")
+            logger.info("✅ COOLDOWN ENDED - Trading resumed")
             return False
         
-        # Still in cooldown
-        remaining = self.cooldown_until - current_time
-        
-        # Print every 10 seconds
-        if int(remaining) % 10 == 0:
-            print(f"⏳ COOLDOWN: {remaining:.0f}s remaining...")
+        # Still in cooldown (called per tick: log at most every 10 seconds)
+        if current_time >= self._next_cooldown_log:
+            self._next_cooldown_log = current_time + self.COOLDOWN_LOG_INTERVAL
+            logger.info("⏳ COOLDOWN: %.0fs remaining...", self.cooldown_until - current_time)
         
         return True
     
@@ -3,11 +3,207 @@
 """
 FlashEASuite V2 - Policy Publishing Module
 Handles policy generation and ZMQ publishing
+
+Every policy is a two-frame message [topic, msgpack payload] with the
+topic ``POL.<SYMBOL>`` (see 00_Common/ProtocolSpecs.md). A Trader that
+subscribes to ``POL.XAUUSD`` is never sent the other symbols' policies:
+the PUB socket filters on the topic frame.
+
+Grid policies are deduplicated per symbol: a full policy is sent only
+when a field the Trader acts on (GridDecision) moved beyond its
+tolerance or a snapshot is due, and a small keepalive goes out on the
+topic otherwise. The analytics ride along with full policies but never
+trigger one: tick rates and spread ratios move on almost every tick. Full policies and
+keepalives share one sequence number per topic, so a Trader can tell
+a quiet symbol from a lost message.
+
+Payloads come in two encodings (config.POLICY_ENCODING):
+
+    compact   msgpack array with fixed positions, starting with
+              [MSG_TYPE, VERSION, SEQ, TIMESTAMP_MS, SYMBOL, ...]
+    verbose   msgpack map with long keys (the original format)
+
+A Trader tells them apart by the msgpack type (array vs map) and checks
+VERSION before reading a compact frame; decode_policy() does both.
 """
 
 import time
 import msgpack
-from typing import Dict, Any, Optional
+import zmq
+from typing import Dict, Any, List, NamedTuple, Optional, Sequence, Tuple
+
+from core.log import get_logger
+from core.strategy.analysis import ANALYTICS_FIELDS, NO_ANALYTICS_ROW
+
+logger = get_logger("strategy.policy")
+
+POLICY_TOPIC_PREFIX = b"POL."
+
+# Policy encodings
+POLICY_FORMAT_COMPACT = 'compact'
+POLICY_FORMAT_VERBOSE = 'verbose'
+
+# Compact frames (message types as in Include/Network/Protocol/Definitions.mqh)
+MSG_TYPE_POLICY = 2
+MSG_TYPE_HEARTBEAT = 3              # Keepalive
+COMPACT_POLICY_VERSION = 1
+
+# Field order of the compact frames after [MSG_TYPE, VERSION]
+COMPACT_HEADER_FIELDS = ('seq', 'timestamp', 'symbol')
+COMPACT_POLICY_FIELDS = COMPACT_HEADER_FIELDS + ('action', 'confidence', 'risk_multiplier')
+COMPACT_GRID_FIELDS = COMPACT_POLICY_FIELDS + ('weight', 'is_in_cooldown', 'csm', 'analytics',
+                                               'debug_info', 'spread_gate')
+CSM_CURRENCIES = ('USD', 'EUR', 'GBP', 'JPY')
+DEBUG_INFO_FIELDS = ('total_trades', 'win_rate', 'total_profit', 'consecutive_wins',
+                     'consecutive_losses')
+
+
+class GridDecision(NamedTuple):
+    """The fields of a Grid policy a Trader acts on (what dedupe compares)."""
+    confidence: float
+    risk_multiplier: float
+    is_in_cooldown: bool
+    csm_bias: float     # Base minus quote trend strength (strength_slow)
+    spread_gate: float
+
+
+def policy_topic(symbol: str) -> bytes:
+    """
+    Topic frame for a symbol's policies.
+    
+    Args:
+        symbol: Symbol name (e.g. 'XAUUSD')
+        
+    Returns:
+        Topic bytes (e.g. b'POL.XAUUSD')
+    """
+    return POLICY_TOPIC_PREFIX + symbol.encode()
+
+
+def policy_changed(old: Any, new: Any, tolerance: float) -> bool:
+    """
+    Compare a policy with the last published one.
+    
+    Floats count as changed when they differ by more than ``tolerance``
+    relative to the larger of the two; everything else must be equal.
+    Nested dicts and lists (csm, analytics, debug_info) are compared the
+    same way, so both policy encodings can be compared.
+    
+    Args:
+        old: Last published policy (without timestamp and seq)
+        new: Candidate policy (without timestamp and seq)
+        tolerance: Relative float tolerance (e.g. 0.05 = 5%)
+        
+    Returns:
+        True if ``new`` has to be published
+    """
+    if old == new:
+        return False    # Common case, compared in C
+    
+    if isinstance(new, dict):
+        if old.keys() != new.keys():
+            return True
+        pairs = ((old[key], value) for key, value in new.items())
+    else:
+        if len(old) != len(new):
+            return True
+        pairs = zip(old, new)
+    
+    for previous, value in pairs:
+        if value == previous:
+            continue
+        if isinstance(value, (dict, list)) and type(previous) is type(value):
+            if policy_changed(previous, value, tolerance):
+                return True
+        elif isinstance(value, float) and isinstance(previous, float):
+            if abs(value - previous) > tolerance * max(abs(value), abs(previous)):
+                return True
+        else:
+            return True
+    return False
+
+
+def decision_changed(
+    old: GridDecision,
+    new: GridDecision,
+    tolerance: float,
+    bias_tolerance: float,
+    gate_tolerance: float
+) -> bool:
+    """
+    Compare the decision fields of a Grid policy with the last published ones.
+    
+    Confidence and risk multiplier count as changed beyond ``tolerance``
+    (relative, see policy_changed), the cooldown flag on any change, and
+    the CSM bias beyond ``bias_tolerance`` strength points (absolute: the
+    bias crosses zero, where a relative change means nothing). The fast
+    strength is a 5s spike meter that swings by several points between
+    cycles, so it only rides along in the analytics.
+    
+    The spread gate has its own relative ``gate_tolerance``: it is a p99
+    estimate that moves with every spread, by far more than 5% around
+    news. The p50/p90/p99 in the analytics are never compared.
+    
+    Args:
+        old: Last published decision
+        new: Candidate decision
+        tolerance: Relative tolerance for confidence and risk multiplier
+        bias_tolerance: Absolute tolerance for the CSM bias
+        gate_tolerance: Relative tolerance for the spread gate
+        
+    Returns:
+        True if the policy has to be published in full
+    """
+    if old == new:
+        return False
+    if old.is_in_cooldown != new.is_in_cooldown:
+        return True
+    if policy_changed(old[:2], new[:2], tolerance):
+        return True
+    if abs(new.csm_bias - old.csm_bias) > bias_tolerance:
+        return True
+    gate, last_gate = new.spread_gate, old.spread_gate
+    return abs(gate - last_gate) > gate_tolerance * max(gate, last_gate)
+
+
+def decode_policy(payload: bytes) -> Dict[str, Any]:
+    """
+    Decode a policy or keepalive payload of either encoding.
+    
+    Compact frames are turned into the verbose map layout ('type' is
+    'POLICY' or 'KEEPALIVE'; csm, analytics and debug_info become maps).
+    
+    Args:
+        payload: msgpack payload frame (after the topic frame)
+        
+    Returns:
+        Policy dictionary
+        
+    Raises:
+        ValueError: Unknown compact message type or version
+    """
+    message = msgpack.unpackb(payload, raw=False)
+    if isinstance(message, dict):
+        return message
+    
+    msg_type, version = message[0], message[1]
+    if version != COMPACT_POLICY_VERSION:
+        raise ValueError(f"Unsupported compact policy version: {version}")
+    
+    if msg_type == MSG_TYPE_HEARTBEAT:
+        policy = dict(zip(COMPACT_HEADER_FIELDS, message[2:]))
+        policy['type'] = 'KEEPALIVE'
+        return policy
+    if msg_type != MSG_TYPE_POLICY:
+        raise ValueError(f"Unknown compact policy type: {msg_type}")
+    
+    policy = dict(zip(COMPACT_GRID_FIELDS, message[2:]))
+    policy['type'] = 'POLICY'
+    if 'csm' in policy:
+        policy['csm'] = dict(zip(CSM_CURRENCIES, policy['csm']))
+        policy['analytics'] = dict(zip(ANALYTICS_FIELDS, policy['analytics']))
+        policy['debug_info'] = dict(zip(DEBUG_INFO_FIELDS, policy['debug_info']))
+    return policy
 
 
 class PolicyPublisher:
@@ -18,11 +214,74 @@ class PolicyPublisher:
     - Policy message creation
     - CSM data integration
     - ZMQ message packing
+    
+    Grid policies for all symbols of a cycle are packed in one pass and
+    sent back to back, one [topic, payload] message per symbol. A symbol
+    whose decision fields (GridDecision) have not changed gets a
+    keepalive instead, except every ``snapshot_interval`` seconds, when
+    its full policy is repeated for Traders that joined since.
+    
+    Everything is packed with one reused msgpack.Packer; compact policies
+    are flat lists, so no maps are built per symbol.
     """
     
-    def __init__(self):
-        """Initialize Policy Publisher."""
-        pass
+    def __init__(
+        self,
+        tolerance: float = 0.05,
+        snapshot_interval: float = 30.0,
+        encoding: str = POLICY_FORMAT_COMPACT,
+        bias_tolerance: float = 0.5,
+        gate_tolerance: float = 0.2
+    ):
+        """
+        Initialize Policy Publisher.
+        
+        Args:
+            tolerance: Relative change of confidence or risk multiplier
+                that triggers a full policy (0 = any change)
+            snapshot_interval: Seconds between full policies of an
+                unchanged symbol (0 = always send full policies)
+            encoding: POLICY_FORMAT_COMPACT or POLICY_FORMAT_VERBOSE
+            bias_tolerance: Change of the CSM bias (trend strength points,
+                on the meter's 0-10 scale) that triggers a full policy
+            gate_tolerance: Relative change of the spread gate that
+                triggers a full policy
+        """
+        if encoding not in (POLICY_FORMAT_COMPACT, POLICY_FORMAT_VERBOSE):
+            raise ValueError(f"Unknown policy encoding: {encoding}")
+        
+        self.tolerance = tolerance
+        self.bias_tolerance = bias_tolerance
+        self.gate_tolerance = gate_tolerance
+        self.snapshot_interval = snapshot_interval
+        self.encoding = encoding
+        self.compact = encoding == POLICY_FORMAT_COMPACT
+        
+        # One packer for every payload (msgpack.packb builds a new one per call)
+        self._pack = msgpack.Packer().pack
+        
+        # Topic frames per symbol (built once)
+        self._topics: Dict[str, bytes] = {}
+        
+        # Per-symbol publish state
+        self._last_decision: Dict[str, GridDecision] = {}
+        self._last_full_time: Dict[str, float] = {}
+        self._seq: Dict[str, int] = {}
+        
+        # Statistics
+        self.full_sent = 0
+        self.keepalives_sent = 0
+    
+    def _topic(self, symbol: str) -> bytes:
+        topic = self._topics.get(symbol)
+        if topic is None:
+            topic = self._topics[symbol] = policy_topic(symbol)
+        return topic
+    
+    def _next_seq(self, symbol: str) -> int:
+        seq = self._seq.get(symbol, 0) + 1
+        self._seq[symbol] = seq
+        return seq
     
     def publish_policy(
         self,
@@ -48,44 +307,73 @@ class PolicyPublisher:
         # Apply risk multiplier to confidence
         adjusted_confidence = confidence * risk_multiplier
         
+        action = 1 if signal == 'BUY' else 2  # 0=HOLD, 1=BUY, 2=SELL
+        timestamp = int(time.time() * 1000)
+        
         # Create policy message
-        policy = {
-            'type': 'POLICY',
-            'symbol': symbol,
-            'action': 1 if signal == 'BUY' else 2,  # 0=HOLD, 1=BUY, 2=SELL
-            'confidence': adjusted_confidence,
-            'timestamp': int(time.time() * 1000),
-            'model_version': 'DYN_V6_FEEDBACK',
-            'debug_info': f"Risk:{risk_multiplier:.2f}x"
-        }
+        if self.compact:
+            policy = [MSG_TYPE_POLICY, COMPACT_POLICY_VERSION, self._next_seq(symbol), timestamp,
+                      symbol, action, adjusted_confidence, risk_multiplier]
+        else:
+            policy = {
+                'type': 'POLICY',
+                'symbol': symbol,
+                'action': action,
+                'confidence': adjusted_confidence,
+                'timestamp': timestamp,
+                'seq': self._next_seq(symbol),
+                'model_version': 'DYN_V6_FEEDBACK',
+                'debug_info': f"Risk:{risk_multiplier:.2f}x"
+            }
         
         # Pack and send
-        packed = msgpack.packb(policy)
-        pub_socket.send(packed)
+        pub_socket.send_multipart((self._topic(symbol), self._pack(policy)))
+        self.full_sent += 1
         
-        print(f"📤 POLICY: {signal} {symbol} | Confidence: {adjusted_confidence:.2f} | "
-              f"Risk: {risk_multiplier:.2f}x")
+        logger.info("📤 POLICY: %s %s | Confidence: %.2f | Risk: %.2fx",
+                    signal, symbol, adjusted_confidence, risk_multiplier,
+                    extra={'fields': {'event': 'policy', 'signal': signal, 'symbol': symbol,
+                                      'confidence': adjusted_confidence,
+                                      'risk_multiplier': risk_multiplier}})
     
-    def publish_policy_with_grid_data(
+    def publish_grid_policies(
         self,
-        symbol: str,
+        symbols: Sequence[str],
         pub_socket,
-        feedback_processor
-    ) -> None:
+        feedback_processor,
+        market_analyzer=None
+    ) -> int:
         """
-        Publish policy with Grid-specific data.
+        Publish the Grid policy (or a keepalive) of each symbol in one burst.
         
-        This method sends comprehensive data for the Elastic Grid Strategy:
+        Each policy carries comprehensive data for the Elastic Grid Strategy:
         - risk_multiplier (from feedback loop)
         - is_in_cooldown (pause trading)
         - confidence (based on performance)
         - CSM data (currency strength)
+        - the symbol's own analytics (tick flow, base/quote strength)
+        - spread_gate: widest spread at which a Grid may open (p99 of
+          the last 15 minutes, 0.0 = none yet)
+        
+        Account-level state (feedback, CSM) is read once per cycle; only
+        the analytics differ between symbols. The decision fields are read
+        first; only policies that changed beyond their tolerance, or
+        whose snapshot is due, have their analytics read and are packed
+        in full. The other symbols get a keepalive.
         
         Args:
-            symbol: Symbol to trade
+            symbols: Symbols to publish a policy for
             pub_socket: ZMQ PUB socket
             feedback_processor: FeedbackProcessor instance
+            market_analyzer: MarketAnalyzer with per-symbol analytics
+                and the CSM (None = no analytics, neutral CSM)
+            
+        Returns:
+            Number of full policies sent
         """
+        if not symbols:
+            return 0
+        
         # Get feedback stats
         stats = feedback_processor.get_stats()
         
@@ -93,49 +381,180 @@ class PolicyPublisher:
         confidence = feedback_processor.calculate_confidence()
         
         # Get CSM data (if available)
-        csm_data = self._get_csm_data()
-        
-        # Create comprehensive policy
-        policy = {
-            'type': 'POLICY',
-            'symbol': symbol,
-            'action': 0,  # 0=HOLD, wait for Grid to decide
-            'weight': 1.0,
-            'timestamp': int(time.time() * 1000),
-            'model_version': 'DYN_V6_FEEDBACK_GRID',
+        csm = market_analyzer.get_csm() if market_analyzer is not None else None
+        csm_data = self._get_csm_data(csm)
+        
+        timestamp = int(time.time() * 1000)
+        debug_info = {
+            'total_trades': stats['total_trades'],
+            'win_rate': (stats['total_wins'] / stats['total_trades'] * 100) if stats['total_trades'] > 0 else 0,
+            'total_profit': stats['total_profit'],
+            'consecutive_wins': stats['consecutive_wins'],
+            'consecutive_losses': stats['consecutive_losses']
+        }
+        
+        compact = self.compact
+        if compact:
+            # Shared rows, in CSM_CURRENCIES / DEBUG_INFO_FIELDS order
+            csm_row = [csm_data[currency] for currency in CSM_CURRENCIES]
+            debug_row = [debug_info[field] for field in DEBUG_INFO_FIELDS]
+        
+        # Pack every changed policy (and a keepalive for the rest) in one pass
+        pack = self._pack
+        now = time.monotonic()
+        tolerance = self.tolerance
+        bias_tolerance = self.bias_tolerance
+        gate_tolerance = self.gate_tolerance
+        snapshot_interval = self.snapshot_interval
+        risk_multiplier = stats['risk_multiplier']
+        is_in_cooldown = stats['is_in_cooldown']
+        messages: List[Tuple[bytes, bytes]] = []
+        changed: List[str] = []
+        for symbol in symbols:
+            # Decision fields only: the analytics are read for full policies
+            if market_analyzer is not None:
+                spread_gate = market_analyzer.get_spread_gate(symbol)
+                decision = GridDecision(confidence, risk_multiplier, is_in_cooldown,
+                                        market_analyzer.get_csm_bias(symbol), spread_gate)
+            else:
+                spread_gate = 0.0
+                decision = GridDecision(confidence, risk_multiplier, is_in_cooldown,
+                                        0.0, spread_gate)
             
-            # Grid-specific data
-            'risk_multiplier': stats['risk_multiplier'],
-            'is_in_cooldown': stats['is_in_cooldown'],
-            'confidence': confidence,
+            last = self._last_decision.get(symbol)
+            if not (last is None or snapshot_interval <= 0 or
+                    now - self._last_full_time[symbol] >= snapshot_interval or
+                    decision_changed(last, decision, tolerance, bias_tolerance,
+                                     gate_tolerance)):
+                seq = self._next_seq(symbol)
+                if compact:
+                    payload = pack([MSG_TYPE_HEARTBEAT, COMPACT_POLICY_VERSION, seq, timestamp,
+                                    symbol])
+                else:
+                    payload = pack({'type': 'KEEPALIVE', 'symbol': symbol, 'seq': seq,
+                                    'timestamp': timestamp})
+                messages.append((self._topic(symbol), payload))
+                continue
             
-            # CSM data
-            'csm': csm_data,
+            # Full policy (timestamp/seq added when packing)
+            if compact:
+                analytics_row = (market_analyzer.get_symbol_analytics_row(symbol)
+                                 if market_analyzer is not None else list(NO_ANALYTICS_ROW))
+                policy = [
+                    0,  # ACTION: 0=HOLD, wait for Grid to decide
+                    confidence,
+                    risk_multiplier,
+                    1.0,  # WEIGHT
+                    is_in_cooldown,
+                    csm_row,
+                    analytics_row,
+                    debug_row,
+                    spread_gate
+                ]
+            else:
+                analytics = (market_analyzer.get_symbol_analytics(symbol)
+                             if market_analyzer is not None else {})
+                policy = {
+                    'type': 'POLICY',
+                    'symbol': symbol,
+                    'action': 0,  # 0=HOLD, wait for Grid to decide
+                    'weight': 1.0,
+                    'model_version': 'DYN_V6_FEEDBACK_GRID',
+                    
+                    # Grid-specific data
+                    'risk_multiplier': risk_multiplier,
+                    'is_in_cooldown': is_in_cooldown,
+                    'confidence': confidence,
+                    
+                    # CSM data
+                    'csm': csm_data,
+                    
+                    # Symbol analytics
+                    'analytics': analytics,
+                    'spread_gate': spread_gate,
+                    
+                    # Debug info
+                    'debug_info': debug_info
+                }
             
-            # Debug info
-            'debug_info': {
-                'total_trades': stats['total_trades'],
-                'win_rate': (stats['total_wins'] / stats['total_trades'] * 100) if stats['total_trades'] > 0 else 0,
-                'total_profit': stats['total_profit'],
-                'consecutive_wins': stats['consecutive_wins'],
-                'consecutive_losses': stats['consecutive_losses']
-            }
-        }
+            self._last_decision[symbol] = decision
+            self._last_full_time[symbol] = now
+            changed.append(symbol)
+            seq = self._next_seq(symbol)
+            if compact:
+                payload = pack([MSG_TYPE_POLICY, COMPACT_POLICY_VERSION, seq, timestamp,
+                                symbol, *policy])
+            else:
+                payload = pack({**policy, 'timestamp': timestamp, 'seq': seq})
+            messages.append((self._topic(symbol), payload))
         
-        # Pack and send
-        packed = msgpack.packb(policy)
-        pub_socket.send(packed)
+        # Send as one burst (one message per symbol, so each can be
+        # filtered); send() + SNDMORE is ~3x cheaper than send_multipart()
+        send = pub_socket.send
+        for topic, payload in messages:
+            send(topic, zmq.SNDMORE)
+            send(payload)
         
-        # Log
-        print(f"📤 POLICY (Grid): {symbol}")
-        print(f"   Risk: {stats['risk_multiplier']:.2f}x | Cooldown: {stats['is_in_cooldown']} | Conf: {confidence:.2f}")
-        if csm_data.get('USD') is not None:
-            print(f"   CSM: USD={csm_data.get('USD', 0):.2f} EUR={csm_data.get('EUR', 0):.2f}")
+        self.full_sent += len(changed)
+        self.keepalives_sent += len(messages) - len(changed)
+        if not changed:
+            return 0
+        
+        # Log (one record per cycle, rate-limited: this repeats every few seconds)
+        logger.info(
+            "📤 POLICY (Grid): %d/%d symbols changed (%s) | Risk: %.2fx | Cooldown: %s | Conf: %.2f | "
+            "CSM: USD=%.2f EUR=%.2f",
+            len(changed), len(messages),
+            ", ".join(changed[:4]) + (", ..." if len(changed) > 4 else ""),
+            stats['risk_multiplier'], stats['is_in_cooldown'], confidence,
+            csm_data.get('USD', 0), csm_data.get('EUR', 0),
+            extra={'rate_key': 'policy.grid',
+                   'fields': {'event': 'grid_policy', 'symbols': changed,
+                              'keepalives': len(messages) - len(changed),
+                              'risk_multiplier': stats['risk_multiplier'],
+                              'is_in_cooldown': stats['is_in_cooldown'],
+                              'confidence': confidence, 'csm': csm_data}})
+        
+        return len(changed)
     
-    def _get_csm_data(self) -> Dict[str, float]:
+    def publish_policy_with_grid_data(
+        self,
+        symbol: str,
+        pub_socket,
+        feedback_processor,
+        market_analyzer=None
+    ) -> None:
+        """
+        Publish the Grid policy of a single symbol.
+        
+        Args:
+            symbol: Symbol to trade
+            pub_socket: ZMQ PUB socket
+            feedback_processor: FeedbackProcessor instance
+            market_analyzer: MarketAnalyzer (optional, see publish_grid_policies)
+        """
+        self.publish_grid_policies([symbol], pub_socket, feedback_processor, market_analyzer)
+    
+    def get_stats(self) -> Dict[str, int]:
+        """
+        Get publishing statistics.
+        
+        Returns:
+            Dictionary with full policies and keepalives sent
+        """
+        return {
+            'full_sent': self.full_sent,
+            'keepalives_sent': self.keepalives_sent,
+            'symbols': len(self._last_decision),
+        }
+    
+    def _get_csm_data(self, csm=None) -> Dict[str, float]:
         """
         Get Currency Strength Meter data.
         
+        Args:
+            csm: The engine's CurrencyStrengthMeter (None = not available)
+            
         Returns:
             Dictionary with currency strengths
         """
@@ -146,23 +565,15 @@ class PolicyPublisher:
             'JPY': 0.0
         }
         
-        # Try to get CSM data if module available
+        if csm is None:
+            # Module not available, use defaults
+            return csm_data
+        
         try:
-            from modules.currency_meter import CurrencyStrengthMeter
-            
-            # Create CSM instance
-            csm = CurrencyStrengthMeter()
-            
             # Use scores_fast dictionary (fast strength calculation)
-            csm_data['USD'] = csm.scores_fast.get('USD', 5.0)
-            csm_data['EUR'] = csm.scores_fast.get('EUR', 5.0)
-            csm_data['GBP'] = csm.scores_fast.get('GBP', 5.0)
-            csm_data['JPY'] = csm.scores_fast.get('JPY', 5.0)
-            
-        except ImportError:
-            # Module not available, use defaults
-            pass
+            for currency in csm_data:
+                csm_data[currency] = csm.scores_fast.get(currency, 5.0)
         except Exception as e:
-            print(f"⚠️ CSM error: {e}")
+            logger.warning("⚠️ CSM error: %s", e, extra={'rate_key': 'policy.csm_error'})
         
         return csm_data
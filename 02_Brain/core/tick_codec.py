@@ -0,0 +1,253 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+FlashEASuite V2 - Tick Codec
+Decodes Feeder tick frames and tracks SEQ_ID continuity
+
+Wire format (see 00_Common/ProtocolSpecs.md, FeederEA.mq5):
+    [1, SEQ_ID, SERVER_TIME_MS, SYMBOL, BID, ASK, FLAGS]
+"""
+
+from typing import Any, Dict, Iterator, NamedTuple, Optional
+
+import msgpack
+
+# Message type / layout
+TICK_MSG_TYPE = 1
+TICK_FIELD_COUNT = 7
+
+
+class Tick(NamedTuple):
+    """One Feeder tick, in wire order, plus the local receive stamp."""
+    msg_type: int
+    seq: int
+    time_msc: int
+    symbol: str
+    bid: float
+    ask: float
+    flags: int
+    recv_ns: int = 0    # perf_counter_ns at receive (0 = not stamped)
+
+
+# Build Tick straight from the decoded tuple (skips NamedTuple._make overhead)
+_new_tick = tuple.__new__
+
+
+def unpack_tick(raw_data: bytes, recv_ns: int = 0) -> Tick:
+    """
+    Rebuild a Tick from a frame a TickDecoder has already accepted.
+
+    No validation and no SEQ_ID tracking: used by the consumer end of a
+    stage link, after ingestion has decoded and tracked the frame.
+
+    Args:
+        raw_data: Feeder tick frame
+        recv_ns: Receive stamp (0 = not stamped)
+
+    Returns:
+        Tick
+    """
+    return _new_tick(Tick, msgpack.unpackb(raw_data, use_list=False) + (recv_ns,))
+
+
+class SequenceTracker:
+    """
+    SEQ_ID continuity tracker for a single Feeder.
+
+    Classifies every sequence number as in-order, gap (ticks lost, e.g.
+    HWM drops), duplicate, late (reordered) arrival, or Feeder restart.
+    """
+
+    # Jump back larger than this is treated as a Feeder restart
+    RESET_THRESHOLD = 10000
+
+    def __init__(self, max_pending: int = 4096):
+        """
+        Initialize tracker.
+
+        Args:
+            max_pending: Max missing SEQ_IDs remembered for reorder detection
+        """
+        self.max_pending = max_pending
+
+        self.last_seq: Optional[int] = None
+        self.received = 0
+        self.gaps = 0            # Gap events
+        self.lost = 0            # Missing SEQ_IDs (net of late arrivals)
+        self.duplicates = 0
+        self.reorders = 0        # Late arrivals that filled an earlier gap
+        self.resets = 0          # Feeder restarts (SEQ_ID jumped back)
+
+        # Missing SEQ_IDs, oldest first (dict used as an ordered set)
+        self._missing: Dict[int, None] = {}
+
+    def observe(self, seq: int) -> None:
+        """
+        Record one received SEQ_ID.
+
+        Args:
+            seq: Sequence number from the tick frame
+        """
+        self.received += 1
+        last = self.last_seq
+
+        if last is None or seq == last + 1:
+            self.last_seq = seq
+            return
+
+        if seq > last:
+            # Gap: everything between last and seq is missing
+            missed = seq - last - 1
+            self.gaps += 1
+            self.lost += missed
+            if missed <= self.max_pending:
+                missing = self._missing
+                for s in range(last + 1, seq):
+                    missing[s] = None
+                while len(missing) > self.max_pending:
+                    del missing[next(iter(missing))]
+            self.last_seq = seq
+            return
+
+        if seq in self._missing:
+            # Late arrival filling an earlier gap
+            del self._missing[seq]
+            self.reorders += 1
+            self.lost -= 1
+        elif last - seq > self.RESET_THRESHOLD or seq <= 1:
+            # Feeder EA restarted its counter
+            self.resets += 1
+            self._missing.clear()
+            self.last_seq = seq
+        else:
+            self.duplicates += 1
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get loss counters.
+
+        Returns:
+            Dictionary with continuity statistics
+        """
+        expected = self.received - self.duplicates + self.lost
+        return {
+            'last_seq': self.last_seq,
+            'received': self.received,
+            'gaps': self.gaps,
+            'lost': self.lost,
+            'duplicates': self.duplicates,
+            'reorders': self.reorders,
+            'resets': self.resets,
+            'loss_rate': (self.lost / expected) if expected > 0 else 0.0,
+        }
+
+
+class TickDecoder:
+    """
+    Decoder for Feeder tick frames.
+
+    ``decode()`` is the hot path for single ZMQ frames: one
+    ``msgpack.unpackb`` into a tuple, turned into a Tick without any
+    intermediate dict. ``feed()``/``__iter__`` decode a byte stream of
+    concatenated frames with one reused ``msgpack.Unpacker``.
+
+    SEQ_ID continuity is tracked per Feeder. Frames carry no Feeder id,
+    so callers pass one (e.g. the SUB endpoint a Feeder connects to).
+    """
+
+    def __init__(self, track_sequence: bool = True):
+        """
+        Initialize decoder.
+
+        Args:
+            track_sequence: Track SEQ_ID gaps/duplicates per Feeder
+        """
+        self.track_sequence = track_sequence
+        self.trackers: Dict[str, SequenceTracker] = {}
+
+        self.decoded = 0
+        self.errors = 0
+
+        # Streaming decoder (reused across feed() calls)
+        self._unpacker = msgpack.Unpacker(use_list=False, raw=False)
+        self._stream_feeder = 'default'
+
+    def decode(self, raw_data: bytes, feeder: str = 'default', recv_ns: int = 0) -> Tick:
+        """
+        Decode one tick frame.
+
+        Args:
+            raw_data: MessagePack-encoded frame
+            feeder: Feeder id for SEQ_ID tracking
+            recv_ns: perf_counter_ns when the frame was received
+
+        Returns:
+            Decoded Tick
+
+        Raises:
+            ValueError: If the frame is not a valid tick
+        """
+        try:
+            frame = msgpack.unpackb(raw_data, use_list=False, raw=False)
+        except Exception as e:
+            self.errors += 1
+            raise ValueError(f"Undecodable frame: {e}") from e
+
+        return self._to_tick(frame, feeder, recv_ns)
+
+    def feed(self, data: bytes, feeder: str = 'default') -> None:
+        """
+        Feed raw bytes from a stream of concatenated frames.
+
+        Args:
+            data: Bytes to append to the stream buffer
+            feeder: Feeder id for SEQ_ID tracking
+        """
+        self._stream_feeder = feeder
+        self._unpacker.feed(data)
+
+    def __iter__(self) -> Iterator[Tick]:
+        """Yield every complete tick buffered by feed()."""
+        for frame in self._unpacker:
+            try:
+                yield self._to_tick(frame, self._stream_feeder)
+            except ValueError:
+                continue
+
+    def _to_tick(self, frame: Any, feeder: str, recv_ns: int = 0) -> Tick:
+        """Validate a decoded frame and build a Tick."""
+        if (type(frame) is not tuple or len(frame) != TICK_FIELD_COUNT
+                or frame[0] != TICK_MSG_TYPE):
+            self.errors += 1
+            raise ValueError(f"Invalid tick frame: {frame!r}")
+
+        tick = _new_tick(Tick, frame + (recv_ns,))
+
+        if self.track_sequence:
+            tracker = self.trackers.get(feeder)
+            if tracker is None:
+                tracker = self.trackers[feeder] = SequenceTracker()
+            tracker.observe(tick.seq)
+
+        self.decoded += 1
+        return tick
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get decoder and per-Feeder loss statistics.
+
+        Returns:
+            Dictionary with decode counts and per-Feeder SEQ_ID stats
+        """
+        return {
+            'decoded': self.decoded,
+            'errors': self.errors,
+            'feeders': {
+                feeder: tracker.get_stats()
+                for feeder, tracker in self.trackers.items()
+            },
+        }
+
+    def total_lost(self) -> int:
+        """Total missing SEQ_IDs across all Feeders."""
+        return sum(tracker.lost for tracker in self.trackers.values())
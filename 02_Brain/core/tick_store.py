@@ -0,0 +1,282 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+FlashEASuite V2 - Tick Store
+Columnar per-symbol tick ring buffers backed by NumPy
+
+The ingestion worker writes each tick once into its symbol's ring.
+Analyzers read the most recent rows as zero-copy NumPy views.
+"""
+
+from typing import Dict, List, NamedTuple, Optional
+
+import numpy as np
+
+
+class TickWindow(NamedTuple):
+    """Column views over a contiguous run of ticks (oldest first)."""
+    time_msc: np.ndarray
+    bid: np.ndarray
+    ask: np.ndarray
+    flags: np.ndarray
+    seq: np.ndarray
+
+
+class TickRingBuffer:
+    """
+    Fixed-capacity columnar ring buffer for a single symbol.
+
+    Columns are preallocated at twice the capacity and every row is
+    written to both halves ("mirrored" ring). The last N rows are then
+    always contiguous in memory, so reads never copy or concatenate.
+
+    Single-writer: only the ingestion thread appends. Readers take
+    views of rows that have been published (row count is bumped last).
+    A view can be overwritten once the writer laps it, so copy the
+    arrays if you need to keep them longer than one analysis pass.
+    """
+
+    def __init__(self, symbol: str, capacity: int = 16384):
+        """
+        Initialize the ring buffer.
+
+        Args:
+            symbol: Symbol name
+            capacity: Maximum number of ticks retained
+        """
+        if capacity <= 0:
+            raise ValueError("capacity must be positive")
+
+        self.symbol = symbol
+        self.capacity = capacity
+
+        size = capacity * 2
+        self._time_msc = np.zeros(size, dtype=np.int64)
+        self._bid = np.zeros(size, dtype=np.float64)
+        self._ask = np.zeros(size, dtype=np.float64)
+        self._flags = np.zeros(size, dtype=np.int32)
+        self._seq = np.zeros(size, dtype=np.int64)
+
+        # Total rows ever written (monotonic)
+        self._count = 0
+
+    def __len__(self) -> int:
+        """Number of ticks currently retained."""
+        return min(self._count, self.capacity)
+
+    @property
+    def total_count(self) -> int:
+        """Number of ticks ever written to this ring."""
+        return self._count
+
+    def append(
+        self,
+        time_msc: int,
+        bid: float,
+        ask: float,
+        flags: int = 0,
+        seq: int = 0
+    ) -> None:
+        """
+        Append one tick (writer thread only).
+
+        Args:
+            time_msc: Feeder server time (milliseconds)
+            bid: Bid price
+            ask: Ask price
+            flags: MT5 tick flags
+            seq: Feeder sequence number
+        """
+        i = self._count % self.capacity
+        j = i + self.capacity
+
+        self._time_msc[i] = self._time_msc[j] = time_msc
+        self._bid[i] = self._bid[j] = bid
+        self._ask[i] = self._ask[j] = ask
+        self._flags[i] = self._flags[j] = flags
+        self._seq[i] = self._seq[j] = seq
+
+        # Publish the row only after all columns are written
+        self._count += 1
+
+    def extend(
+        self,
+        time_msc: np.ndarray,
+        bid: np.ndarray,
+        ask: np.ndarray,
+        flags: np.ndarray,
+        seq: np.ndarray
+    ) -> None:
+        """
+        Append a batch of ticks (writer thread only).
+
+        Equivalent to calling append() for each row, but writes each
+        column with at most two slice assignments per ring half.
+
+        Args:
+            time_msc: Feeder server times (milliseconds)
+            bid: Bid prices
+            ask: Ask prices
+            flags: MT5 tick flags
+            seq: Feeder sequence numbers
+        """
+        n = len(time_msc)
+        if n == 0:
+            return
+
+        # Only the last `capacity` rows can survive
+        skip = max(0, n - self.capacity)
+        columns = ((self._time_msc, time_msc), (self._bid, bid), (self._ask, ask),
+                   (self._flags, flags), (self._seq, seq))
+
+        start = (self._count + skip) % self.capacity
+        first = min(n - skip, self.capacity - start)
+        for dest, src in columns:
+            src = src[skip:]
+            for base in (0, self.capacity):
+                dest[base + start:base + start + first] = src[:first]
+                dest[base:base + len(src) - first] = src[first:]
+
+        # Publish the rows only after all columns are written
+        self._count += n
+
+    def window(self, n: Optional[int] = None) -> TickWindow:
+        """
+        Get zero-copy views of the most recent ticks.
+
+        Args:
+            n: Number of ticks (default: all retained ticks)
+
+        Returns:
+            TickWindow with oldest tick first
+        """
+        count = self._count
+        available = min(count, self.capacity)
+        n = available if n is None else max(0, min(n, available))
+
+        end = (count - 1) % self.capacity + 1 + self.capacity if count else 0
+        start = end - n
+
+        return TickWindow(
+            self._time_msc[start:end],
+            self._bid[start:end],
+            self._ask[start:end],
+            self._flags[start:end],
+            self._seq[start:end],
+        )
+
+    def since(self, time_msc: int) -> TickWindow:
+        """
+        Get zero-copy views of the ticks at or after a timestamp.
+
+        Args:
+            time_msc: Oldest timestamp to include (milliseconds)
+
+        Returns:
+            TickWindow with oldest tick first
+        """
+        full = self.window()
+        start = int(np.searchsorted(full.time_msc, time_msc, side='left'))
+        return TickWindow(*(column[start:] for column in full))
+
+    def latest(self) -> Optional[tuple]:
+        """
+        Get the most recent tick.
+
+        Returns:
+            (time_msc, bid, ask, flags, seq) or None if empty
+        """
+        if self._count == 0:
+            return None
+        i = (self._count - 1) % self.capacity
+        return (
+            int(self._time_msc[i]),
+            float(self._bid[i]),
+            float(self._ask[i]),
+            int(self._flags[i]),
+            int(self._seq[i]),
+        )
+
+    @property
+    def nbytes(self) -> int:
+        """Memory held by the column arrays."""
+        return (self._time_msc.nbytes + self._bid.nbytes + self._ask.nbytes
+                + self._flags.nbytes + self._seq.nbytes)
+
+
+class TickStore:
+    """
+    Collection of per-symbol tick ring buffers.
+
+    Rings are created lazily the first time a symbol is seen.
+    """
+
+    def __init__(self, capacity: int = 16384):
+        """
+        Initialize the tick store.
+
+        Args:
+            capacity: Ring capacity for each symbol
+        """
+        self.capacity = capacity
+        self._rings: Dict[str, TickRingBuffer] = {}
+
+    def append(
+        self,
+        symbol: str,
+        time_msc: int,
+        bid: float,
+        ask: float,
+        flags: int = 0,
+        seq: int = 0
+    ) -> TickRingBuffer:
+        """
+        Append a tick to its symbol's ring (writer thread only).
+
+        Returns:
+            The symbol's TickRingBuffer
+        """
+        ring = self._rings.get(symbol)
+        if ring is None:
+            ring = TickRingBuffer(symbol, self.capacity)
+            self._rings[symbol] = ring
+        ring.append(time_msc, bid, ask, flags, seq)
+        return ring
+
+    def extend(
+        self,
+        symbol: str,
+        time_msc: np.ndarray,
+        bid: np.ndarray,
+        ask: np.ndarray,
+        flags: np.ndarray,
+        seq: np.ndarray
+    ) -> TickRingBuffer:
+        """
+        Append a batch of ticks for one symbol (writer thread only).
+
+        Returns:
+            The symbol's TickRingBuffer
+        """
+        ring = self._rings.get(symbol)
+        if ring is None:
+            ring = TickRingBuffer(symbol, self.capacity)
+            self._rings[symbol] = ring
+        ring.extend(time_msc, bid, ask, flags, seq)
+        return ring
+
+    def get(self, symbol: str) -> Optional[TickRingBuffer]:
+        """Get a symbol's ring, or None if no tick has been seen."""
+        return self._rings.get(symbol)
+
+    def symbols(self) -> List[str]:
+        """List symbols that have at least one tick."""
+        return list(self._rings)
+
+    def __contains__(self, symbol: str) -> bool:
+        return symbol in self._rings
+
+    @property
+    def nbytes(self) -> int:
+        """Memory held by all rings."""
+        return sum(ring.nbytes for ring in list(self._rings.values()))
@@ -0,0 +1,289 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+FlashEASuite V2 - Timer Wheel
+Hashed timer wheel for periodic and one-shot jobs on a worker loop
+
+Time is cut into ticks of ``resolution`` seconds and a job is hashed
+into slot ``expiry_tick % slots``; jobs further away than one revolution
+share a slot with nearer ones and simply stay there until their own tick
+comes round. Scheduling and cancelling are O(1); advancing only visits
+the slots that passed, and not even those while nothing is due.
+
+The wheel has no thread of its own: the loop that owns it calls
+run_due() and sleeps until next_deadline(). It is not thread-safe, so
+jobs are scheduled from that loop (or from code it calls, such as the
+feedback processor).
+"""
+
+import time
+from typing import Any, Callable, Dict, List, Optional, Union
+
+from .log import get_logger
+
+logger = get_logger("timer")
+
+
+class TimerJob:
+    """A scheduled job and its runtime statistics."""
+
+    __slots__ = ('name', 'callback', 'interval', 'deadline', 'expiry_tick', 'active',
+                 'runs', 'errors', 'total_time', 'max_time', 'last_time')
+
+    def __init__(self, name: str, callback: Callable[[], Any], interval: Optional[float]):
+        self.name = name
+        self.callback = callback
+        self.interval = interval        # None = one-shot
+        self.deadline = 0.0
+        self.expiry_tick = 0
+        self.active = True
+
+        self.runs = 0
+        self.errors = 0
+        self.total_time = 0.0
+        self.max_time = 0.0
+        self.last_time = 0.0
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Runtime statistics (times in milliseconds)."""
+        return {
+            'interval': self.interval,
+            'runs': self.runs,
+            'errors': self.errors,
+            'avg_ms': self.total_time / self.runs * 1000.0 if self.runs else 0.0,
+            'max_ms': self.max_time * 1000.0,
+            'last_ms': self.last_time * 1000.0,
+        }
+
+
+class TimerWheel:
+    """
+    Hashed timer wheel keyed by job name.
+
+    Scheduling a name that is already scheduled replaces the old job, so
+    re-arming a one-shot timeout is a single call. Periodic deadlines
+    advance from the previous deadline (no drift); missed ones are
+    skipped rather than run back to back.
+    """
+
+    def __init__(
+        self,
+        resolution: float = 0.01,
+        slots: int = 512,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        """
+        Initialize wheel.
+
+        Args:
+            resolution: Tick length in seconds (jobs never fire early,
+                and at most one tick late once run_due() is called)
+            slots: Slots per revolution (rounded up to a power of two)
+            clock: Monotonic clock shared with the owning loop
+        """
+        size = 1
+        while size < slots:
+            size <<= 1
+
+        self.resolution = resolution
+        self.clock = clock
+        self._mask = size - 1
+        self._slots: List[List[TimerJob]] = [[] for _ in range(size)]
+        self._jobs: Dict[str, TimerJob] = {}
+
+        self._current_tick = self._tick_of(clock())   # Last tick processed
+        self._next_tick: Optional[int] = None          # Earliest expiry (None = recompute)
+
+    def _tick_of(self, t: float) -> int:
+        return int(t / self.resolution)
+
+    # --- Scheduling ---
+
+    def schedule(
+        self,
+        name: str,
+        delay: float,
+        callback: Callable[[], Any],
+        interval: Optional[float] = None
+    ) -> TimerJob:
+        """
+        Schedule ``callback`` to run after ``delay`` seconds.
+
+        Args:
+            name: Unique job name (replaces a job with the same name)
+            delay: Seconds until the first run
+            callback: Function without arguments
+            interval: Re-run every ``interval`` seconds (None = one-shot)
+
+        Returns:
+            The scheduled TimerJob
+        """
+        self.cancel(name)
+        job = TimerJob(name, callback, interval)
+        self._jobs[name] = job
+        self._insert(job, self.clock() + max(delay, 0.0))
+        return job
+
+    def schedule_periodic(
+        self,
+        name: str,
+        interval: float,
+        callback: Callable[[], Any],
+        first_delay: float = 0.0
+    ) -> TimerJob:
+        """Run ``callback`` after ``first_delay`` and then every ``interval`` seconds."""
+        return self.schedule(name, first_delay, callback, interval)
+
+    def cancel(self, name: str) -> bool:
+        """
+        Cancel a job (no-op if it is not scheduled).
+
+        Returns:
+            True if a job was cancelled
+        """
+        job = self._jobs.pop(name, None)
+        if job is None:
+            return False
+
+        job.active = False
+        if job.expiry_tick > self._current_tick:    # Still in its slot (not running)
+            self._slots[job.expiry_tick & self._mask].remove(job)
+        if job.expiry_tick == self._next_tick:
+            self._next_tick = None
+        return True
+
+    def _insert(self, job: TimerJob, deadline: float) -> None:
+        job.deadline = deadline
+        # Round up so a job never fires before its deadline
+        expiry_tick = self._tick_of(deadline)
+        if expiry_tick * self.resolution < deadline:
+            expiry_tick += 1
+        job.expiry_tick = max(expiry_tick, self._current_tick + 1)
+        self._slots[job.expiry_tick & self._mask].append(job)
+
+        if self._next_tick is not None and job.expiry_tick < self._next_tick:
+            self._next_tick = job.expiry_tick
+
+    # --- Driving ---
+
+    def run_due(self, now: Optional[float] = None) -> int:
+        """
+        Run every job whose deadline has passed.
+
+        Args:
+            now: Current time from ``clock`` (default: read it)
+
+        Returns:
+            Number of jobs run
+        """
+        if now is None:
+            now = self.clock()
+        target = self._tick_of(now)
+        next_tick = self.next_tick()
+
+        # Nothing due: skip the slots in between without visiting them
+        if next_tick is None or target < next_tick:
+            if target > self._current_tick:
+                self._current_tick = target
+            return 0
+
+        start = max(self._current_tick + 1, next_tick)
+        due: List[TimerJob] = []
+        for tick in range(start, min(target, start + self._mask) + 1):
+            slot = self._slots[tick & self._mask]
+            if not slot:
+                continue
+            keep = [job for job in slot if job.expiry_tick > target]
+            if len(keep) != len(slot):
+                due.extend(job for job in slot if job.expiry_tick <= target)
+                self._slots[tick & self._mask] = keep
+
+        self._current_tick = target
+        self._next_tick = None
+
+        due.sort(key=lambda job: job.deadline)
+        for job in due:
+            if not job.active:
+                continue    # Cancelled by a job that ran before it
+            self._run(job)
+            if not job.active:
+                continue    # Cancelled (or replaced) by itself
+
+            if job.interval is None:
+                job.active = False
+                del self._jobs[job.name]
+            else:
+                deadline = job.deadline + job.interval
+                if deadline <= now:
+                    deadline = now + job.interval
+                self._insert(job, deadline)
+
+        return len(due)
+
+    def _run(self, job: TimerJob) -> None:
+        start = time.perf_counter()
+        try:
+            job.callback()
+        except Exception:
+            job.errors += 1
+            logger.exception("❌ TIMER: Job '%s' failed", job.name,
+                             extra={'rate_key': f'timer.{job.name}',
+                                    'fields': {'job': job.name, 'errors': job.errors}})
+        elapsed = time.perf_counter() - start
+
+        job.runs += 1
+        job.total_time += elapsed
+        job.last_time = elapsed
+        if elapsed > job.max_time:
+            job.max_time = elapsed
+
+    def next_tick(self) -> Optional[int]:
+        """Tick of the earliest pending job (None if there are none)."""
+        if self._next_tick is None and self._jobs:
+            self._next_tick = min(job.expiry_tick for job in self._jobs.values())
+        return self._next_tick
+
+    def next_deadline(self) -> Optional[float]:
+        """
+        Time at which run_due() next has work (on ``clock``).
+
+        Returns:
+            Deadline in seconds, or None if nothing is scheduled
+        """
+        next_tick = self.next_tick()
+        return None if next_tick is None else next_tick * self.resolution
+
+    def time_until_next(self, default: float) -> float:
+        """
+        Seconds the owning loop may sleep before calling run_due() again.
+
+        Args:
+            default: Returned when nothing is scheduled
+
+        Returns:
+            Non-negative delay in seconds
+        """
+        deadline = self.next_deadline()
+        if deadline is None:
+            return default
+        return max(deadline - self.clock(), 0.0)
+
+    # --- Monitoring ---
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._jobs
+
+    def __len__(self) -> int:
+        return len(self._jobs)
+
+    def get_job(self, name: str) -> Optional[TimerJob]:
+        return self._jobs.get(name)
+
+    def get_stats(self) -> Dict[str, Dict[str, Union[int, float, None]]]:
+        """
+        Get per-job runtime statistics.
+
+        Returns:
+            Dictionary of job name -> runs, errors, avg/max/last ms
+        """
+        return {name: job.get_stats() for name, job in self._jobs.items()}
@@ -11,6 +11,9 @@ Version: 2.0.2 (Fixed imports for renamed files)
 Date: 2025-12-04
 """
 
+import argparse
+import asyncio
+import multiprocessing
 import threading
 import queue
 import signal
@@ -18,40 +21,202 @@ import sys
 import time
 from typing import Optional
 
+import config
+
 # Import from core/ modules (after files are renamed)
-from core.ingestion import create_ingestion_worker_threaded
+from core.mailbox import ConflatingMailbox
+from core.queues import BoundedQueue, SYMBOL_KEY
+from core.spsc_ring import SpscRing
+from core.tick_store import TickStore
+from core.ingestion import create_ingestion_worker_threaded, create_ingestion_worker_process
+from core.journal import TickJournal
+from core.latency import create_latency_recorder
+from core.log import setup_logging, shutdown_logging
+from core.sockets import (LINK_PULL, LINK_PUSH, POLICY_PUB, RESULT_PULL, TICK_SUB,
+                          SocketOptions, close_sockets, configure_sockets, load_curve_keys)
+from core.links import StageLink, create_stage_link
+from core.tick_codec import unpack_tick
+from core.shm_ring import SharedTickRing, SharedRingMailbox
 from core.strategy import create_strategy_engine_threaded
 from core.execution_listener import create_execution_listener_threaded
+from core.reactor import create_brain_reactor
+from core.async_brain import create_async_brain
+
+# Runtime modes (selected with --mode or config.BRAIN_MODE)
+MODES = ("threaded", "reactor", "asyncio", "process")
+
+
+def logging_config(log_file: Optional[str] = None) -> dict:
+    """
+    setup_logging() arguments from config.py.
+    
+    Args:
+        log_file: JSON lines file (None = console only)
+    """
+    return {
+        'level': config.LOG_LEVEL,
+        'log_file': log_file,
+        'console_format': config.LOG_FORMAT,
+        'rate_limit_seconds': config.LOG_RATE_LIMIT_SECONDS,
+        'max_file_bytes': config.LOG_FILE_MAX_MB * 1024 * 1024,
+        'backup_count': config.LOG_FILE_BACKUP_COUNT,
+    }
+
+
+def socket_options() -> dict:
+    """Per-role ZMQ socket options from config.py (see core/sockets.py)."""
+    common = dict(
+        tcp_keepalive=config.ZMQ_TCP_KEEPALIVE,
+        tcp_keepalive_idle=config.ZMQ_TCP_KEEPALIVE_IDLE_S,
+        tcp_keepalive_intvl=config.ZMQ_TCP_KEEPALIVE_INTVL_S,
+        reconnect_ivl=config.ZMQ_RECONNECT_IVL_MS,
+        reconnect_ivl_max=config.ZMQ_RECONNECT_IVL_MAX_MS,
+    )
+    return {
+        TICK_SUB: SocketOptions(
+            rcvhwm=config.ZMQ_SUB_HWM,
+            rcvbuf=config.ZMQ_SUB_RCVBUF,
+            rcvtimeo=config.ZMQ_RCVTIMEO_MS,
+            linger=0,                       # Nothing to flush on a SUB socket
+            conflate=config.ZMQ_SUB_CONFLATE,
+            **common),
+        POLICY_PUB: SocketOptions(
+            sndhwm=config.ZMQ_PUB_HWM,
+            sndbuf=config.ZMQ_PUB_SNDBUF,
+            sndtimeo=config.ZMQ_SNDTIMEO_MS,
+            linger=config.ZMQ_LINGER_MS,
+            **common),
+        RESULT_PULL: SocketOptions(
+            rcvtimeo=config.ZMQ_RCVTIMEO_MS,
+            linger=0,
+            **common),
+        LINK_PUSH: SocketOptions(sndhwm=config.STAGE_LINK_HWM, linger=config.ZMQ_LINGER_MS,
+                                 **common),
+        LINK_PULL: SocketOptions(rcvhwm=config.STAGE_LINK_HWM, linger=0, **common),
+    }
+
+
+def create_tick_journal(mode: str) -> Optional[TickJournal]:
+    """
+    Create and start the raw tick journal if config.JOURNAL_ENABLED.
+    
+    Args:
+        mode: Runtime mode (the journal is not available in process mode)
+        
+    Returns:
+        Running TickJournal, or None
+    """
+    if not config.JOURNAL_ENABLED:
+        return None
+    
+    if mode == "process":
+        print("⚠️ Tick journal is not supported in process mode, not recording")
+        return None
+    
+    journal = TickJournal(
+        directory=config.JOURNAL_DIR,
+        prefix=config.JOURNAL_PREFIX,
+        max_segment_bytes=config.JOURNAL_MAX_SEGMENT_MB * 1024 * 1024,
+        block_frames=config.JOURNAL_BLOCK_FRAMES,
+        flush_interval=config.JOURNAL_FLUSH_INTERVAL
+    )
+    journal.start()
+    print(f"💾 Recording raw ticks to {config.JOURNAL_DIR}/")
+    return journal
 
 
 class FlashEABrain:
     """
     Main orchestrator for FlashEA Brain using Threading (Windows-Safe).
     
-    Manages 3 worker threads:
+    Threaded mode manages 3 worker threads:
     1. Ingestion Worker - Receives tick data from Feeder
     2. Strategy Engine - Generates trading signals
     3. Execution Listener - Receives trade results (Feedback Loop)
+    
+    Reactor mode runs all three stages in one thread on a zmq.Poller.
+    Process mode runs the Ingestion Worker in its own process, feeding
+    the Strategy Engine through a shared-memory tick ring.
+    Asyncio mode is served by run_async_brain() instead of this class.
     """
     
-    def __init__(self):
-        """Initialize the Brain with threading components."""
-        # Threading events for shutdown
-        self.shutdown_event = threading.Event()
+    def __init__(self, mode: str = "threaded"):
+        """
+        Initialize the Brain with threading components.
+        
+        Args:
+            mode: "threaded" (3 worker threads), "reactor" (single thread)
+                or "process" (ingestion process + 2 threads)
+        """
+        if mode not in ("threaded", "reactor", "process"):
+            raise ValueError(f"Unknown mode '{mode}' (expected threaded, reactor or process)")
+        self.mode = mode
+        
+        # Shutdown event (process mode shares it with the ingestion process)
+        if mode == "process":
+            self.shutdown_event = multiprocessing.Event()
+        else:
+            self.shutdown_event = threading.Event()
         
-        # Thread-safe queues (no maxsize limit to prevent deadlock)
-        self.ingestion_queue = queue.Queue()      # Unlimited
-        self.signal_queue = queue.Queue()         # Unlimited
-        self.feedback_queue = queue.Queue()       # Unlimited
+        # Per-symbol tick history (written by ingestion, read by analyzers)
+        self.tick_store = TickStore(capacity=config.TICK_RING_CAPACITY)
+        
+        # Pipeline latency histograms (None = tracking disabled)
+        self.latency = create_latency_recorder(
+            config.LATENCY_TRACKING and config.ENABLE_PERFORMANCE_LOGGING)
+        self._next_latency_report = time.monotonic() + config.PERFORMANCE_LOG_INTERVAL
+        
+        # Ingestion handoff: shared-memory ring, ZMQ link, latest tick per
+        # symbol, or every tick (SPSC ring or bounded queue)
+        self.shm_ring = None
+        zmq_links = config.STAGE_TRANSPORT == "zmq"
+        if mode == "process":
+            self.shm_ring = SharedTickRing(capacity=config.SHM_RING_CAPACITY)
+            self.ingestion_queue = SharedRingMailbox(self.shm_ring, self.tick_store)
+        elif zmq_links:
+            self.ingestion_queue = create_stage_link(
+                config.INGESTION_LINK_ADDRESS, name='Ingestion', decoder=unpack_tick,
+                stamped=self.latency is not None)
+        elif config.INGESTION_QUEUE_MODE == "mailbox":
+            self.ingestion_queue = ConflatingMailbox(name='Ingestion')
+        elif config.INGESTION_QUEUE_MODE == "spsc":
+            self.ingestion_queue = SpscRing(
+                config.INGESTION_QUEUE_SIZE, name='Ingestion', wakeup=config.SPSC_WAKEUP
+            )
+        else:
+            self.ingestion_queue = BoundedQueue(
+                config.INGESTION_QUEUE_SIZE, config.INGESTION_QUEUE_POLICY, name='Ingestion',
+                key=SYMBOL_KEY
+            )
+        
+        # Thread-safe bounded queues (policy decides what happens when full)
+        self.signal_queue = BoundedQueue(
+            config.SIGNAL_QUEUE_SIZE, config.SIGNAL_QUEUE_POLICY, name='Signal'
+        )
+        if zmq_links:
+            self.feedback_queue = create_stage_link(config.FEEDBACK_LINK_ADDRESS, name='Feedback')
+        else:
+            self.feedback_queue = BoundedQueue(
+                config.FEEDBACK_QUEUE_SIZE, config.FEEDBACK_QUEUE_POLICY, name='Feedback'
+            )
+        self._last_queue_drops = {}
         
         # Worker threads
+        self.journal = None
         self.threads = []
+        self.ingestion_worker = None
+        self._last_seq_stats = {}
         
         print("=" * 80)
         print("FlashEASuite V2 - Program B (The Brain) 🧠")
         print("High-Frequency Hybrid Trading System")
         print("WITH FEEDBACK LOOP 🔄")
-        print("MODE: Threading (Windows Safe Mode)")
+        if mode == "reactor":
+            print("MODE: Reactor (single thread, zmq.Poller)")
+        elif mode == "process":
+            print("MODE: Process (ingestion process + shared-memory tick ring)")
+        else:
+            print("MODE: Threading (Windows Safe Mode)")
         print("VERSION: 2.0.2 (Core Module Imports)")
         print("=" * 80)
     
@@ -68,28 +233,100 @@ class FlashEABrain:
         """
         Start all worker threads.
         
+        Returns:
+            True if successful, False otherwise
+        """
+        print("\n🚀 Starting FlashEA Brain with Feedback Loop...")
+        print("Configuration:")
+        print("  - ZMQ Feeder (Tick Data):    tcp://127.0.0.1:7777")
+        print("  - ZMQ Execution (Policy):    tcp://127.0.0.1:7778")
+        print("  - ZMQ Feedback (Results):    tcp://127.0.0.1:7779")
+        
+        self.journal = create_tick_journal(self.mode)
+        
+        if self.mode == "reactor":
+            return self._start_reactor()
+        return self._start_threaded_workers()
+    
+    def _start_reactor(self) -> bool:
+        """
+        Start the single-threaded reactor (ingestion + strategy + feedback).
+        
         Returns:
             True if successful, False otherwise
         """
         try:
-            print("\n🚀 Starting FlashEA Brain with Feedback Loop...")
-            print("Configuration:")
-            print("  - ZMQ Feeder (Tick Data):    tcp://127.0.0.1:7777")
-            print("  - ZMQ Execution (Policy):    tcp://127.0.0.1:7778")
-            print("  - ZMQ Feedback (Results):    tcp://127.0.0.1:7779")
-            print("\nQueue Implementation: Thread-safe queue.Queue (unlimited)")
+            reactor_thread = create_brain_reactor(
+                shutdown_event=self.shutdown_event,
+                zmq_sub_address="tcp://127.0.0.1:7777",
+                zmq_pub_address="tcp://127.0.0.1:7778",
+                zmq_pull_address="tcp://127.0.0.1:7779",
+                tick_store=self.tick_store,
+                journal=self.journal,
+                latency=self.latency,
+                grid_symbols=config.SUPPORTED_SYMBOLS,
+                policy_encoding=config.POLICY_ENCODING
+            )
+            reactor_thread.daemon = True
+            reactor_thread.start()
+            self.ingestion_worker = reactor_thread
+            self.threads.append(('BrainReactor', reactor_thread))
+            print(f"\n✅ Brain Reactor started (Thread: {reactor_thread.name})")
+            print("=" * 80)
+            print("🎯 System is running in REACTOR mode (no inter-thread queues)")
+            print("=" * 80)
+            print("Press Ctrl+C to stop.")
+            print()
+            
+            return True
+            
+        except Exception as e:
+            print(f"❌ Error starting reactor: {e}")
+            import traceback
+            traceback.print_exc()
+            return False
+    
+    def _start_threaded_workers(self) -> bool:
+        """
+        Start the three pipeline worker threads.
+        
+        Returns:
+            True if successful, False otherwise
+        """
+        try:
+            print("\nQueue Implementation: Bounded queues with backpressure policies")
+            for q in (self.ingestion_queue, self.signal_queue, self.feedback_queue):
+                limit = q.maxsize or "1 per symbol"
+                print(f"  - {q.name + ':':<11} max {limit}, policy={q.policy}")
             print("\nStarting worker threads...")
             
             # 1. Ingestion Worker (Receives tick data)
-            ingestion_thread = create_ingestion_worker_threaded(
-                ingestion_queue=self.ingestion_queue,
-                shutdown_event=self.shutdown_event,
-                zmq_sub_address="tcp://127.0.0.1:7777"
-            )
-            ingestion_thread.daemon = True  # Daemon thread
+            if self.mode == "process":
+                ingestion_thread = create_ingestion_worker_process(
+                    ring=self.shm_ring,
+                    shutdown_event=self.shutdown_event,
+                    zmq_sub_address="tcp://127.0.0.1:7777",
+                    stamp_recv=self.latency is not None,
+                    log_config=logging_config()
+                )
+            else:
+                ingestion_thread = create_ingestion_worker_threaded(
+                    ingestion_queue=self.ingestion_queue,
+                    shutdown_event=self.shutdown_event,
+                    zmq_sub_address="tcp://127.0.0.1:7777",
+                    tick_store=self.tick_store,
+                    journal=self.journal,
+                    latency=self.latency
+                )
+            ingestion_thread.daemon = True  # Daemon thread / process
             ingestion_thread.start()
+            self.ingestion_worker = ingestion_thread
             self.threads.append(('IngestionWorker', ingestion_thread))
-            print(f"✅ Ingestion Worker started (Thread: {ingestion_thread.name})")
+            if self.mode == "process":
+                print(f"✅ Ingestion Worker started (Process: {ingestion_thread.name}, "
+                      f"PID {ingestion_thread.pid})")
+            else:
+                print(f"✅ Ingestion Worker started (Thread: {ingestion_thread.name})")
             
             # Small delay to ensure socket binding
             time.sleep(0.5)
@@ -100,7 +337,11 @@ class FlashEABrain:
                 signal_queue=self.signal_queue,
                 feedback_queue=self.feedback_queue,
                 shutdown_event=self.shutdown_event,
-                zmq_pub_address="tcp://127.0.0.1:7778"
+                zmq_pub_address="tcp://127.0.0.1:7778",
+                tick_store=self.tick_store,
+                latency=self.latency,
+                grid_symbols=config.SUPPORTED_SYMBOLS,
+                policy_encoding=config.POLICY_ENCODING
             )
             strategy_thread.daemon = True
             strategy_thread.start()
@@ -150,14 +391,46 @@ class FlashEABrain:
                     print(f"\n⚠️ WARNING: Thread {name} is not alive!")
                     # Don't restart - just notify
             
-            # Check queue sizes (for monitoring only)
-            ing_size = self.ingestion_queue.qsize()
-            sig_size = self.signal_queue.qsize()
-            fb_size = self.feedback_queue.qsize()
+            # Check queue backpressure (sizes, drops, high-water marks)
+            self._report_queue_stats()
+            
+            # Check Feeder SEQ_ID continuity (HWM drops show up as gaps)
+            self._report_sequence_loss()
+            
+            # Per-stage latency percentiles every PERFORMANCE_LOG_INTERVAL
+            if self.latency is not None and time.monotonic() >= self._next_latency_report:
+                self.latency.print_report()
+                self._next_latency_report = time.monotonic() + config.PERFORMANCE_LOG_INTERVAL
+    
+    def _report_queue_stats(self) -> None:
+        """Print queue statistics when a queue is backing up or dropping."""
+        for q in (self.ingestion_queue, self.signal_queue, self.feedback_queue):
+            stats = q.get_stats()
+            new_drops = stats['drops'] - self._last_queue_drops.get(q.name, 0)
+            self._last_queue_drops[q.name] = stats['drops']
+            
+            if stats['size'] > 100 or new_drops > 0:
+                print(f"⚠️ Queue {stats['name']}: size={stats['size']}/{stats['maxsize']} "
+                      f"high-water={stats['high_water']} drops={stats['drops']} "
+                      f"(+{new_drops}) policy={stats['policy']}")
+    
+    def _report_sequence_loss(self) -> None:
+        """Print per-Feeder tick loss counters when they change."""
+        if self.ingestion_worker is None:
+            return
+        
+        feeders = self.ingestion_worker.get_sequence_stats()['feeders']
+        for feeder, stats in feeders.items():
+            counters = (stats['lost'], stats['duplicates'],
+                        stats['reorders'], stats['resets'])
+            if counters == self._last_seq_stats.get(feeder, (0, 0, 0, 0)):
+                continue
             
-            if ing_size > 100 or sig_size > 100 or fb_size > 100:
-                print(f"⚠️ Queue sizes: Ingestion={ing_size}, "
-                      f"Signal={sig_size}, Feedback={fb_size}")
+            self._last_seq_stats[feeder] = counters
+            print(f"⚠️ Tick loss [{feeder}]: Lost={stats['lost']} "
+                  f"({stats['loss_rate'] * 100:.3f}%) in {stats['gaps']} gaps, "
+                  f"Duplicates={stats['duplicates']}, "
+                  f"Reordered={stats['reorders']}, Resets={stats['resets']}")
     
     def _cleanup_resources(self) -> None:
         """Clean up resources before shutdown."""
@@ -175,13 +448,30 @@ class FlashEABrain:
             else:
                 print(f"✅ Thread {name} stopped")
         
-        # Clear queues
+        # Clear queues (and close ZMQ stage links)
         for q in [self.ingestion_queue, self.signal_queue, self.feedback_queue]:
             while not q.empty():
                 try:
                     q.get_nowait()
                 except queue.Empty:
                     break
+            if isinstance(q, (StageLink, SpscRing)):
+                q.close()
+        
+        # Write out pending journal frames (workers have stopped)
+        if self.journal is not None:
+            self.journal.close()
+            stats = self.journal.get_stats()
+            print(f"💾 Journal: {stats['frames_written']} frames in {stats['segments']} segment(s)")
+        
+        # Free the shared-memory tick ring (process mode)
+        if self.shm_ring is not None:
+            self.shm_ring.close()
+        
+        # Terminate the shared ZMQ context (blocks while a socket is open,
+        # so only once every worker has closed its sockets)
+        if not any(thread.is_alive() for _, thread in self.threads):
+            close_sockets()
         
         print("✅ Cleanup complete")
     
@@ -213,10 +503,104 @@ class FlashEABrain:
             print("\n👋 FlashEA Brain stopped")
 
 
+async def _serve_async_brain(journal: Optional[TickJournal] = None) -> None:
+    """Run the asyncio Brain until SIGINT/SIGTERM cancels it."""
+    brain = create_async_brain(
+        zmq_sub_addresses="tcp://127.0.0.1:7777",
+        zmq_pub_address="tcp://127.0.0.1:7778",
+        zmq_pull_addresses="tcp://127.0.0.1:7779",
+        tick_store=TickStore(capacity=config.TICK_RING_CAPACITY),
+        journal=journal,
+        latency=create_latency_recorder(
+            config.LATENCY_TRACKING and config.ENABLE_PERFORMANCE_LOGGING),
+        latency_report_interval=config.PERFORMANCE_LOG_INTERVAL,
+        grid_symbols=config.SUPPORTED_SYMBOLS,
+        policy_encoding=config.POLICY_ENCODING
+    )
+    
+    # Signals cancel the main task; every coroutine unwinds from there
+    main_task = asyncio.current_task()
+    loop = asyncio.get_running_loop()
+    for signum in (signal.SIGINT, signal.SIGTERM):
+        try:
+            loop.add_signal_handler(signum, main_task.cancel)
+        except NotImplementedError:
+            pass  # Windows: asyncio.run() cancels the main task on Ctrl+C
+    
+    try:
+        await brain.run()
+    except asyncio.CancelledError:
+        print("\n\n⚠️ Shutdown signal received. Stopping gracefully...")
+
+
+def run_async_brain() -> None:
+    """Asyncio entry point: the whole Brain as coroutines on one event loop."""
+    print("=" * 80)
+    print("FlashEASuite V2 - Program B (The Brain) 🧠")
+    print("High-Frequency Hybrid Trading System")
+    print("WITH FEEDBACK LOOP 🔄")
+    print("MODE: asyncio (zmq.asyncio, single event loop)")
+    print("VERSION: 2.0.2 (Core Module Imports)")
+    print("=" * 80)
+    print("Press Ctrl+C to stop.")
+    print()
+    
+    # zmq.asyncio needs a selector loop (the Windows default is Proactor)
+    if sys.platform == "win32":
+        asyncio.set_event_loop_policy(asyncio.WindowsSelectorEventLoopPolicy())
+    
+    journal = create_tick_journal("asyncio")
+    
+    try:
+        asyncio.run(_serve_async_brain(journal))
+    except KeyboardInterrupt:
+        print("\n\n⚠️ Keyboard interrupt received")
+    except Exception as e:
+        print(f"\n❌ Unexpected error: {e}")
+        import traceback
+        traceback.print_exc()
+    finally:
+        if journal is not None:
+            journal.close()
+        close_sockets()
+    
+    print("\n👋 FlashEA Brain stopped")
+
+
 def main():
     """Main entry point."""
-    brain = FlashEABrain()
-    brain.run()
+    parser = argparse.ArgumentParser(description="FlashEASuite V2 - The Brain")
+    parser.add_argument(
+        "--mode",
+        choices=MODES,
+        default=config.BRAIN_MODE,
+        help=f"runtime mode (default: {config.BRAIN_MODE})"
+    )
+    args = parser.parse_args()
+    
+    # Hot-path log records are written by a background listener thread
+    setup_logging(**logging_config(config.LOG_FILE))
+    
+    # One ZMQ context for every worker, sockets configured per role
+    curve = None
+    if config.CURVE_ENABLED:
+        try:
+            curve = load_curve_keys(config.CURVE_KEYS_DIR)
+        except (OSError, ValueError, RuntimeError) as e:
+            print(f"❌ CurveZMQ enabled but keys could not be loaded: {e}")
+            shutdown_logging()
+            sys.exit(1)
+        print(f"🔒 CurveZMQ enabled (keys: {config.CURVE_KEYS_DIR})")
+    configure_sockets(config.ZMQ_IO_THREADS, socket_options(), curve)
+    
+    try:
+        if args.mode == "asyncio":
+            run_async_brain()
+        else:
+            brain = FlashEABrain(mode=args.mode)
+            brain.run()
+    finally:
+        shutdown_logging()
 
 
 if __name__ == "__main__":
@@ -1,12 +1,15 @@
-import time
 import math
-from collections import deque
 import numpy as np
 
+from core.tick_store import TickStore
+
 class CurrencyStrengthMeter:
-    def __init__(self):
+    def __init__(self, tick_store=None):
         self.currencies = ['USD', 'EUR', 'JPY', 'GBP', 'AUD', 'CAD', 'CHF', 'NZD']
-        self.history = {} 
+        
+        # ประวัติราคาอ่านจาก TickStore (ring buffer ต่อ symbol, ไม่ copy)
+        # ถ้าไม่ได้ส่ง store มา จะสร้างของตัวเองแล้วเขียนผ่าน update_tick()
+        self.tick_store = tick_store if tick_store is not None else TickStore()
         
         # เก็บ Score แยก 2 ถัง: Fast (ซิ่ง) และ Slow (เทรนด์)
         self.scores_fast = {c: 5.0 for c in self.currencies}
@@ -20,15 +23,9 @@ class CurrencyStrengthMeter:
         self.SLOPE_SLOW = 2.0     # นิ่งๆ (Trend)
 
     def update_tick(self, symbol, price, timestamp_ms):
-        current_time = timestamp_ms / 1000.0
-        if symbol not in self.history:
-            self.history[symbol] = deque(maxlen=5000) # เพิ่ม Buffer เผื่อเก็บยาวๆ
-            
-        self.history[symbol].append((current_time, price))
-        
-        # Clean up: ลบข้อมูลที่เก่าเกิน Slow Window ออกเพื่อประหยัด Ram
-        while self.history[symbol][0][0] < current_time - self.SLOW_WINDOW - 10:
-             self.history[symbol].popleft()
+        # ใช้เฉพาะตอนไม่มี Ingestion เขียน TickStore ให้ (standalone)
+        # Ring มีขนาดคงที่ จึงไม่ต้อง Clean up ข้อมูลเก่าเอง
+        self.tick_store.append(symbol, timestamp_ms, price, price)
 
     def calculate_strengths(self):
         """ คำนวณทีเดียวได้ 2 แบบเลย """
@@ -37,21 +34,20 @@ class CurrencyStrengthMeter:
 
     def _calc_logic(self, window_sec, slope, score_dict):
         raw_forces = {c: 0.0 for c in self.currencies}
-        current_time = time.time()
         
-        for symbol, history_deque in self.history.items():
-            if len(history_deque) < 2: continue
+        for symbol in self.tick_store.symbols():
+            ring = self.tick_store.get(symbol)
+            if len(ring) < 2: continue
+            
+            # Zero-copy views ของ ring (เวลาเรียงจากเก่าไปใหม่)
+            times, prices = ring.window()[:2]
             
-            current_price = history_deque[-1][1]
-            latest_ts = history_deque[-1][0]
-            target_ts = latest_ts - window_sec
+            current_price = prices[-1]
+            target_ts = times[-1] - int(window_sec * 1000)
             
-            # Find past price
-            past_price = current_price
-            for i in range(len(history_deque)-1, -1, -1):
-                if history_deque[i][0] <= target_ts:
-                    past_price = history_deque[i][1]
-                    break
+            # Find past price (binary search แทนการวนย้อนหลัง)
+            idx = int(np.searchsorted(times, target_ts, side='right')) - 1
+            past_price = prices[idx] if idx >= 0 else current_price
             
             if past_price == 0: continue
             
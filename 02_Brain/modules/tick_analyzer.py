@@ -1,46 +1,116 @@
 """
 FlashEASuite V2 - Module
 Tick & Spread Analyzer (Ratio Logic + Adaptive Spread) 🧠
+
+on_tick() ทำงาน O(1): Tick ถูกนับลงถังเวลา (bucket) แทนการเก็บทีละ timestamp
+และค่าเฉลี่ย Spread มาจากผลรวมสะสม (running sum) แทนการ sum() ทั้งหน้าต่าง
+หน่วยความจำจึงคงที่ (จำนวนถัง) ไม่ว่า Tick จะเข้ามาเร็วแค่ไหน
+
+Tick Density ทุกหน้าต่าง (1s, 5s, 1m, 15m, 1h) ใช้วงแหวนถัง 100ms วงเดียว
+ที่เก็บจำนวน Tick สะสม (prefix sum): จำนวน Tick ในหน้าต่างใดก็ได้คือผลต่างของ 2 ถัง
+เพิ่มหน้าต่างใหม่จึงไม่ต้องเก็บอะไรเพิ่ม (ถ้าไม่ยาวกว่าหน้าต่างที่ยาวที่สุด)
+
+Percentile ของ Spread (p50/p90/p99, หน้าต่าง 15m) มาจาก P² sketch (core/quantile_sketch.py)
+ใช้หน่วยความจำคงที่ และไม่เพี้ยนตาม Spread ที่กระโดดช่วงข่าวเหมือนค่าเฉลี่ย
+
+เวลาของ Tick มาจาก time_msc ของ Feeder (เวลาตลาด) ถ้าส่งมา, ไม่งั้นใช้ time.time()
+on_ticks() คำนวณทั้ง array ด้วย NumPy (warm-up / research) ได้ผลเท่ากับเรียก on_tick() ทีละ Tick
 """
+from array import array
 from collections import deque
+import math
 import time
 import numpy as np
 
+from core.quantile_sketch import RollingQuantiles
+
 class TickFlowAnalyzer:
-    def __init__(self, window_short_sec=1.0, window_long_sec=900.0): # 900s = 15 min
+    BUCKET_SEC = 0.1                            # ถัง Tick ละ 100ms (ใช้ร่วมกันทุกหน้าต่าง)
+    SPREAD_BUCKET_SEC = 1.0                     # ถัง Spread ละ 1 วินาที (15m -> 900 ถัง)
+    WINDOWS = (1.0, 5.0, 60.0, 900.0, 3600.0)   # หน้าต่างของ get_tick_rates() (1s, 5s, 1m, 15m, 1h)
+    SPREAD_QUANTILES = (0.5, 0.9, 0.99)         # Percentile ของ Spread (p50, p90, p99)
+
+    def __init__(self, window_short_sec=1.0, window_long_sec=900.0, windows=WINDOWS,
+                 spread_quantiles=SPREAD_QUANTILES): # 900s = 15 min
         self.window_short = window_short_sec
         self.window_long = window_long_sec
+        self.windows = tuple(windows)
+        self.bucket_width = self.BUCKET_SEC
+        self.long_width = self.SPREAD_BUCKET_SEC
+        self.long_buckets = max(1, int(round(window_long_sec / self.long_width)))
         
-        # 1. ถังเก็บ Timestamp (สำหรับ Tick Density)
-        self.ticks_short = deque()
-        self.ticks_long = deque()
+        # 1. วงแหวนถัง Tick (สำหรับ Tick Density ทุกหน้าต่าง)
+        # tick_cum[bucket_id % ring_size] = จำนวน tick สะสมตั้งแต่ Tick แรกจนถึงถังนั้น
+        # (Mailbox อาจรวมหลาย tick เป็นครั้งเดียว จึงบวกทีละ count)
+        self.short_span = self._span(window_short_sec)
+        self.long_span = self._span(window_long_sec)
+        self.ring_size = max(self._span(w) for w in self.windows + (window_short_sec, window_long_sec)) + 2
+        self.tick_cum = array('q', bytes(8 * self.ring_size))
+        self.tick_total = 0
+        self._last_bucket = None
+        self._first_time = None     # เวลา Tick แรก (เริ่มใหม่หลังไม่มี Tick นานเกินวงแหวน เช่น ตลาดปิด)
         
-        # 2. ถังเก็บ Spread (สำหรับ Adaptive Spread)
-        # เก็บเป็นคู่ (timestamp, spread_value)
-        self.spread_history = deque()
+        # 2. ถัง Spread ของหน้าต่างยาว (สำหรับ Adaptive Spread)
+        # spread_buckets: [bucket_id, จำนวน spread, ผลรวม spread]
+        # บวก/ลบแบบชดเชยความคลาดเคลื่อน (Kahan-Babuska) และรวมใหม่จากถังทุก ๆ 1 หน้าต่าง
+        self.spread_buckets = deque()
+        self.spread_count = 0
+        self.spread_sum = 0.0
+        self._spread_comp = 0.0
+        self._evictions = 0
+        self._last_time = float('-inf')   # เวลาไม่ถอยหลัง (Tick ที่มาช้ากว่าใช้เวลาล่าสุด)
+        
+        # 3. Percentile ของ Spread ในหน้าต่างยาว (ประมาณจาก 1/2 ถึง 1 หน้าต่างล่าสุด)
+        self.spread_quantiles = RollingQuantiles(window_long_sec, spread_quantiles)
         
         # ค่าสถิติล่าสุด
         self.current_tick_ratio = 0.0
         self.current_spread_avg = 0.0
         self.current_spread_ratio = 0.0
 
-    def on_tick(self, bid, ask):
-        """เรียกทุกครั้งที่มี Tick ใหม่เข้ามา (พร้อมราคา Bid/Ask)"""
-        now = time.time()
+    def _span(self, window_sec):
+        # จำนวนถัง 100ms ของหน้าต่าง
+        return max(1, int(round(window_sec / self.bucket_width)))
+
+    def on_tick(self, bid, ask, count=1, now=None):
+        """เรียกทุกครั้งที่มี Tick ใหม่เข้ามา (พร้อมราคา Bid/Ask)
+        
+        count = จำนวน tick ที่ถูกรวม (coalesced) มาเป็น tick นี้ ให้ Tick Density ยังนับครบทุก tick
+        now = เวลาของ Tick (วินาที, เช่น time_msc / 1000) ถ้าไม่ส่งมาใช้ time.time()
+        """
+        if now is None:
+            now = time.time()
+        if now < self._last_time:
+            now = self._last_time
+        self._last_time = now
         current_spread = (ask - bid)
         
-        # --- PART A: Tick Density ---
-        self.ticks_short.append(now)
-        self.ticks_long.append(now)
+        # --- PART A: Tick Density (วงแหวนถัง 100ms) ---
+        position = now / self.bucket_width
+        tick_id = int(position)
+        if tick_id != self._last_bucket:
+            self._advance(tick_id, now)
+        self.tick_cum[tick_id % self.ring_size] += count
+        self.tick_total += count
         
-        # --- PART B: Spread Analysis ---
-        self.spread_history.append((now, current_spread))
+        # --- PART B: Spread Analysis (ถัง 1 วินาที) ---
+        long_id = int(now / self.long_width)
+        spread_buckets = self.spread_buckets
+        if spread_buckets and spread_buckets[-1][0] == long_id:
+            bucket = spread_buckets[-1]
+            bucket[1] += 1
+            bucket[2] += current_spread
+        else:
+            spread_buckets.append([long_id, 1, current_spread])
+        self.spread_count += 1
+        self._add_spread(current_spread)
+        self.spread_quantiles.add(current_spread, now)
         
-        # --- Pruning (ลบข้อมูลเก่า) ---
-        self._prune_old_data(now)
+        # --- Pruning (ลบถัง Spread เก่า) ---
+        self._prune_old_data(long_id)
         
         # --- Calculation ---
-        self._calculate_metrics(now, current_spread)
+        self._calculate_metrics(now, position, current_spread)
         
         return {
             "tick_ratio": self.current_tick_ratio,
@@ -48,35 +118,83 @@ class TickFlowAnalyzer:
             "avg_spread": self.current_spread_avg
         }
 
-    def _prune_old_data(self, now):
-        # ลบ Tick เก่า
-        while self.ticks_short and (now - self.ticks_short[0] > self.window_short):
-            self.ticks_short.popleft()
-        while self.ticks_long and (now - self.ticks_long[0] > self.window_long):
-            self.ticks_long.popleft()
-            
-        # ลบ Spread เก่า (ใช้ Window Long 15 นาทีเหมือนกัน)
-        while self.spread_history and (now - self.spread_history[0][0] > self.window_long):
-            self.spread_history.popleft()
+    def _advance(self, tick_id, now):
+        # ถังที่ข้ามไป (ไม่มี Tick) มีค่าสะสมเท่าเดิม
+        last = self._last_bucket
+        self._last_bucket = tick_id
+        size = self.ring_size
+        fill = array('q', [self.tick_total])
+        if last is None or tick_id - last >= size:
+            # Tick แรก หรือไม่มี Tick นานเกิน 1 รอบวง: ทุกถังในวงมีค่าเท่ากัน และเริ่มนับเวลาใหม่
+            self.tick_cum[:] = fill * size
+            self._first_time = now
+            return
+        
+        start = (last + 1) % size
+        end = start + tick_id - last
+        if end <= size:
+            self.tick_cum[start:end] = fill * (end - start)
+        else:
+            self.tick_cum[start:] = fill * (size - start)
+            self.tick_cum[:end - size] = fill * (end - size)
+
+    def _window_count(self, span, position):
+        # Tick ใน span ถังล่าสุด = ค่าสะสมถังปัจจุบัน - ค่าสะสมก่อนหน้าต่าง
+        # ถังที่คร่อมขอบหน้าต่างนับเฉพาะส่วนที่ยังอยู่ในหน้าต่าง (ประมาณเชิงเส้น)
+        tick_id = int(position)
+        tick_cum = self.tick_cum
+        size = self.ring_size
+        before = tick_cum[(tick_id - span - 1) % size]
+        edge = tick_cum[(tick_id - span) % size] - before
+        count = self.tick_total - before
+        if edge:
+            return count - edge * (position - tick_id)
+        return count
+
+    def _add_spread(self, value):
+        # Kahan-Babuska (Neumaier): เก็บเศษที่หายจากการบวก float ไว้ใน _spread_comp
+        total = self.spread_sum
+        result = total + value
+        if abs(total) >= abs(value):
+            self._spread_comp += (total - result) + value
+        else:
+            self._spread_comp += (value - result) + total
+        self.spread_sum = result
 
-    def _calculate_metrics(self, now, current_spread):
-        # 1. Tick Ratio (1s vs 15m Avg)
-        short_count = len(self.ticks_short)
+    def _prune_old_data(self, long_id):
+        # ลบถัง Spread ที่หลุดหน้าต่างยาว
+        oldest_long = long_id - self.long_buckets
+        evicted = False
+        while self.spread_buckets[0][0] <= oldest_long:
+            _, spreads, spread_sum = self.spread_buckets.popleft()
+            self.spread_count -= spreads
+            self._add_spread(-spread_sum)
+            self._evictions += 1
+            evicted = True
         
-        elapsed = min(now - self.ticks_long[0], self.window_long) if self.ticks_long else 1.0
+        # Re-normalise: รวม spread ใหม่จากถังแบบแม่นยำ ทุก ๆ 1 หน้าต่างของการลบถัง
+        if evicted and self._evictions >= self.long_buckets:
+            self.spread_sum = math.fsum(bucket[2] for bucket in self.spread_buckets)
+            self._spread_comp = 0.0
+            self._evictions = 0
+
+    def _calculate_metrics(self, now, position, current_spread):
+        # 1. Tick Ratio (อัตรา Tick 1s vs 15m, tick/วินาที)
+        # หน้าต่างที่ข้อมูลยังไม่ครบหารด้วยเวลาที่มีจริง (อย่างน้อย 1 วินาที)
+        elapsed = now - self._first_time
         if elapsed < 1.0: elapsed = 1.0
-        long_avg_per_sec = len(self.ticks_long) / elapsed
+        short_rate = self._window_count(self.short_span, position) / min(self.window_short, elapsed)
+        long_rate = self._window_count(self.long_span, position) / min(self.window_long, elapsed)
         
-        if long_avg_per_sec > 0:
-            self.current_tick_ratio = short_count / long_avg_per_sec
+        if long_rate > 0:
+            self.current_tick_ratio = short_rate / long_rate
         else:
             self.current_tick_ratio = 0.0
-            
+        
         # 2. Spread Ratio (Current vs 15m Avg)
-        if len(self.spread_history) > 0:
-            # คำนวณค่าเฉลี่ย Spread จากประวัติ
-            total_spread = sum(item[1] for item in self.spread_history)
-            self.current_spread_avg = total_spread / len(self.spread_history)
+        if self.spread_count > 0:
+            # ค่าเฉลี่ย Spread จากผลรวมสะสม (O(1))
+            self.current_spread_avg = (self.spread_sum + self._spread_comp) / self.spread_count
             
             if self.current_spread_avg > 0:
                 self.current_spread_ratio = current_spread / self.current_spread_avg
@@ -86,9 +204,150 @@ class TickFlowAnalyzer:
             self.current_spread_avg = current_spread
             self.current_spread_ratio = 1.0
 
+    def get_tick_count(self, window_sec):
+        """จำนวน Tick ใน window_sec วินาทีล่าสุด ณ เวลาของ Tick ล่าสุด
+        
+        window_sec ยาวได้ไม่เกินหน้าต่างที่ยาวที่สุดตอนสร้าง (ขนาดวงแหวน)
+        """
+        span = self._span(window_sec)
+        if span > self.ring_size - 2:
+            raise ValueError(f"Window {window_sec}s is longer than the tick ring")
+        if self._first_time is None:
+            return 0.0
+        return float(self._window_count(span, self._last_time / self.bucket_width))
+
+    def get_tick_rates(self, windows=None):
+        """อัตรา Tick (tick/วินาที) ของแต่ละหน้าต่าง ณ เวลาของ Tick ล่าสุด
+        
+        windows = หน้าต่าง (วินาที) ที่ต้องการ, default = self.windows
+        คืนค่า dict {window_sec: rate} (หน้าต่างที่ข้อมูลยังไม่ครบหารด้วยเวลาที่มีจริง)
+        """
+        windows = self.windows if windows is None else windows
+        if self._first_time is None:
+            return {window: 0.0 for window in windows}
+        elapsed = max(self._last_time - self._first_time, 1.0)
+        return {window: self.get_tick_count(window) / min(window, elapsed) for window in windows}
+
+    def get_spread_quantiles(self):
+        """Percentile ของ Spread ในหน้าต่างยาว ณ เวลาของ Tick ล่าสุด
+
+        คืนค่า dict {quantile: spread} (ว่างถ้ายังไม่มี Tick)
+        """
+        return self.spread_quantiles.quantiles()
+
+    def on_ticks(self, times, bids, asks, counts=None):
+        """คำนวณ Tick ทั้งชุดแบบ vectorized (เช่น Tick ที่บันทึกไว้ทั้งวัน)
+        
+        times = เวลาของแต่ละ Tick (วินาที), bids/asks = ราคา, counts = จำนวน tick ที่ถูกรวม (default 1)
+        คืนค่า dict ของ array (tick_ratio, spread_ratio, avg_spread) ทีละ Tick เหมือน on_tick()
+        และสถานะหลังจบเหมือนเรียก on_tick() ครบทุก Tick จึงเรียก on_tick() ต่อแบบ live ได้เลย
+        tick_ratio ได้ค่าเท่ากันทุกบิต, avg_spread ต่างได้แค่ระดับ rounding ของ float
+        """
+        times = np.maximum.accumulate(np.asarray(times, dtype=np.float64))
+        bids = np.asarray(bids, dtype=np.float64)
+        asks = np.asarray(asks, dtype=np.float64)
+        counts = (np.ones(len(times), dtype=np.int64) if counts is None
+                  else np.asarray(counts, dtype=np.int64))
+        n = len(times)
+        
+        if self._first_time is not None or n == 0:
+            # มีสถานะเดิมอยู่แล้ว: ต่อทีละ Tick (ได้ผลเหมือนกัน แค่ช้ากว่า)
+            results = [self.on_tick(bid, ask, count, now) for now, bid, ask, count in
+                       zip(times.tolist(), bids.tolist(), asks.tolist(), counts.tolist())]
+            return {key: np.array([r[key] for r in results], dtype=np.float64)
+                    for key in ("tick_ratio", "spread_ratio", "avg_spread")}
+        
+        spreads = asks - bids
+        cum_counts = np.concatenate(([0], np.cumsum(counts)))
+        cum_spreads = np.concatenate(([0.0], np.cumsum(spreads)))
+        
+        # --- Tick Density: ถัง 100ms (เริ่มนับเวลาใหม่หลังช่วงที่ไม่มี Tick นานเกินวงแหวน) ---
+        positions = times / self.bucket_width
+        tick_ids = np.floor(positions).astype(np.int64)
+        restart = np.empty(n, dtype=bool)
+        restart[0] = True
+        np.greater_equal(np.diff(tick_ids), self.ring_size, out=restart[1:])
+        first_time = times[np.maximum.accumulate(np.where(restart, np.arange(n), 0))]
+        elapsed = np.maximum(times - first_time, 1.0)
+        short_rate = (self._window_counts(tick_ids, positions, cum_counts, self.short_span)
+                      / np.minimum(self.window_short, elapsed))
+        long_rate = (self._window_counts(tick_ids, positions, cum_counts, self.long_span)
+                     / np.minimum(self.window_long, elapsed))
+        
+        # --- Spread: ถัง 1 วินาที ---
+        long_ids = np.floor(times / self.long_width).astype(np.int64)
+        long_start = self._window_start(long_ids, self.long_buckets - 1)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            tick_ratio = np.where(long_rate > 0, short_rate / long_rate, 0.0)
+            
+            spread_avg = (cum_spreads[1:] - cum_spreads[long_start]) / (np.arange(1, n + 1) - long_start)
+            spread_ratio = np.where(spread_avg > 0, spreads / spread_avg, 1.0)
+        
+        # --- สถานะหลังจบ (ค่าสะสมของทุกถังในวงแหวน + ถัง Spread ที่ยังอยู่ในหน้าต่าง) ---
+        size = self.ring_size
+        last = int(tick_ids[-1])
+        ring_ids = np.arange(last - size + 1, last + 1)
+        tick_cum = np.empty(size, dtype=np.int64)
+        tick_cum[ring_ids % size] = cum_counts[np.searchsorted(tick_ids, ring_ids, 'right')]
+        self.tick_cum = array('q', tick_cum.tobytes())
+        self.tick_total = int(cum_counts[-1])
+        self._last_bucket = last
+        self._first_time = float(first_time[-1])
+        
+        tail = slice(long_start[-1], n)
+        ids, first = np.unique(long_ids[tail], return_index=True)
+        spread_counts = np.diff(np.append(first, n - long_start[-1]))
+        spread_sums = np.add.reduceat(spreads[tail], first)
+        self.spread_buckets = deque([int(i), int(k), float(v)] for i, k, v in
+                                    zip(ids, spread_counts, spread_sums))
+        self.spread_count = int(spread_counts.sum())
+        self.spread_sum = math.fsum(spread_sums.tolist())
+        self._spread_comp = 0.0
+        self._evictions = 0
+        self._last_time = float(times[-1])
+        
+        # P² ทำทีละค่า: ใส่เฉพาะ Tick ตั้งแต่ต้นครึ่งหน้าต่างก่อนหน้า (สถานะเท่ากับ sketch ของ on_tick())
+        half = self.spread_quantiles.window / 2.0
+        generations = np.floor(times / half).astype(np.int64)
+        start = np.searchsorted(generations, generations[-1] - 1)
+        add_quantile = self.spread_quantiles.add
+        for now, spread in zip(times[start:].tolist(), spreads[start:].tolist()):
+            add_quantile(spread, now)
+        
+        self.current_tick_ratio = float(tick_ratio[-1])
+        self.current_spread_avg = float(spread_avg[-1])
+        self.current_spread_ratio = float(spread_ratio[-1])
+        
+        return {
+            "tick_ratio": tick_ratio,
+            "spread_ratio": spread_ratio,
+            "avg_spread": spread_avg
+        }
+
+    @classmethod
+    def _window_counts(cls, ids, positions, cum_counts, span):
+        # _window_count() ของทุก Tick: ค่าสะสมก่อนหน้าต่าง = cum_counts ณ Tick แรกในหน้าต่าง
+        start = cls._window_start(ids, span)
+        edge_end = cls._window_start(ids, span - 1)
+        count = (cum_counts[1:] - cum_counts[start]).astype(np.float64)
+        edge = cum_counts[edge_end] - cum_counts[start]
+        return np.where(edge > 0, count - edge * (positions - ids), count)
+
+    @staticmethod
+    def _window_start(ids, span):
+        # index ของ Tick แรกที่ bucket_id >= bucket_id ของแต่ละ Tick - span (ids เรียงแล้ว)
+        # ค้นหาระดับถังแทนระดับ Tick: จำนวนถังน้อยกว่าจำนวน Tick มาก
+        new_bucket = np.empty(len(ids), dtype=bool)
+        new_bucket[0] = True
+        np.not_equal(ids[1:], ids[:-1], out=new_bucket[1:])
+        starts = np.flatnonzero(new_bucket)
+        bucket_ids = ids[starts]
+        first = np.searchsorted(bucket_ids, bucket_ids - span, 'left')
+        return starts[first][np.cumsum(new_bucket) - 1]
+
     def get_status(self):
         return {
             "tick_ratio": round(self.current_tick_ratio, 2),
             "spread_avg": f"{self.current_spread_avg:.5f}",
             "spread_ratio": round(self.current_spread_ratio, 2)
-        }
\ No newline at end of file
+        }
@@ -0,0 +1,165 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+FlashEASuite V2 - Tick Replay Tool
+Replay a recorded tick journal into the Brain
+
+Targets:
+    zmq        publish to a running Brain's SUB port (default 7777)
+    ingestion  run an in-process Strategy Engine and feed its ingestion
+               queue directly (reports the engine's queue depth)
+
+Examples (from 02_Brain/):
+    python replay.py --speed 1                       # original pacing
+    python replay.py --speed 10 --symbols XAUUSD     # 10x, one symbol
+    python replay.py --speed 0 --target ingestion    # as fast as possible
+    python replay.py --start 2025-12-04T09:00 --end 2025-12-04T09:30
+"""
+
+import argparse
+import contextlib
+import io
+import sys
+import threading
+import time
+from datetime import datetime, timezone
+from typing import Optional
+
+import config
+from core.log import setup_logging, shutdown_logging
+from core.mailbox import ConflatingMailbox
+from core.queues import BoundedQueue, SYMBOL_KEY
+from core.replay import (IngestionReplaySink, ReplaySample, TickReplayer,
+                         ZmqReplaySink, read_journal)
+from core.sockets import load_curve_keys
+from core.strategy import create_strategy_engine_threaded
+from core.tick_store import TickStore
+
+
+def parse_time(value: Optional[str]) -> Optional[int]:
+    """Parse epoch milliseconds or an ISO time (UTC unless it has an offset)."""
+    if value is None:
+        return None
+    if value.isdigit():
+        return int(value)
+    moment = datetime.fromisoformat(value)
+    if moment.tzinfo is None:
+        moment = moment.replace(tzinfo=timezone.utc)
+    return int(moment.timestamp() * 1000)
+
+
+def print_sample(sample: ReplaySample, out=sys.stdout) -> None:
+    depth = (f"queue {sample.queue_size:>6} (high-water {sample.queue_high_water})"
+             if sample.queue_size >= 0 else "queue n/a")
+    print(f"⏱️ {sample.elapsed:8.1f}s  sent {sample.sent:>10,}  "
+          f"{sample.rate:>10,.0f} ticks/s  {depth}", file=out)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="FlashEASuite V2 - Tick Replay")
+    parser.add_argument("--journal-dir", default=config.JOURNAL_DIR,
+                        help=f"journal directory (default: {config.JOURNAL_DIR})")
+    parser.add_argument("--prefix", default=config.JOURNAL_PREFIX,
+                        help=f"segment prefix (default: {config.JOURNAL_PREFIX})")
+    parser.add_argument("--speed", type=float, default=1.0,
+                        help="1 = original pacing, N = N x faster, 0 = as fast as possible")
+    parser.add_argument("--target", choices=("zmq", "ingestion"), default="zmq",
+                        help="where to send ticks (default: zmq)")
+    parser.add_argument("--address", default="tcp://127.0.0.1:7777",
+                        help="Brain SUB address for --target zmq")
+    parser.add_argument("--pub-address", default="tcp://127.0.0.1:7778",
+                        help="policy PUB address of the in-process engine (--target ingestion)")
+    parser.add_argument("--symbols", nargs="+", help="only replay these symbols")
+    parser.add_argument("--start", help="first Feeder time (epoch ms or ISO, UTC)")
+    parser.add_argument("--end", help="end Feeder time, exclusive (epoch ms or ISO, UTC)")
+    parser.add_argument("--report-interval", type=float, default=1.0,
+                        help="seconds between progress lines (default: 1)")
+    parser.add_argument("--verbose", action="store_true",
+                        help="show the in-process engine's console output")
+    args = parser.parse_args()
+
+    frames = read_journal(args.journal_dir, args.prefix, args.symbols,
+                          parse_time(args.start), parse_time(args.end))
+    speed = "max" if args.speed == 0 else f"{args.speed:g}x"
+
+    print("=" * 70)
+    print(f"🔁 REPLAY: {args.journal_dir}/{args.prefix}-* -> {args.target} at {speed}")
+    print("=" * 70)
+
+    out = sys.stdout
+    engine = None
+    shutdown_event = threading.Event()
+    queue_stats = None
+
+    if args.target == "zmq":
+        curve = load_curve_keys(config.CURVE_KEYS_DIR) if config.CURVE_ENABLED else None
+        sink = ZmqReplaySink(args.address, curve=curve)
+    else:
+        tick_store = TickStore(capacity=config.TICK_RING_CAPACITY)
+        if config.INGESTION_QUEUE_MODE == "mailbox":
+            ingestion_queue = ConflatingMailbox(name='Ingestion')
+        else:
+            ingestion_queue = BoundedQueue(config.INGESTION_QUEUE_SIZE,
+                                           config.INGESTION_QUEUE_POLICY, name='Ingestion',
+                                           key=SYMBOL_KEY)
+        engine = create_strategy_engine_threaded(
+            ingestion_queue=ingestion_queue,
+            signal_queue=BoundedQueue(config.SIGNAL_QUEUE_SIZE, config.SIGNAL_QUEUE_POLICY,
+                                      name='Signal'),
+            feedback_queue=BoundedQueue(config.FEEDBACK_QUEUE_SIZE, config.FEEDBACK_QUEUE_POLICY,
+                                        name='Feedback'),
+            shutdown_event=shutdown_event,
+            zmq_pub_address=args.pub_address,
+            tick_store=tick_store,
+            grid_symbols=config.SUPPORTED_SYMBOLS,
+            policy_encoding=config.POLICY_ENCODING
+        )
+        sink = IngestionReplaySink(ingestion_queue, tick_store)
+        queue_stats = ingestion_queue.get_stats
+
+    quiet = contextlib.redirect_stdout(io.StringIO()) if not args.verbose \
+        else contextlib.nullcontext()
+    if args.verbose:
+        setup_logging(config.LOG_LEVEL, console_format=config.LOG_FORMAT,
+                      rate_limit_seconds=config.LOG_RATE_LIMIT_SECONDS)
+
+    with quiet:
+        if engine is not None:
+            engine.start()
+            time.sleep(1.5)  # Engine startup delay
+
+        replayer = TickReplayer(frames, sink, args.speed, args.report_interval,
+                                queue_stats, lambda sample: print_sample(sample, out))
+        try:
+            report = replayer.run()
+        except KeyboardInterrupt:
+            report = None
+            print("\n⚠️ Replay interrupted", file=out)
+        finally:
+            sink.close()
+            if engine is not None:
+                time.sleep(0.5)  # Let the engine drain
+                shutdown_event.set()
+                engine.join(timeout=3.0)
+            if args.verbose:
+                shutdown_logging()
+
+    if report is None:
+        return
+    if report.sent == 0:
+        print("❌ No frames matched (check --journal-dir, --symbols, --start/--end)")
+        return
+
+    print("-" * 70)
+    print(f"✅ Replayed {report.sent:,} frames in {report.wall_seconds:.2f}s "
+          f"({report.ticks_per_second:,.0f} ticks/s)")
+    print(f"   Recorded span {report.recorded_seconds:.2f}s -> "
+          f"effective speed {report.effective_speed:.1f}x")
+    if engine is not None:
+        stats = sink.decoder.get_stats()
+        print(f"   Engine processed {engine.tick_count:,} ticks "
+              f"({engine.policy_count} policies), decode errors {stats['errors']}")
+
+
+if __name__ == "__main__":
+    main()
@@ -20,6 +20,10 @@ import random
 from datetime import datetime
 from typing import List, Dict, Any
 
+import config
+from core.sockets import apply_curve_client, load_curve_keys
+from core.strategy.policy import POLICY_TOPIC_PREFIX, decode_policy
+
 
 class FeedbackLoopTester:
     """
@@ -39,6 +43,9 @@ class FeedbackLoopTester:
         # SUB socket - รับ policy จาก Brain (port 7778)
         self.sub_socket = None
         
+        # Curve client keys (same as the Trader when the Brain uses CurveZMQ)
+        self.curve = load_curve_keys(config.CURVE_KEYS_DIR) if config.CURVE_ENABLED else None
+        
         # Test data
         self.test_ticket = 16373000
         self.message_count = 0
@@ -60,14 +67,18 @@ class FeedbackLoopTester:
             # 1. PUSH socket (ส่ง trade results)
             print("\n[1/2] Setting up PUSH socket (Trade Results → Brain)...")
             self.push_socket = self.context.socket(zmq.PUSH)
+            if self.curve is not None:
+                apply_curve_client(self.push_socket, self.curve)
             self.push_socket.connect("tcp://127.0.0.1:7779")
             print("   ✅ Connected to tcp://127.0.0.1:7779")
             
             # 2. SUB socket (รับ policy updates)
             print("\n[2/2] Setting up SUB socket (Brain → Policy)...")
             self.sub_socket = self.context.socket(zmq.SUB)
+            if self.curve is not None:
+                apply_curve_client(self.sub_socket, self.curve)
             self.sub_socket.connect("tcp://127.0.0.1:7778")
-            self.sub_socket.setsockopt_string(zmq.SUBSCRIBE, "")  # Subscribe to all
+            self.sub_socket.setsockopt(zmq.SUBSCRIBE, POLICY_TOPIC_PREFIX)  # All symbols' policies
             self.sub_socket.setsockopt(zmq.RCVTIMEO, 1000)  # 1 second timeout
             print("   ✅ Connected to tcp://127.0.0.1:7778")
             
@@ -147,8 +158,10 @@ class FeedbackLoopTester:
         
         while time.time() - start_time < duration:
             try:
-                raw_data = self.sub_socket.recv()
-                policy = msgpack.unpackb(raw_data, raw=False)
+                topic, raw_data = self.sub_socket.recv_multipart()
+                policy = decode_policy(raw_data)  # Compact or verbose
+                if policy.get('type') == 'KEEPALIVE':
+                    continue  # Policy unchanged since the last one
                 
                 policy_count += 1
                 
@@ -106,12 +106,29 @@ def test_file_structure():
         ],
         'Core Modules': [
             'core/__init__.py',
+            'core/async_brain.py',
             'core/execution_listener.py',
             'core/ingestion.py',
+            'core/journal.py',
+            'core/latency.py',
+            'core/links.py',
+            'core/log.py',
+            'core/mailbox.py',
+            'core/quantile_sketch.py',
+            'core/queues.py',
+            'core/reactor.py',
+            'core/replay.py',
+            'core/shm_ring.py',
+            'core/spsc_ring.py',
+            'core/sockets.py',
+            'core/tick_codec.py',
+            'core/tick_store.py',
+            'core/timer_wheel.py',
         ],
         'Main Files': [
             'main.py',
             'config.py',
+            'replay.py',
         ]
     }
     